@@ -0,0 +1,92 @@
+"""Round trips and latency of a request handler that gathers many independent async `@cached` lookups.
+
+The backend adds a fixed delay to every call (like a network round trip), `mget` and pipelines cost one delay
+for the whole batch. Compares plain `@cached` with `@cached(batch_window=0)`.
+
+Usage:
+    PYTHONPATH=. python benchmarks/async_batch_window.py [--lookups 50] [--rtt-ms 1.0] [--requests 20]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Optional
+
+from py_cachify import MemoryCache, init_cachify
+
+
+class _Pipeline:
+    def __init__(self, backend: 'SlowBackend') -> None:
+        self._backend = backend
+        self._commands: list[tuple[str, Any, Optional[int]]] = []
+
+    def set(self, name: str, value: Any, *, ex: Optional[int] = None) -> '_Pipeline':
+        self._commands.append((name, value, ex))
+        return self
+
+    async def execute(self) -> list[Any]:
+        await self._backend.round_trip()
+        return [self._backend.cache.set(name, value, ex=ex) for name, value, ex in self._commands]
+
+
+class SlowBackend:
+    def __init__(self, rtt: float) -> None:
+        self.cache = MemoryCache()
+        self.rtt = rtt
+        self.round_trips = 0
+
+    async def round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    async def get(self, name: str) -> Any:
+        await self.round_trip()
+        return self.cache.get(name)
+
+    async def mget(self, names: list[str]) -> list[Any]:
+        await self.round_trip()
+        return self.cache.mget(names)
+
+    async def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Any:
+        await self.round_trip()
+        return self.cache.set(name, value, ex=ex, nx=nx)
+
+    async def delete(self, *names: str) -> Any:
+        await self.round_trip()
+        return self.cache.delete(*names)
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self)
+
+
+async def handler_latency(batch_window: Optional[float], lookups: int, rtt: float, requests: int) -> tuple[float, int]:
+    backend = SlowBackend(rtt)
+    instance = init_cachify(sync_client=MemoryCache(), async_client=backend, is_global=False)
+
+    @instance.cached(key='item-{x}', batch_window=batch_window)
+    async def get_item(x: int) -> int:
+        return x
+
+    _ = await asyncio.gather(*(get_item(x) for x in range(lookups)))  # warm up the cache
+    backend.round_trips = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        _ = await asyncio.gather(*(get_item(x) for x in range(lookups)))
+    return (time.perf_counter() - started) / requests, backend.round_trips // requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument('--lookups', type=int, default=50)
+    _ = parser.add_argument('--rtt-ms', type=float, default=1.0)
+    _ = parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{"mode":<20}{"handler latency":>18}{"round trips":>14}')
+    for name, window in (('@cached', None), ('batch_window=0', 0.0)):
+        latency, trips = asyncio.run(handler_latency(window, args.lookups, args.rtt_ms / 1000, args.requests))
+        print(f'{name:<20}{latency * 1e3:>16.2f}ms{trips:>14}')
+
+
+if __name__ == '__main__':
+    main()
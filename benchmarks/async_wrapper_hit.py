@@ -0,0 +1,72 @@
+"""Per-hit cost of the async in-memory adapter.
+
+Compares `AsyncWrapper` with the previous design that wrapped every call in a shared `asyncio.Lock`,
+both for a raw `get` and for a full `@cached` hit.
+
+Usage:
+    PYTHONPATH=. python benchmarks/async_wrapper_hit.py [--ops 200000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Optional, Union
+
+from py_cachify import Cachify, MemoryCache, init_cachify
+from py_cachify._backend._clients import AsyncWrapper
+
+
+class LockedAsyncWrapper:
+    def __init__(self, cache: MemoryCache) -> None:
+        self._cache = cache
+        self._lock = asyncio.Lock()
+
+    async def get(self, name: str) -> Optional[Any]:
+        async with self._lock:
+            return self._cache.get(name)
+
+    async def delete(self, *names: str) -> None:
+        async with self._lock:
+            self._cache.delete(*names)
+
+    async def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Optional[bool]:
+        async with self._lock:
+            return self._cache.set(name, value, ex, nx)
+
+
+async def raw_get(client: Any, ops: int) -> float:
+    await client.set('key', b'value')
+    started = time.perf_counter()
+    for _ in range(ops):
+        _ = await client.get('key')
+    return (time.perf_counter() - started) / ops
+
+
+async def cached_hit(client: Any, ops: int) -> float:
+    instance: Cachify = init_cachify(sync_client=MemoryCache(), async_client=client, is_global=False)
+
+    @instance.cached(key='hit-{x}')
+    async def func(x: int) -> int:
+        return x
+
+    _ = await func(1)
+    started = time.perf_counter()
+    for _ in range(ops):
+        _ = await func(1)
+    return (time.perf_counter() - started) / ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument('--ops', type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f'{"adapter":<22}{"raw get":>12}{"@cached hit":>14}')
+    for name, adapter in (('asyncio.Lock (before)', LockedAsyncWrapper), ('AsyncWrapper', AsyncWrapper)):
+        raw = asyncio.run(raw_get(adapter(MemoryCache()), args.ops))
+        hit = asyncio.run(cached_hit(adapter(MemoryCache()), args.ops))
+        print(f'{name:<22}{raw * 1e9:>10.0f}ns{hit * 1e9:>12.0f}ns')
+
+
+if __name__ == '__main__':
+    main()
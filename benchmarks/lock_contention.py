@@ -0,0 +1,82 @@
+"""Acquisition attempts (`SET NX` calls) and total time of many workers taking turns on one lock.
+
+Every worker uses a Cachify instance of its own, like a separate process without a wake-up transport, so waiters
+only retry on their wait strategy. The backend adds a fixed delay to every call (like a network round trip).
+
+Usage:
+    PYTHONPATH=. python benchmarks/lock_contention.py [--workers 500] [--hold-ms 2.0] [--rtt-ms 0.5]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Optional
+
+from py_cachify import (
+    AdaptiveWait,
+    DecorrelatedJitterWait,
+    ExponentialJitterWait,
+    FixedWait,
+    MemoryCache,
+    WaitStrategy,
+    init_cachify,
+)
+
+
+class SlowBackend:
+    def __init__(self, rtt: float) -> None:
+        self.cache = MemoryCache()
+        self.rtt = rtt
+        self.set_nx_calls = 0
+
+    async def get(self, name: str) -> Any:
+        await asyncio.sleep(self.rtt)
+        return self.cache.get(name)
+
+    async def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Any:
+        self.set_nx_calls += nx
+        await asyncio.sleep(self.rtt)
+        return self.cache.set(name, value, ex=ex, nx=nx)
+
+    async def delete(self, *names: str) -> Any:
+        await asyncio.sleep(self.rtt)
+        return self.cache.delete(*names)
+
+
+async def contend(strategy: WaitStrategy, workers: int, hold: float, rtt: float) -> tuple[float, int]:
+    backend = SlowBackend(rtt)
+    instances = [
+        init_cachify(sync_client=MemoryCache(), async_client=backend, lock_wait_strategy=strategy, is_global=False)
+        for _ in range(workers)
+    ]
+
+    async def work(idx: int) -> None:
+        async with instances[idx].lock(key='job', nowait=False, timeout=600):
+            await asyncio.sleep(hold)
+
+    started = time.perf_counter()
+    _ = await asyncio.gather(*(work(idx) for idx in range(workers)))
+    return time.perf_counter() - started, backend.set_nx_calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument('--workers', type=int, default=500)
+    _ = parser.add_argument('--hold-ms', type=float, default=2.0)
+    _ = parser.add_argument('--rtt-ms', type=float, default=0.5)
+    args = parser.parse_args()
+
+    strategies: list[tuple[str, WaitStrategy]] = [
+        ('FixedWait(0.1)', FixedWait(0.1)),
+        ('ExponentialJitterWait', ExponentialJitterWait()),
+        ('DecorrelatedJitterWait', DecorrelatedJitterWait()),
+        ('AdaptiveWait', AdaptiveWait()),
+    ]
+    print(f'{"strategy":<26}{"total":>10}{"SET NX":>10}{"SET NX/s":>12}')
+    for name, strategy in strategies:
+        elapsed, calls = asyncio.run(contend(strategy, args.workers, args.hold_ms / 1000, args.rtt_ms / 1000))
+        print(f'{name:<26}{elapsed:>9.2f}s{calls:>10}{calls / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Contention benchmark for the in-memory cache.
+
+Compares the lock-striped `MemoryCache` with a single stripe (one lock for every operation)
+and with the previous design (an RLock on the NX path only, unguarded dict operations otherwise).
+
+Usage:
+    PYTHONPATH=. python benchmarks/memory_cache_contention.py [--ops 200000] [--threads 1 2 4 8]
+
+On a GIL build threads mostly measure lock overhead, on a free-threaded build (3.13t/3.14t)
+they also show how throughput scales with the number of stripes.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+
+from py_cachify import MemoryCache
+
+
+class LegacyMemoryCache:
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[Any, Union[float, None]]] = {}
+        self._lock = threading.RLock()
+
+    def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Optional[bool]:
+        if not nx:
+            self._cache[name] = value, ex and time.time() + ex
+            return None
+
+        with self._lock:
+            existing = self._cache.get(name)
+            if existing is not None:
+                _, exp_at = existing
+                if exp_at is None or exp_at > time.time():
+                    return False
+
+            self._cache[name] = value, ex and time.time() + ex
+            return True
+
+    def get(self, name: str) -> Optional[Any]:
+        val, exp_at = self._cache.get(name, (None, None))
+        if not exp_at or exp_at > time.time():
+            return val
+
+        self.delete(name)
+        return None
+
+    def delete(self, *names: str) -> None:
+        for key in names:
+            self._cache.pop(key, None)
+
+
+def read_mostly(cache: Any, worker: int, ops: int) -> None:
+    for i in range(ops):
+        key = f'key-{i % 1024}'
+        if i % 10 == 0:
+            cache.set(key, b'payload', ex=60)
+        else:
+            _ = cache.get(key)
+
+
+def lock_churn(cache: Any, worker: int, ops: int) -> None:
+    for i in range(ops // 2):
+        key = f'lock-{worker}-{i % 64}'
+        if cache.set(key, b'1', ex=60, nx=True):
+            cache.delete(key)
+
+
+def run(factory: Callable[[], Any], workload: Callable[[Any, int, int], None], threads: int, ops: int) -> float:
+    cache = factory()
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(idx: int) -> None:
+        _ = barrier.wait()
+        workload(cache, idx, per_thread)
+
+    pool = [threading.Thread(target=worker, args=(idx,)) for idx in range(threads)]
+    for thread in pool:
+        thread.start()
+
+    _ = barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument('--ops', type=int, default=200_000)
+    _ = parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}, {args.ops} ops per run')
+
+    implementations: dict[str, Callable[[], Any]] = {
+        'legacy (nx lock only)': LegacyMemoryCache,
+        'MemoryCache(stripes=1)': lambda: MemoryCache(stripes=1),
+        'MemoryCache(stripes=16)': lambda: MemoryCache(stripes=16),
+    }
+    for workload in (read_mostly, lock_churn):
+        print(f'\n{workload.__name__} (ops/s)')
+        print(f'{"implementation":<26}' + ''.join(f'{f"{n} thr":>12}' for n in args.threads))
+        for name, factory in implementations.items():
+            results = [run(factory, workload, threads, args.ops) for threads in args.threads]
+            print(f'{name:<26}' + ''.join(f'{result:>12,.0f}' for result in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Per-hit cost of `@cached` on the in-memory backend with and without the object store mode.
+
+The cached value is a list of dicts, so the pickling mode pays a full `pickle.loads` of the object graph
+on every hit, while `store_objects=True` returns the cached object (or its copy, with a copier).
+
+Usage:
+    PYTHONPATH=. python benchmarks/object_store_hit.py [--ops 20000] [--rows 1000]
+"""
+
+import argparse
+import copy
+import time
+from typing import Any
+
+from py_cachify import MemoryCache, init_cachify
+
+
+def cached_hit(cache: MemoryCache, ops: int, rows: int) -> float:
+    instance = init_cachify(sync_client=cache, is_global=False)
+
+    @instance.cached(key='rows-{n}')
+    def load(n: int) -> list[dict[str, Any]]:
+        return [{'id': i, 'name': f'row-{i}', 'tags': ['a', 'b']} for i in range(n)]
+
+    _ = load(rows)
+    started = time.perf_counter()
+    for _ in range(ops):
+        _ = load(rows)
+    return (time.perf_counter() - started) / ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument('--ops', type=int, default=20_000)
+    _ = parser.add_argument('--rows', type=int, default=1000)
+    args = parser.parse_args()
+
+    modes = (
+        ('pickle (default)', MemoryCache()),
+        ('store_objects', MemoryCache(store_objects=True)),
+        ('store_objects+deepcopy', MemoryCache(store_objects=True, copier=copy.deepcopy)),
+    )
+    print(f'{"mode":<26}{"@cached hit":>14}')
+    for name, cache in modes:
+        ops = args.ops if cache.copier is None else max(1, args.ops // 100)
+        print(f'{name:<26}{cached_hit(cache, ops, args.rows) * 1e6:>12.1f}us')
+
+
+if __name__ == '__main__':
+    main()
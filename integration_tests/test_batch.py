@@ -0,0 +1,34 @@
+from time import sleep
+
+import pytest
+
+from py_cachify._backend._lib import Cachify
+
+
+def test_sync_batch_methods_pipeline_to_redis(cachify_local_redis_second: Cachify) -> None:
+    cachify_local_redis_second.set_many({'batch-a': 1, 'batch-b': [2], 'batch-short': 3}, ttl={'batch-short': 1})
+
+    assert cachify_local_redis_second.get_many(['batch-a', 'batch-b', 'batch-short', 'batch-missing']) == {
+        'batch-a': 1,
+        'batch-b': [2],
+        'batch-short': 3,
+    }
+
+    sleep(1.5)
+    assert cachify_local_redis_second.get_many(['batch-a', 'batch-short']) == {'batch-a': 1}
+
+    cachify_local_redis_second.delete_many(['batch-a', 'batch-b'])
+    assert cachify_local_redis_second.get_many(['batch-a', 'batch-b']) == {}
+
+
+@pytest.mark.asyncio
+async def test_async_batch_methods_pipeline_to_redis(cachify_local_redis_second: Cachify) -> None:
+    await cachify_local_redis_second.a_set_many({'batch-async-a': 1, 'batch-async-b': {'x': 2}}, ttl=10)
+
+    assert await cachify_local_redis_second.a_get_many(['batch-async-a', 'batch-async-b', 'batch-async-c']) == {
+        'batch-async-a': 1,
+        'batch-async-b': {'x': 2},
+    }
+
+    await cachify_local_redis_second.a_delete_many(['batch-async-a', 'batch-async-b'])
+    assert await cachify_local_redis_second.a_get_many(['batch-async-a', 'batch-async-b']) == {}
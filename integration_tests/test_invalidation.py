@@ -0,0 +1,38 @@
+from time import monotonic, sleep
+
+import redis
+
+from py_cachify import InvalidationBus, RedisPubSubTransport, TieredClient, init_cachify
+
+
+def test_reset_evicts_l1_of_other_nodes_over_redis_pubsub() -> None:
+    def node() -> TieredClient:
+        client = redis.Redis.from_url(url='redis://localhost:6379/4')  # pyright: ignore[reportUnknownMemberType]
+        bus = InvalidationBus(RedisPubSubTransport(client, channel='pyc-test-invalidate', poll_interval=0.05))
+        return TieredClient(client, local_ttl=60, bus=bus)
+
+    first, second = node(), node()
+    first_cache, second_cache = (init_cachify(sync_client=tier, is_global=False) for tier in (first, second))
+    sleep(0.2)  # let both listeners subscribe
+
+    @first_cache.cached(key='inv-{x}')
+    def first_func(x: int) -> int:
+        return x
+
+    @second_cache.cached(key='inv-{x}')
+    def second_func(x: int) -> int:
+        return x
+
+    assert first_func(1) == 1
+    assert second_func(1) == 1
+    assert second.local.get('PYC-inv-1-cached') is not None
+
+    first_func.reset(1)
+    deadline = monotonic() + 2
+    while second.local.get('PYC-inv-1-cached') is not None and monotonic() < deadline:
+        sleep(0.01)
+
+    assert second.local.get('PYC-inv-1-cached') is None
+    for tier in (first, second):
+        assert tier.bus is not None
+        tier.bus.close()
@@ -0,0 +1,75 @@
+# pyright: reportPrivateUsage=false
+from time import sleep
+
+import pytest
+
+from py_cachify import Cachify, lock
+from py_cachify._backend._lib import get_cachify_client
+
+
+def test_redis_release_only_deletes_the_owners_lock() -> None:
+    client = get_cachify_client()
+
+    assert client.try_acquire_lock('ownership-sync', ttl=5, token='owner')
+    assert not client.release_lock('ownership-sync', token='other')
+    assert not client.extend_lock('ownership-sync', token='other', ttl=60)
+    assert client.extend_lock('ownership-sync', token='owner', ttl=60)
+    assert client.release_lock('ownership-sync', token='owner')
+    assert client.get('ownership-sync') is None
+
+
+@pytest.mark.asyncio
+async def test_redis_async_release_only_deletes_the_owners_lock() -> None:
+    client = get_cachify_client()
+
+    assert await client.a_try_acquire_lock('ownership-async', ttl=5, token='owner')
+    assert not await client.a_release_lock('ownership-async', token='other')
+    assert await client.a_extend_lock('ownership-async', token='owner', ttl=60)
+    assert await client.a_release_lock('ownership-async', token='owner')
+    assert await client.a_get('ownership-async') is None
+
+
+def test_redis_watchdog_keeps_a_short_lock_alive(cachify_local_redis_second: Cachify) -> None:
+    with cachify_local_redis_second.lock(key='ownership-watchdog', exp=1, watchdog=True) as held:
+        sleep(1.5)
+        assert held.is_locked()
+
+    assert not held.is_locked()
+
+
+def test_redis_expired_holder_keeps_its_hands_off_the_next_holder() -> None:
+    first = lock(key='ownership-expired', exp=1)
+    _ = first.__enter__()
+    sleep(1.2)
+
+    with lock(key='ownership-expired') as second:
+        first.release()
+        assert second.is_locked()
+
+
+def test_redis_fencing_tokens_increase_with_every_acquisition(cachify_local_redis_second: Cachify) -> None:
+    tokens = []
+    for _ in range(3):
+        with cachify_local_redis_second.lock(key='ownership-fencing', fencing=True) as held:
+            tokens.append(held.fencing_token)
+
+    assert tokens[1] == tokens[0] + 1 and tokens[2] == tokens[1] + 1  # type: ignore[operator]
+
+
+@pytest.mark.asyncio
+async def test_redis_async_fencing_tokens_increase_with_every_acquisition() -> None:
+    tokens = []
+    for _ in range(2):
+        async with lock(key='ownership-async-fencing', fencing=True) as held:
+            tokens.append(held.fencing_token)
+
+    assert tokens[0] is not None and tokens[1] == tokens[0] + 1
+
+
+def test_redis_reentrant_lock_is_released_by_the_outermost_exit() -> None:
+    with lock(key='ownership-reentrant', reentrant=True) as outer:
+        with lock(key='ownership-reentrant', reentrant=True):
+            pass
+        assert outer.is_locked()
+
+    assert not outer.is_locked()
@@ -1,23 +1,50 @@
 from ._backend._cached import cached as cached
+from ._backend._cached_batch import cached_batch as cached_batch
+from ._backend._clients import MemoryCache as MemoryCache
+from ._backend._compression import LzmaCompressor as LzmaCompressor
+from ._backend._compression import ZlibCompressor as ZlibCompressor
 from ._backend._exceptions import CachifyInitError as CachifyInitError
 from ._backend._exceptions import CachifyLockError as CachifyLockError
 from ._backend._exceptions import CachifyPoolFullError as CachifyPoolFullError
+from ._backend._invalidation import InvalidationBus as InvalidationBus
+from ._backend._invalidation import LocalTransport as LocalTransport
+from ._backend._invalidation import QueueTransport as QueueTransport
+from ._backend._invalidation import RedisPubSubTransport as RedisPubSubTransport
 from ._backend._lib import Cachify as Cachify
 from ._backend._lib import init_cachify as init_cachify
 from ._backend._lock import lock as lock
 from ._backend._lock import once as once
+from ._backend._lock_wakeups import LockWakeups as LockWakeups
 from ._backend._pool import pool as pool
 from ._backend._pool import pooled as pooled
+from ._backend._serializers import JSONSerializer as JSONSerializer
+from ._backend._serializers import OutOfBandPickleSerializer as OutOfBandPickleSerializer
+from ._backend._serializers import PickleSerializer as PickleSerializer
+from ._backend._serializers import RawSerializer as RawSerializer
+from ._backend._threaded import ThreadedAsyncClient as ThreadedAsyncClient
+from ._backend._threaded import ThreadedClientStats as ThreadedClientStats
+from ._backend._tiered import AsyncTieredClient as AsyncTieredClient
+from ._backend._tiered import TieredClient as TieredClient
 from ._backend._types._common import AsyncClient as AsyncClient
+from ._backend._types._common import AsyncPipeline as AsyncPipeline
+from ._backend._types._common import Compressor as Compressor
 from ._backend._types._common import Decoder as Decoder
 from ._backend._types._common import Encoder as Encoder
+from ._backend._types._common import InvalidationTransport as InvalidationTransport
+from ._backend._types._common import Serializer as Serializer
 from ._backend._types._common import SyncClient as SyncClient
+from ._backend._types._common import SyncPipeline as SyncPipeline
+from ._backend._types._common import WaitStrategy as WaitStrategy
 from ._backend._types._lock_wrap import AsyncLockWrappedF as AsyncLockWrappedF
 from ._backend._types._lock_wrap import SyncLockWrappedF as SyncLockWrappedF
 from ._backend._types._lock_wrap import WrappedFunctionLock as WrappedFunctionLock
 from ._backend._types._pool_wrap import AsyncPoolWrappedF as AsyncPoolWrappedF
 from ._backend._types._pool_wrap import SyncPoolWrappedF as SyncPoolWrappedF
 from ._backend._types._pool_wrap import WrappedFunctionPool as WrappedFunctionPool
+from ._backend._wait import AdaptiveWait as AdaptiveWait
+from ._backend._wait import DecorrelatedJitterWait as DecorrelatedJitterWait
+from ._backend._wait import ExponentialJitterWait as ExponentialJitterWait
+from ._backend._wait import FixedWait as FixedWait
 
 
 try:
@@ -0,0 +1,116 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
+
+from ._types._common import Serializer
+
+
+if TYPE_CHECKING:
+    from ._lib import CachifyClient
+
+
+class AsyncBatchLoader:
+    """Collects the async reads and writes issued within one batching window into a single multi-get and multi-set.
+
+    DataLoader-style: the first operation of a window schedules a flush on the event loop, with a zero window
+    it runs right after the callbacks that are already ready (the current loop iteration), so lookups started
+    together by `asyncio.gather` end up in one round trip. A loader is only used from the event loop it was made for.
+    """
+
+    def __init__(self, client: 'CachifyClient', window: float) -> None:
+        self._client = client
+        self._window = window
+        self._gets: dict[str, list[tuple[asyncio.Future[Any], Optional[Serializer]]]] = {}
+        self._sets: dict[str, tuple[Any, Optional[int], list[asyncio.Future[None]]]] = {}
+        self._scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def get(self, key: str, serializer: Optional[Serializer]) -> 'asyncio.Future[Any]':
+        fut = asyncio.get_running_loop().create_future()
+        if (pending := self._sets.get(key)) is not None:
+            # read your own writes: the value is not in the backend yet
+            self._resolve(fut, pending[0], serializer)
+            return fut
+
+        self._gets.setdefault(key, []).append((fut, serializer))
+        self._schedule()
+        return fut
+
+    def set(self, key: str, val: Any, ttl: Optional[int], serializer: Optional[Serializer]) -> 'asyncio.Future[None]':
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        payload = self._client._async_encode(val, serializer)  # pyright: ignore[reportPrivateUsage]
+        # the latest write of a key within the window wins, every writer is notified once it is stored
+        waiters = self._sets[key][2] if key in self._sets else []
+        waiters.append(fut)
+        self._sets[key] = payload, ttl, waiters
+        self._schedule()
+        return fut
+
+    def _schedule(self) -> None:
+        if self._scheduled:
+            return
+
+        self._scheduled = True
+        loop = asyncio.get_running_loop()
+        if self._window > 0:
+            _ = loop.call_later(self._window, self._flush)
+        else:
+            _ = loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        gets, sets = self._gets, self._sets
+        self._gets, self._sets, self._scheduled = {}, {}, False
+
+        task = asyncio.get_running_loop().create_task(self._run(gets, sets))
+        # the loop only keeps weak references to tasks, hold on to it until it is done
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        gets: dict[str, list[tuple['asyncio.Future[Any]', Optional[Serializer]]]],
+        sets: dict[str, tuple[Any, Optional[int], list['asyncio.Future[None]']]],
+    ) -> None:
+        if gets:
+            keys = list(gets)
+            try:
+                payloads = await self._client._a_fetch_payloads(keys)  # pyright: ignore[reportPrivateUsage]
+            except Exception as e:
+                for waiters in gets.values():
+                    for fut, _ in waiters:
+                        _set_exception(fut, e)
+            else:
+                for key, payload in zip(keys, payloads):
+                    for fut, serializer in gets[key]:
+                        self._resolve(fut, payload, serializer)
+
+        if sets:
+            try:
+                await self._client._a_store_payloads(  # pyright: ignore[reportPrivateUsage]
+                    [(key, payload, ttl) for key, (payload, ttl, _) in sets.items()]
+                )
+            except Exception as e:
+                for _, _, waiters in sets.values():
+                    for fut in waiters:
+                        _set_exception(fut, e)
+            else:
+                for _, _, waiters in sets.values():
+                    for fut in waiters:
+                        if not fut.done():
+                            fut.set_result(None)
+
+    def _resolve(self, fut: 'asyncio.Future[Any]', payload: Any, serializer: Optional[Serializer]) -> None:
+        if fut.done():
+            # the caller was cancelled meanwhile
+            return
+
+        try:
+            fut.set_result(
+                None if payload is None else self._client._async_decode(payload, serializer)  # pyright: ignore[reportPrivateUsage]
+            )
+        except Exception as e:
+            fut.set_exception(e)
+
+
+def _set_exception(fut: 'asyncio.Future[Any]', exc: BaseException) -> None:
+    if not fut.done():
+        fut.set_exception(exc)
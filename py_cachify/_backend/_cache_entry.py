@@ -0,0 +1,80 @@
+import math
+import struct
+from typing import Any, NamedTuple, Optional
+
+from ._types._common import Serializer
+
+
+class CacheEntry(NamedTuple):
+    """Envelope stored in the backend instead of the bare value when `cached` needs entry metadata.
+
+    A named tuple keeps the pickled envelope small: only the class reference and the field values are stored.
+    """
+
+    value: Any
+    stored_at: float  # unix timestamp of the moment the value was computed and stored
+    delta: float = 0.0  # how long the computation of the value took, in seconds
+    expires_at: Optional[float] = None  # unix timestamp of the hard expiration, None if stored indefinitely
+
+
+_PLAIN = b'\x00'
+_ENTRY = b'\x01'
+_ENTRY_NONE = b'\x02'
+_TAGS = (_PLAIN, _ENTRY, _ENTRY_NONE)
+_HEADER = struct.Struct('<ddd')  # stored_at, delta, expires_at (NaN when None)
+
+
+class FramedEntrySerializer:
+    """Stores CacheEntry envelopes for serializers that can't represent them (anything but pickle).
+
+    The envelope metadata goes into a fixed binary header in front of the inner serializer's payload,
+    values without an envelope are prefixed with a single tag byte.
+
+    Payloads without a tag (stored before the envelope was turned on) are read as plain values.
+    With `frame_writes=False` values are stored as the bare inner payload, while framed payloads
+    (stored before the envelope was turned off) are still read.
+    """
+
+    def __init__(self, inner: Serializer, frame_writes: bool = True) -> None:
+        self.inner = inner
+        self.frame_writes = frame_writes
+
+    def dumps(self, value: Any) -> bytes:
+        if not isinstance(value, CacheEntry):
+            return _PLAIN + self.inner.dumps(value) if self.frame_writes else self.inner.dumps(value)
+
+        header = _HEADER.pack(value.stored_at, value.delta, math.nan if value.expires_at is None else value.expires_at)
+        if value.value is None:
+            return _ENTRY_NONE + header
+        return _ENTRY + header + self.inner.dumps(value.value)
+
+    def loads(self, data: bytes) -> Any:
+        if not self.frame_writes:
+            # bare payloads are the common case here, a frame is only tried once the inner serializer rejects one
+            try:
+                return self.inner.loads(data)
+            except Exception:
+                if data[:1] not in _TAGS:
+                    raise
+            return self._loads_framed(data)
+
+        if data[:1] in _TAGS:
+            try:
+                return self._loads_framed(data)
+            except Exception:
+                # an untagged payload that happens to start with a tag byte, e.g. a small msgpack integer
+                pass
+        return self.inner.loads(data)
+
+    def _loads_framed(self, data: bytes) -> Any:
+        tag = data[:1]
+        if tag == _PLAIN:
+            return self.inner.loads(data[1:])
+        if tag == _ENTRY_NONE and len(data) != 1 + _HEADER.size:
+            raise ValueError('Malformed framed cache entry')
+
+        stored_at, delta, expires_at = _HEADER.unpack_from(data, 1)
+        value = None if tag == _ENTRY_NONE else self.inner.loads(data[1 + _HEADER.size :])
+        return CacheEntry(
+            value=value, stored_at=stored_at, delta=delta, expires_at=None if math.isnan(expires_at) else expires_at
+        )
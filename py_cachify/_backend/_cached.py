@@ -1,13 +1,25 @@
+import asyncio
 import inspect
-from collections.abc import Awaitable
+import math
+import random
+import threading
+import time
+import uuid
+from asyncio import sleep as asleep
+from collections.abc import Awaitable, Coroutine, Hashable
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, wraps
-from typing import Callable, Optional, TypeVar, Union, cast, overload
+from typing import Any, Callable, Literal, Optional, TypeVar, Union, cast, overload
 
 from typing_extensions import ParamSpec
 
-from ._helpers import a_reset, encode_decode_value, get_full_key_from_signature, is_coroutine, reset
+from ._cache_entry import CacheEntry, FramedEntrySerializer
+from ._helpers import KeyTemplate, a_reset, encode_decode_value, is_coroutine, reset
 from ._lib import CachifyClient, get_cachify_client
-from ._types._common import UNSET, Decoder, Encoder, UnsetType
+from ._logger import logger
+from ._serializers import PickleSerializer
+from ._single_flight import AsyncSingleFlight, SingleFlight
+from ._types._common import UNSET, Decoder, Encoder, Serializer, UnsetType
 from ._types._reset_wrap import AsyncResetWrappedF, SyncResetWrappedF, WrappedFunctionReset
 
 
@@ -15,11 +27,29 @@ _R = TypeVar('_R')
 _P = ParamSpec('_P')
 _S = TypeVar('_S')
 
+StampedeMode = Literal['lease']
+_Freshness = Literal['fresh', 'stale', 'expiring']
+
+_LEASE_MIN_POLL_INTERVAL = 0.01
+_REFRESH_MAX_WORKERS = 4
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+_background_tasks: set['asyncio.Task[None]'] = set()
+
 
 def cached(
     key: str,
     ttl: Union[Optional[int], UnsetType] = UNSET,
     enc_dec: Union[tuple[Encoder, Decoder], None] = None,
+    stampede: Optional[StampedeMode] = None,
+    lease_ttl: int = 10,
+    soft_ttl: Optional[int] = None,
+    early_recompute: Optional[float] = None,
+    cache_none: bool = False,
+    none_ttl: Union[Optional[int], UnsetType] = UNSET,
+    serializer: Optional[Serializer] = None,
+    batch_window: Optional[float] = None,
 ) -> WrappedFunctionReset:
     """
     Decorator that caches the result of a function based on the specified key, time-to-live (ttl),
@@ -32,6 +62,27 @@ def cached(
         If None, means indefinitely.
     enc_dec (Union[Tuple[Encoder, Decoder], None], optional): The encoding and decoding functions for the cached value.
         Defaults to None.
+    stampede (Optional[Literal['lease']], optional): Cross-process stampede protection mode.
+        If 'lease', the first process that misses takes a short recompute lease in the backend and
+        the others wait for the value to appear instead of recomputing it. Defaults to None (disabled).
+    lease_ttl (int, optional): The time-to-live in seconds of the recompute lease. Defaults to 10.
+    soft_ttl (Optional[int], optional): The time in seconds after which a cached result is considered stale.
+        Stale results are still returned immediately while a single background refresh recomputes them,
+        `ttl` remains the hard expiration in the backend. Defaults to None (disabled).
+    early_recompute (Optional[float], optional): The beta factor of probabilistic early expiration (XFetch).
+        When set, each read may recompute the result before `ttl` runs out, with a probability growing
+        as the expiration approaches and with how long the computation took. 1.0 is a good default,
+        larger values recompute earlier. Defaults to None (disabled).
+    cache_none (bool, optional): If True, `None` results are cached as well (negative caching),
+        instead of being recomputed on every call. Defaults to False.
+    none_ttl (Union[int, None, UnsetType], optional): The time-to-live for cached `None` results.
+        If UNSET (default), the same ttl as for the other results is used.
+    serializer (Optional[Serializer], optional): The serializer for the cached values of this function.
+        Defaults to None, meaning the serializer of the current cachify client is used.
+    batch_window (Optional[float], optional): Async functions only, enables automatic batching of cache reads
+        and writes: the ones issued within `batch_window` seconds (0 - within the same event loop iteration)
+        by any function using the same window and client are sent as a single multi-get and a single multi-set.
+        Defaults to None (disabled). Setting it on a sync function raises ValueError.
 
     Returns:
     WrappedFunctionReset: Either a synchronous or asynchronous function with reset method attached to it,
@@ -39,15 +90,172 @@ def cached(
         and could be used to reset the cache.
     """
 
-    return _cached_impl(key=key, ttl=ttl, enc_dec=enc_dec, client_provider=get_cachify_client)
+    return _cached_impl(
+        key=key,
+        ttl=ttl,
+        enc_dec=enc_dec,
+        stampede=stampede,
+        lease_ttl=lease_ttl,
+        soft_ttl=soft_ttl,
+        early_recompute=early_recompute,
+        cache_none=cache_none,
+        none_ttl=none_ttl,
+        serializer=serializer,
+        batch_window=batch_window,
+        client_provider=get_cachify_client,
+    )
+
+
+class _RefreshRegistry:
+    """Tracks keys with a background refresh in flight, so a stale entry is refreshed only once at a time."""
+
+    def __init__(self) -> None:
+        self._keys: set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def _claim(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+    def _done(self, key: Hashable) -> None:
+        with self._lock:
+            self._keys.discard(key)
+
+    def submit(self, key: Hashable, refresh: Callable[[], None]) -> None:
+        if not self._claim(key):
+            return
+
+        def _run() -> None:
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning(f'Background refresh of {key} failed: {e}')
+            finally:
+                self._done(key)
+
+        _ = _get_refresh_executor().submit(_run)
+
+    def spawn_task(self, key: Hashable, refresh: Coroutine[Any, Any, None]) -> None:
+        if not self._claim(key):
+            refresh.close()
+            return
+
+        async def _run() -> None:
+            try:
+                await refresh
+            except Exception as e:
+                logger.warning(f'Background refresh of {key} failed: {e}')
+            finally:
+                self._done(key)
+
+        task = asyncio.get_running_loop().create_task(_run())
+        # the loop only keeps weak references to tasks, hold on to it until it is done
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+def _check_freshness(entry: CacheEntry, soft_ttl: Optional[int], early_recompute: Optional[float]) -> _Freshness:
+    now = time.time()
+    if early_recompute is not None and entry.expires_at is not None:
+        # XFetch: recompute early with a probability that grows as the expiration approaches,
+        # scaled by how long the value took to compute (delta) and the beta factor
+        if now - entry.delta * early_recompute * math.log(1.0 - random.random()) >= entry.expires_at:
+            return 'expiring'
+
+    if soft_ttl is not None and now - entry.stored_at >= soft_ttl:
+        return 'stale'
+
+    return 'fresh'
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=_REFRESH_MAX_WORKERS, thread_name_prefix='py-cachify-refresh'
+            )
+        return _refresh_executor
+
+
+def _compute_under_lease(
+    client: CachifyClient,
+    key: str,
+    lease_ttl: int,
+    compute: Callable[[], _S],
+    lookup: Callable[[], Union[_S, UnsetType]],
+) -> _S:
+    lease_key, token = f'{key}-lease', uuid.uuid4().hex
+    poll_interval = _LEASE_MIN_POLL_INTERVAL
+    waited = False
+
+    while not client.try_acquire_lock(key=lease_key, ttl=lease_ttl, token=token):
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max(client.lock_poll_interval, _LEASE_MIN_POLL_INTERVAL))
+        waited = True
+        if not isinstance(val := lookup(), UnsetType):
+            return val
+
+    try:
+        # the previous lease holder could have stored the value right before releasing the lease
+        if waited and not isinstance(val := lookup(), UnsetType):
+            return val
+
+        return compute()
+    finally:
+        # a leader that ran past the lease TTL must not release the lease of the next one
+        _ = client.release_lock(key=lease_key, token=token)
+
+
+async def _a_compute_under_lease(
+    client: CachifyClient,
+    key: str,
+    lease_ttl: int,
+    compute: Callable[[], Awaitable[_S]],
+    lookup: Callable[[], Awaitable[Union[_S, UnsetType]]],
+) -> _S:
+    lease_key, token = f'{key}-lease', uuid.uuid4().hex
+    poll_interval = _LEASE_MIN_POLL_INTERVAL
+    waited = False
+
+    while not await client.a_try_acquire_lock(key=lease_key, ttl=lease_ttl, token=token):
+        await asleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max(client.lock_poll_interval, _LEASE_MIN_POLL_INTERVAL))
+        waited = True
+        if not isinstance(val := await lookup(), UnsetType):
+            return val
+
+    try:
+        if waited and not isinstance(val := await lookup(), UnsetType):
+            return val
+
+        return await compute()
+    finally:
+        _ = await client.a_release_lock(key=lease_key, token=token)
 
 
 def _cached_impl(
     key: str,
     ttl: Union[Optional[int], UnsetType] = UNSET,
     enc_dec: Union[tuple[Encoder, Decoder], None] = None,
+    stampede: Optional[StampedeMode] = None,
+    lease_ttl: int = 10,
+    soft_ttl: Optional[int] = None,
+    early_recompute: Optional[float] = None,
+    cache_none: bool = False,
+    none_ttl: Union[Optional[int], UnsetType] = UNSET,
+    serializer: Optional[Serializer] = None,
+    batch_window: Optional[float] = None,
     client_provider: Callable[[], CachifyClient] = get_cachify_client,
 ) -> WrappedFunctionReset:
+    if stampede not in (None, 'lease'):
+        raise ValueError(f"Unknown stampede mode '{stampede}', expected 'lease' or None")
+    if batch_window is not None and batch_window < 0:
+        raise ValueError('batch_window must be a non-negative number of seconds')
+
     @overload
     def _cached_inner(  # type: ignore[overload-overlap]
         _func: Callable[_P, Awaitable[_R]],
@@ -61,37 +269,130 @@ def _cached_impl(
     def _cached_inner(
         _func: Union[Callable[_P, Awaitable[_R]], Callable[_P, _R]],
     ) -> Union[AsyncResetWrappedF[_P, _R], SyncResetWrappedF[_P, _R]]:
+        if batch_window is not None and not is_coroutine(_func):
+            raise ValueError('batch_window is only supported for async functions')
+
         signature = inspect.signature(_func)
+        key_template = KeyTemplate(key, signature, 'cached')
+        refreshing = _RefreshRegistry()
 
         enc, dec = None, None
         if enc_dec is not None:
             enc, dec = enc_dec
 
-        def _resolve_ttl(client: CachifyClient) -> Optional[int]:
+        def _resolve_ttl(client: CachifyClient, res: _R) -> Optional[int]:
+            if cache_none and res is None and not isinstance(none_ttl, UnsetType):
+                return none_ttl
             if isinstance(ttl, UnsetType):
                 return client.default_cache_ttl
             return ttl
 
+        uses_envelope = soft_ttl is not None or early_recompute is not None or cache_none
+
+        def _serializer_for(client: CachifyClient) -> Serializer:
+            inner = serializer if serializer is not None else client.serializer
+            # pickle round-trips the envelope as is, other serializers need it framed
+            if isinstance(inner, PickleSerializer):
+                return inner
+            # without the envelope values are written bare, but entries framed before it was turned off stay readable
+            return FramedEntrySerializer(inner, frame_writes=uses_envelope)
+
+        def _pack(res: _R, ttl: Optional[int], delta: float) -> Any:
+            val = encode_decode_value(encoder_decoder=enc, val=res)
+            # `None` is only stored with cache_none, and a bare None would be indistinguishable from a miss
+            if soft_ttl is None and early_recompute is None and res is not None:
+                return val
+
+            stored_at = time.time()
+            return CacheEntry(
+                value=val,
+                stored_at=stored_at,
+                delta=delta,
+                expires_at=stored_at + ttl if ttl is not None else None,
+            )
+
+        def _unpack(val: Any) -> tuple[_R, _Freshness]:
+            if not isinstance(val, CacheEntry):
+                return cast(_R, encode_decode_value(encoder_decoder=dec, val=val)), 'fresh'
+
+            return cast(_R, encode_decode_value(encoder_decoder=dec, val=val.value)), _check_freshness(
+                val, soft_ttl=soft_ttl, early_recompute=early_recompute
+            )
+
+        def _lookup(client: CachifyClient, _key: str) -> Union[_R, UnsetType]:
+            if (val := client.get(key=_key, serializer=_serializer_for(client))) is None:
+                return UNSET
+            return _unpack(val)[0]
+
+        def _a_read(client: CachifyClient, _key: str) -> Awaitable[Any]:
+            if batch_window is None:
+                return client.a_get(key=_key, serializer=_serializer_for(client))
+            return client.a_batch_loader(batch_window).get(_key, _serializer_for(client))
+
+        def _a_write(client: CachifyClient, _key: str, val: Any, _ttl: Optional[int]) -> Awaitable[Any]:
+            if batch_window is None:
+                return client.a_set(key=_key, val=val, ttl=_ttl, serializer=_serializer_for(client))
+            return client.a_batch_loader(batch_window).set(_key, val, _ttl, _serializer_for(client))
+
+        async def _a_lookup(client: CachifyClient, _key: str) -> Union[_R, UnsetType]:
+            if (val := await _a_read(client, _key)) is None:
+                return UNSET
+            return _unpack(val)[0]
+
         if is_coroutine(_func):
             _awaitable_func = _func
+            a_flight = AsyncSingleFlight()
+
+            async def _a_compute(client: CachifyClient, _key: str, call: Callable[[], Awaitable[_R]]) -> _R:
+                started_at = time.perf_counter()
+                res = await call()
+                delta = time.perf_counter() - started_at
+
+                if res is not None or cache_none:
+                    _ttl = _resolve_ttl(client, res)
+                    await _a_write(client, _key, _pack(res, _ttl, delta), _ttl)
+                return res
+
+            async def _a_refresh(client: CachifyClient, _key: str, call: Callable[[], Awaitable[_R]]) -> None:
+                if stampede == 'lease':
+                    # somebody across the fleet is already recomputing this entry, keep serving the stale one
+                    token = uuid.uuid4().hex
+                    if not await client.a_try_acquire_lock(key=f'{_key}-lease', ttl=lease_ttl, token=token):
+                        return
+                    try:
+                        _ = await a_flight.do((client, _key), partial(_a_compute, client, _key, call))
+                    finally:
+                        _ = await client.a_release_lock(key=f'{_key}-lease', token=token)
+                    return
+
+                _ = await a_flight.do((client, _key), partial(_a_compute, client, _key, call))
 
             @wraps(_awaitable_func)
             async def _async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
                 cachify_client = client_provider()
-                _key = get_full_key_from_signature(
-                    bound_args=signature.bind(*args, **kwargs), key=key, operation_postfix='cached'
-                )
-                if (val := await cachify_client.a_get(key=_key)) is not None:
-                    return cast(_R, encode_decode_value(encoder_decoder=dec, val=val))
-
-                res = await _awaitable_func(*args, **kwargs)
-
-                await cachify_client.a_set(
-                    key=_key,
-                    val=encode_decode_value(encoder_decoder=enc, val=res),
-                    ttl=_resolve_ttl(cachify_client),
-                )
-                return res
+                _key = key_template(*args, **kwargs)
+                if (val := await _a_read(cachify_client, _key)) is not None:
+                    hit, freshness = _unpack(val)
+                    if freshness == 'fresh':
+                        return hit
+                    if freshness == 'stale':
+                        refreshing.spawn_task(
+                            (cachify_client, _key),
+                            _a_refresh(cachify_client, _key, partial(_awaitable_func, *args, **kwargs)),
+                        )
+                        return hit
+                    # 'expiring': this caller won the early recompute draw, recompute it in the foreground
+
+                compute = partial(_a_compute, cachify_client, _key, partial(_awaitable_func, *args, **kwargs))
+                if stampede == 'lease':
+                    return await a_flight.do(
+                        (cachify_client, _key),
+                        lambda: _a_compute_under_lease(
+                            cachify_client, _key, lease_ttl, compute, partial(_a_lookup, cachify_client, _key)
+                        ),
+                    )
+
+                return await a_flight.do((cachify_client, _key), compute)
 
             setattr(
                 _async_wrapper,
@@ -109,24 +410,57 @@ def _cached_impl(
             return cast(AsyncResetWrappedF[_P, _R], cast(object, _async_wrapper))
         else:
             _sync_func = cast(Callable[_P, _R], _func)  # type: ignore[redundant-cast]
+            flight = SingleFlight()
+
+            def _compute(client: CachifyClient, _key: str, call: Callable[[], _R]) -> _R:
+                started_at = time.perf_counter()
+                res = call()
+                delta = time.perf_counter() - started_at
+
+                if res is not None or cache_none:
+                    _ttl = _resolve_ttl(client, res)
+                    client.set(key=_key, val=_pack(res, _ttl, delta), ttl=_ttl, serializer=_serializer_for(client))
+                return res
+
+            def _refresh(client: CachifyClient, _key: str, call: Callable[[], _R]) -> None:
+                if stampede == 'lease':
+                    token = uuid.uuid4().hex
+                    if not client.try_acquire_lock(key=f'{_key}-lease', ttl=lease_ttl, token=token):
+                        return
+                    try:
+                        _ = flight.do((client, _key), partial(_compute, client, _key, call))
+                    finally:
+                        _ = client.release_lock(key=f'{_key}-lease', token=token)
+                    return
+
+                _ = flight.do((client, _key), partial(_compute, client, _key, call))
 
             @wraps(_sync_func)
             def _sync_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
                 cachify_client = client_provider()
-                _key = get_full_key_from_signature(
-                    bound_args=signature.bind(*args, **kwargs), key=key, operation_postfix='cached'
-                )
-                if (val := cachify_client.get(key=_key)) is not None:
-                    return cast(_R, encode_decode_value(encoder_decoder=dec, val=val))
-
-                res = _sync_func(*args, **kwargs)
-
-                cachify_client.set(
-                    key=_key,
-                    val=encode_decode_value(encoder_decoder=enc, val=res),
-                    ttl=_resolve_ttl(cachify_client),
-                )
-                return res
+                _key = key_template(*args, **kwargs)
+                if (val := cachify_client.get(key=_key, serializer=_serializer_for(cachify_client))) is not None:
+                    hit, freshness = _unpack(val)
+                    if freshness == 'fresh':
+                        return hit
+                    if freshness == 'stale':
+                        refreshing.submit(
+                            (cachify_client, _key),
+                            partial(_refresh, cachify_client, _key, partial(_sync_func, *args, **kwargs)),
+                        )
+                        return hit
+                    # 'expiring': this caller won the early recompute draw, recompute it in the foreground
+
+                compute = partial(_compute, cachify_client, _key, partial(_sync_func, *args, **kwargs))
+                if stampede == 'lease':
+                    return flight.do(
+                        (cachify_client, _key),
+                        lambda: _compute_under_lease(
+                            cachify_client, _key, lease_ttl, compute, partial(_lookup, cachify_client, _key)
+                        ),
+                    )
+
+                return flight.do((cachify_client, _key), compute)
 
             setattr(
                 _sync_wrapper,
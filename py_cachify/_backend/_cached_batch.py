@@ -0,0 +1,222 @@
+import inspect
+import string
+from collections.abc import Awaitable, Hashable, Iterable, Mapping
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar, Union, cast, overload
+
+from typing_extensions import ParamSpec
+
+from ._helpers import KeyTemplate, encode_decode_value, is_coroutine
+from ._lib import CachifyClient, get_cachify_client
+from ._types._common import UNSET, Decoder, Encoder, Serializer, UnsetType
+from ._types._reset_wrap import AsyncResetWrappedF, SyncResetWrappedF, WrappedFunctionReset
+
+
+_R = TypeVar('_R')
+_P = ParamSpec('_P')
+
+
+def cached_batch(
+    key: str,
+    ids_arg: Optional[str] = None,
+    ttl: Union[Optional[int], UnsetType] = UNSET,
+    enc_dec: Union[tuple[Encoder, Decoder], None] = None,
+    serializer: Optional[Serializer] = None,
+) -> WrappedFunctionReset:
+    """
+    Decorator that caches the results of a batch function (one taking a collection of IDs and returning
+        a mapping of ID to result) per element, so calls with overlapping ID lists share cached entries.
+
+    Args:
+    key (str): The per-element key format string, it must reference the IDs argument,
+        which is substituted by a single ID (i.e. 'user-{ids}' for `def load_users(ids: list[int])`).
+    ids_arg (Optional[str], optional): The name of the argument holding the IDs.
+        Defaults to None, meaning the first argument of the function.
+    ttl (Union[int, None, UnsetType], optional): The time-to-live for the cached results.
+        If UNSET (default), the current cachify client's default_cache_ttl is used.
+        If None, means indefinitely.
+    enc_dec (Union[Tuple[Encoder, Decoder], None], optional): The encoding and decoding functions for
+        every cached result. Defaults to None.
+    serializer (Optional[Serializer], optional): The serializer for the cached results of this function.
+        Defaults to None, meaning the serializer of the current cachify client is used.
+
+    Returns:
+    WrappedFunctionReset: Either a synchronous or asynchronous function with reset method attached to it.
+    Each call multi-gets the keys of all requested IDs, calls the function with a list of the missing IDs only
+        and multi-sets the results it returned. reset(*args, **kwargs) accepts the same arguments as the function
+        and deletes the entries of the given IDs.
+    """
+
+    return _cached_batch_impl(
+        key=key,
+        ids_arg=ids_arg,
+        ttl=ttl,
+        enc_dec=enc_dec,
+        serializer=serializer,
+        client_provider=get_cachify_client,
+    )
+
+
+class _BatchKeys:
+    """Builds the per-element keys of one call by substituting single IDs into the bound IDs argument."""
+
+    __slots__ = ('_bound', '_ids_arg', '_key_template')
+
+    def __init__(self, key_template: KeyTemplate, bound: inspect.BoundArguments, ids_arg: str) -> None:
+        self._key_template = key_template
+        self._bound = bound
+        self._ids_arg = ids_arg
+
+    @property
+    def ids(self) -> list[Hashable]:
+        # duplicates are requested and cached once, the order of the first occurrence is kept
+        return list(dict.fromkeys(cast(Iterable[Hashable], self._bound.arguments[self._ids_arg])))
+
+    def with_ids(self, ids: Any) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        self._bound.arguments[self._ids_arg] = ids
+        return self._bound.args, self._bound.kwargs
+
+    def keys(self, ids: list[Hashable]) -> dict[str, Hashable]:
+        keys: dict[str, Hashable] = {}
+        for id_ in ids:
+            args, kwargs = self.with_ids(id_)
+            keys[self._key_template(*args, **kwargs)] = id_
+        return keys
+
+
+def _validate_ids_arg(key: str, signature: inspect.Signature, ids_arg: Optional[str]) -> str:
+    params = signature.parameters
+    if ids_arg is None:
+        if not params:
+            raise ValueError('cached_batch requires a function that takes the IDs as an argument')
+        ids_arg = next(iter(params))
+
+    param = params.get(ids_arg)
+    if param is None or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+        raise ValueError(f"IDs argument '{ids_arg}' is not a named parameter of the function")
+
+    fields = {field_name for _, field_name, _, _ in string.Formatter().parse(key) if field_name is not None}
+    if not any(field == ids_arg or field.startswith((f'{ids_arg}.', f'{ids_arg}[')) for field in fields):
+        raise ValueError(f"Key '{key}' must reference the IDs argument '{ids_arg}', i.e. '{{{ids_arg}}}'")
+
+    return ids_arg
+
+
+def _cached_batch_impl(
+    key: str,
+    ids_arg: Optional[str] = None,
+    ttl: Union[Optional[int], UnsetType] = UNSET,
+    enc_dec: Union[tuple[Encoder, Decoder], None] = None,
+    serializer: Optional[Serializer] = None,
+    client_provider: Callable[[], CachifyClient] = get_cachify_client,
+) -> WrappedFunctionReset:
+    @overload
+    def _cached_batch_inner(  # type: ignore[overload-overlap]
+        _func: Callable[_P, Awaitable[_R]],
+    ) -> AsyncResetWrappedF[_P, _R]: ...
+
+    @overload
+    def _cached_batch_inner(
+        _func: Callable[_P, _R],
+    ) -> SyncResetWrappedF[_P, _R]: ...
+
+    def _cached_batch_inner(
+        _func: Union[Callable[_P, Awaitable[_R]], Callable[_P, _R]],
+    ) -> Union[AsyncResetWrappedF[_P, _R], SyncResetWrappedF[_P, _R]]:
+        signature = inspect.signature(_func)
+        _ids_arg = _validate_ids_arg(key, signature, ids_arg)
+        key_template = KeyTemplate(key, signature, 'cached')
+
+        enc, dec = None, None
+        if enc_dec is not None:
+            enc, dec = enc_dec
+
+        def _batch_keys(args: tuple[Any, ...], kwargs: dict[str, Any]) -> _BatchKeys:
+            return _BatchKeys(key_template, signature.bind(*args, **kwargs), _ids_arg)
+
+        def _serializer_for(client: CachifyClient) -> Serializer:
+            return serializer if serializer is not None else client.serializer
+
+        def _resolve_ttl(client: CachifyClient) -> Optional[int]:
+            return client.default_cache_ttl if isinstance(ttl, UnsetType) else ttl
+
+        def _decode_hits(keys: dict[str, Hashable], hits: dict[str, Any]) -> dict[Hashable, Any]:
+            return {keys[_key]: encode_decode_value(encoder_decoder=dec, val=val) for _key, val in hits.items()}
+
+        def _to_store(ids: list[Hashable], keys: dict[str, Hashable], res: Mapping[Any, Any]) -> dict[str, Any]:
+            # results for IDs the function wasn't asked about are returned but not cached, None means "not found"
+            key_by_id = {id_: _key for _key, id_ in keys.items()}
+            return {
+                key_by_id[id_]: encode_decode_value(encoder_decoder=enc, val=res[id_])
+                for id_ in ids
+                if id_ in res and res[id_] is not None
+            }
+
+        def _merge(ids: list[Hashable], found: dict[Hashable, Any], res: Mapping[Any, Any]) -> _R:
+            merged = {**found, **res}
+            return cast(_R, {id_: merged[id_] for id_ in ids if id_ in merged})
+
+        if is_coroutine(_func):
+            _awaitable_func = _func
+
+            @wraps(_awaitable_func)
+            async def _async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+                cachify_client = client_provider()
+                batch = _batch_keys(args, kwargs)
+                ids = batch.ids
+                keys = batch.keys(ids)
+                found = _decode_hits(
+                    keys, await cachify_client.a_get_many(list(keys), serializer=_serializer_for(cachify_client))
+                )
+                if not (missing := [id_ for id_ in ids if id_ not in found]):
+                    return _merge(ids, found, {})
+
+                call_args, call_kwargs = batch.with_ids(missing)
+                res = cast(Mapping[Any, Any], await _awaitable_func(*call_args, **call_kwargs))  # pyright: ignore[reportCallIssue]
+                await cachify_client.a_set_many(
+                    _to_store(missing, keys, res),
+                    ttl=_resolve_ttl(cachify_client),
+                    serializer=_serializer_for(cachify_client),
+                )
+                return _merge(ids, found, res)
+
+            async def _a_reset(*args: Any, **kwargs: Any) -> None:
+                batch = _batch_keys(args, kwargs)
+                await client_provider().a_delete_many(list(batch.keys(batch.ids)))
+
+            setattr(_async_wrapper, 'reset', _a_reset)
+
+            return cast(AsyncResetWrappedF[_P, _R], cast(object, _async_wrapper))
+        else:
+            _sync_func = cast(Callable[_P, _R], _func)  # type: ignore[redundant-cast]
+
+            @wraps(_sync_func)
+            def _sync_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+                cachify_client = client_provider()
+                batch = _batch_keys(args, kwargs)
+                ids = batch.ids
+                keys = batch.keys(ids)
+                found = _decode_hits(
+                    keys, cachify_client.get_many(list(keys), serializer=_serializer_for(cachify_client))
+                )
+                if not (missing := [id_ for id_ in ids if id_ not in found]):
+                    return _merge(ids, found, {})
+
+                call_args, call_kwargs = batch.with_ids(missing)
+                res = cast(Mapping[Any, Any], _sync_func(*call_args, **call_kwargs))  # pyright: ignore[reportCallIssue]
+                cachify_client.set_many(
+                    _to_store(missing, keys, res),
+                    ttl=_resolve_ttl(cachify_client),
+                    serializer=_serializer_for(cachify_client),
+                )
+                return _merge(ids, found, res)
+
+            def _reset(*args: Any, **kwargs: Any) -> None:
+                batch = _batch_keys(args, kwargs)
+                client_provider().delete_many(list(batch.keys(batch.ids)))
+
+            setattr(_sync_wrapper, 'reset', _reset)
+
+            return cast(SyncResetWrappedF[_P, _R], cast(object, _sync_wrapper))
+
+    return cast(WrappedFunctionReset, cast(object, _cached_batch_inner))
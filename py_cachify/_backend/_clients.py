@@ -1,13 +1,328 @@
-import asyncio
+import heapq
+import sys
 import threading
 import time
-from typing import Any, Optional, Union
+import weakref
+from collections.abc import Iterable
+from typing import Any, Callable, Optional, Union
 
+from ._constants import is_cached_value_key
+from ._eviction import EvictionPolicy, make_eviction_policy
+from ._serializers import OutOfBandPayload
 
-class MemoryCache:
-    def __init__(self) -> None:
+
+_HEAP_COMPACT_SLACK = 64
+_DEFAULT_STRIPES = 16
+
+
+def _payload_size(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, OutOfBandPayload):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+def _sweeper_loop(cache_ref: 'weakref.ref[MemoryCache]', interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+
+        cache._drain_expired()  # pyright: ignore[reportPrivateUsage]
+        del cache
+
+
+def _start_sweeper(cache: 'MemoryCache', interval: float) -> None:
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_sweeper_loop, args=(weakref.ref(cache), interval, stop), name='py-cachify-sweeper', daemon=True
+    )
+    # the thread only holds a weak reference, stop it as soon as the cache is garbage collected
+    _ = weakref.finalize(cache, stop.set)
+    thread.start()
+
+
+class _Shard:
+    """A single stripe of MemoryCache: every operation on its dict happens under its own lock."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int],
+        max_bytes: Optional[int],
+        policy: EvictionPolicy,
+        sweep_batch: int,
+        evictable: Callable[[str], bool],
+    ) -> None:
         self._cache: dict[str, tuple[Any, Union[float, None]]] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bounded = max_entries is not None or max_bytes is not None
+        self._policy = make_eviction_policy(policy, max_entries)
+        self._sizes: dict[str, int] = {}
+        self._pinned: set[str] = set()
+        self._evictable = evictable
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._sweep_batch = sweep_batch
+        self.total_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def set(self, name: str, value: Any, ex: Union[int, None], nx: bool) -> Optional[bool]:
+        with self._lock:
+            if nx and (existing := self._cache.get(name)) is not None:
+                _, exp_at = existing
+                if exp_at is None or exp_at > time.time():
+                    return False
+
+            now = time.time() if ex or self._expiry_heap else 0.0
+            exp_at = ex and now + ex
+            if self._bounded:
+                self._store(name, value, exp_at, pinned=nx or not self._evictable(name))
+            else:
+                self._cache[name] = value, exp_at
+
+            if exp_at:
+                heapq.heappush(self._expiry_heap, (exp_at, name))
+                if len(self._expiry_heap) > 2 * len(self._cache) + _HEAP_COMPACT_SLACK:
+                    self._compact_expiry_heap()
+
+            if self._expiry_heap and self._expiry_heap[0][0] <= now:
+                _ = self._sweep(now, self._sweep_batch)
+            return True if nx else None
+
+    def get(self, name: str) -> Optional[Any]:
+        if self._bounded:
+            return self._bounded_get(name)
+
+        # a single dict read is atomic on both GIL and free-threaded builds, only removal needs the lock
+        entry = self._cache.get(name)
+        if entry is None:
+            return None
+        if not entry[1] or entry[1] > time.time():
+            return entry[0]
+
+        with self._lock:
+            # it might have been overwritten while we were not holding the lock
+            if self._cache.get(name) is entry:
+                self._forget(name)
+        return None
+
+    def _bounded_get(self, name: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._cache.get(name)
+            if entry is not None and entry[1] and entry[1] <= time.time():
+                self._forget(name)
+                entry = None
+
+            if name not in self._pinned:
+                self._policy.on_get(name, hit=entry is not None)
+            return None if entry is None else entry[0]
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            self._forget(name)
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            value = int(self._live_value(name) or 0) + 1
+            if self._bounded:
+                # counters are never evicted, like lock keys
+                self._store(name, value, None, pinned=True)
+            else:
+                self._cache[name] = value, None
+            return value
+
+    def compare_and_delete(self, name: str, expected: Any) -> bool:
+        with self._lock:
+            if self._live_value(name) != expected:
+                return False
+            self._forget(name)
+            return True
+
+    def compare_and_expire(self, name: str, expected: Any, ex: int) -> bool:
+        with self._lock:
+            if self._live_value(name) != expected:
+                return False
+            # same value, pinning and size, only the expiration changes (the old heap item goes stale)
+            exp_at = time.time() + ex
+            self._cache[name] = expected, exp_at
+            heapq.heappush(self._expiry_heap, (exp_at, name))
+            return True
+
+    def sweep_expired(self, limit: Optional[int]) -> int:
+        with self._lock:
+            return self._sweep(time.time(), limit)
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._cache):
+                self._forget(name)
+            self._expiry_heap = []
+
+    def _sweep(self, now: float, limit: Optional[int]) -> int:
+        heap, removed, popped = self._expiry_heap, 0, 0
+        while heap and heap[0][0] <= now and (limit is None or popped < limit):
+            exp_at, name = heapq.heappop(heap)
+            popped += 1
+            entry = self._cache.get(name)
+            # the key may have been overwritten or deleted since, then this heap item is stale
+            if entry is None or entry[1] != exp_at:
+                continue
+
+            self._forget(name)
+            removed += 1
+
+        return removed
+
+    def _live_value(self, name: str) -> Optional[Any]:
+        entry = self._cache.get(name)
+        if entry is None or (entry[1] and entry[1] <= time.time()):
+            return None
+        return entry[0]
+
+    def _compact_expiry_heap(self) -> None:
+        self._expiry_heap = [(exp_at, name) for name, (_, exp_at) in self._cache.items() if exp_at]
+        heapq.heapify(self._expiry_heap)
+
+    def _store(self, name: str, value: Any, exp_at: Union[float, None], pinned: bool) -> None:
+        self._forget(name)
+        size = _payload_size(value) if self._max_bytes is not None else 0
+        if not pinned and not self._make_room(name, size):
+            # the new entry itself is the one that does not fit
+            self.evictions += 1
+            return
+
+        self._cache[name] = value, exp_at
+        if self._max_bytes is not None:
+            self._sizes[name] = size
+            self.total_bytes += size
+
+        if pinned:
+            self._pinned.add(name)
+        else:
+            self._policy.on_insert(name)
+
+    def _forget(self, name: str) -> None:
+        if self._cache.pop(name, None) is None or not self._bounded:
+            return
+
+        self.total_bytes -= self._sizes.pop(name, 0)
+        if name in self._pinned:
+            self._pinned.discard(name)
+        else:
+            self._policy.on_remove(name)
+
+    def _over_budget(self, extra_bytes: int) -> bool:
+        return (self._max_entries is not None and len(self._cache) >= self._max_entries) or (
+            self._max_bytes is not None and self.total_bytes + extra_bytes > self._max_bytes
+        )
+
+    def _make_room(self, candidate: str, size: int) -> bool:
+        if self._max_bytes is not None and size > self._max_bytes:
+            return False
+
+        while self._over_budget(size):
+            victim = self._policy.victim()
+            if victim is None:
+                # only pinned (internal state) keys are left, let the budget overflow instead of dropping them
+                return True
+            if not self._policy.admit(candidate, victim):
+                return False
+
+            self._forget(victim)
+            self.evictions += 1
+
+        return True
+
+
+class MemoryCache:
+    """In-process cache backend, split into `stripes` independently locked shards.
+
+    Args:
+    max_entries (Optional[int], optional): Maximum number of stored keys. Defaults to None (unbounded).
+    max_bytes (Optional[int], optional): Maximum total size of stored values (length of the pickled payloads).
+        Defaults to None (unbounded).
+    policy (EvictionPolicy, optional): Eviction policy used once a budget is exceeded: 'lru', 'lfu' or 'tinylfu'
+        (LRU guarded by a frequency based admission filter). Defaults to 'lru'.
+    sweep_interval (Optional[float], optional): If set, a daemon thread removes expired entries
+        every `sweep_interval` seconds. Must be positive. Defaults to None.
+    sweep_batch (int, optional): Maximum number of expired entries removed per sweep step,
+        each write also runs one step. Defaults to 100.
+    stripes (Optional[int], optional): Number of shards, keys are assigned by hash. Defaults to None, meaning
+        16 for unbounded caches. Bounded caches (`max_entries`/`max_bytes`) always use a single shard,
+        so their budgets and eviction order are exact.
+    store_objects (bool, optional): If True, CachifyClient stores values as live objects instead of serialized
+        payloads, so a hit returns the cached object itself without unpickling it. `max_bytes` then counts
+        the shallow `sys.getsizeof` of the stored objects. Defaults to False.
+    copier (Optional[Callable[[Any], Any]], optional): Called on every value read in `store_objects` mode
+        (e.g. copy.deepcopy), so callers can't mutate the cached object. Defaults to None, meaning the cached
+        object itself is returned.
+    evictable (Callable[[str], bool], optional): Predicate selecting the keys a budget may evict.
+        Defaults to selecting the keys of `cached` values.
+
+    Keys set with `nx=True` (locks) and keys not selected by `evictable` (pool state, fencing counters and other
+    internal state) are never evicted, they only expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: EvictionPolicy = 'lru',
+        sweep_interval: Optional[float] = None,
+        sweep_batch: int = 100,
+        stripes: Optional[int] = None,
+        store_objects: bool = False,
+        copier: Optional[Callable[[Any], Any]] = None,
+        evictable: Callable[[str], bool] = is_cached_value_key,
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError('max_entries must be a positive integer')
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError('max_bytes must be a positive integer')
+        if sweep_interval is not None and sweep_interval <= 0:
+            # the sweeper would never block between steps and keep a core busy
+            raise ValueError('sweep_interval must be a positive number')
+        bounded = max_entries is not None or max_bytes is not None
+        if stripes is None:
+            stripes = 1 if bounded else _DEFAULT_STRIPES
+        if stripes <= 0:
+            raise ValueError('stripes must be a positive integer')
+        if bounded and stripes > 1:
+            # split budgets would reject values that fit the global one and miss the configured entry limit
+            raise ValueError('max_entries and max_bytes are only supported with stripes=1')
+
+        if copier is not None and not store_objects:
+            raise ValueError('copier is only used together with store_objects=True')
+
+        self._stripes = stripes
+        self._shards = tuple(
+            _Shard(
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+                policy=policy,
+                sweep_batch=sweep_batch,
+                evictable=evictable,
+            )
+            for _ in range(stripes)
+        )
+        self._sweep_batch = sweep_batch
+        self.store_objects = store_objects
+        self.copier = copier
+        if sweep_interval is not None:
+            _start_sweeper(self, sweep_interval)
+
+    @property
+    def evictions(self) -> int:
+        return sum(shard.evictions for shard in self._shards)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(shard.total_bytes for shard in self._shards)
 
     def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Optional[bool]:
         """
@@ -18,47 +333,86 @@ class MemoryCache:
         - If nx is True: only set the value if the key is absent or expired.
           Returns True if the value was set, False if the key already exists and is not expired.
         """
-        if not nx:
-            self._cache[name] = value, ex and time.time() + ex
-            return None
-
-        # NX path: need atomic check+set
-        with self._lock:
-            existing = self._cache.get(name)
-            if existing is not None:
-                _, exp_at = existing
-                if exp_at is None or exp_at > time.time():
-                    return False
-
-            self._cache[name] = value, ex and time.time() + ex
-            return True
+        return self._shards[hash(name) % self._stripes].set(name, value, ex, nx)
 
     def get(self, name: str) -> Optional[Any]:
-        val, exp_at = self._cache.get(name, (None, None))
-        if not exp_at or exp_at > time.time():
-            return val
+        return self._shards[hash(name) % self._stripes].get(name)
 
-        self.delete(name)
-        return None
+    def mget(self, names: Iterable[str]) -> list[Optional[Any]]:
+        return [self._shards[hash(name) % self._stripes].get(name) for name in names]
 
     def delete(self, *names: str) -> None:
-        for key in names:
-            self._cache.pop(key, None)
+        for name in names:
+            self._shards[hash(name) % self._stripes].delete(name)
+
+    def incr(self, name: str) -> int:
+        """Atomically increment the integer stored at `name` (0 if absent) and return the new value.
+
+        The counter never expires and, like lock keys, is never evicted.
+        """
+        return self._shards[hash(name) % self._stripes].incr(name)
+
+    def compare_and_delete(self, name: str, expected: Any) -> bool:
+        """Atomically delete `name` if it holds `expected`, returns whether it was deleted."""
+        return self._shards[hash(name) % self._stripes].compare_and_delete(name, expected)
+
+    def compare_and_expire(self, name: str, expected: Any, ex: int) -> bool:
+        """Atomically make `name` expire in `ex` seconds if it holds `expected`, returns whether it did."""
+        return self._shards[hash(name) % self._stripes].compare_and_expire(name, expected, ex)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def sweep_expired(self, limit: Optional[int] = None) -> int:
+        """Remove expired entries looking at up to `limit` of them per shard (all if None).
+
+        Returns how many entries were removed.
+        """
+        return sum(shard.sweep_expired(limit) for shard in self._shards)
+
+    def _drain_expired(self) -> None:
+        for shard in self._shards:
+            # release the shard lock between batches so a large backlog doesn't block other callers
+            while shard.sweep_expired(self._sweep_batch) == self._sweep_batch:
+                pass
 
 
 class AsyncWrapper:
+    """Async adapter over MemoryCache.
+
+    MemoryCache calls never block on I/O and hold their shard lock only for the duration of a dict update,
+    so they are called directly: no asyncio lock, no state bound to an event loop.
+    """
+
     def __init__(self, cache: MemoryCache) -> None:
         self._cache = cache
-        self._lock = asyncio.Lock()
+
+    @property
+    def store_objects(self) -> bool:
+        return self._cache.store_objects
+
+    @property
+    def copier(self) -> Optional[Callable[[Any], Any]]:
+        return self._cache.copier
 
     async def get(self, name: str) -> Optional[Any]:
-        async with self._lock:
-            return self._cache.get(name)
+        return self._cache.get(name)
+
+    async def mget(self, names: Iterable[str]) -> list[Optional[Any]]:
+        return self._cache.mget(names)
 
     async def delete(self, *names: str) -> None:
-        async with self._lock:
-            self._cache.delete(*names)
+        self._cache.delete(*names)
+
+    async def incr(self, name: str) -> int:
+        return self._cache.incr(name)
+
+    async def compare_and_delete(self, name: str, expected: Any) -> bool:
+        return self._cache.compare_and_delete(name, expected)
+
+    async def compare_and_expire(self, name: str, expected: Any, ex: int) -> bool:
+        return self._cache.compare_and_expire(name, expected, ex)
 
     async def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Optional[bool]:
-        async with self._lock:
-            return self._cache.set(name, value, ex, nx)
+        return self._cache.set(name, value, ex, nx)
@@ -0,0 +1,82 @@
+import lzma
+import zlib
+
+from ._types._common import Compressor
+
+
+# first payload bytes up to this value are reserved for the codec header
+_MAX_CODEC_ID = 0x1F
+_ESCAPE = b'\x00'
+
+
+class ZlibCompressor:
+    """zlib (deflate) compression, a good balance between speed and ratio."""
+
+    codec_id = 0x01
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class LzmaCompressor:
+    """LZMA (xz) compression, slower but with a better ratio for large, repetitive payloads."""
+
+    codec_id = 0x02
+
+    def __init__(self, preset: int = 6) -> None:
+        self.preset = preset
+
+    def compress(self, data: bytes) -> bytes:
+        return lzma.compress(data, preset=self.preset)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lzma.decompress(data)
+
+
+class CompressionLayer:
+    """Compresses payloads of at least `threshold` bytes and prefixes them with the codec id.
+
+    Payloads are stored as is otherwise, unless their first byte falls into the reserved header range,
+    then a single escape byte is prepended. Reads detect the codec from the first byte,
+    values written with any of the built-in codecs can always be read.
+    """
+
+    def __init__(self, compressor: Compressor, threshold: int = 1024) -> None:
+        if not 0 < compressor.codec_id <= _MAX_CODEC_ID:
+            raise ValueError(f'codec_id must be between 1 and {_MAX_CODEC_ID}, got {compressor.codec_id}')
+
+        self._compressor = compressor
+        self._header = bytes((compressor.codec_id,))
+        self._threshold = threshold
+        self._decompressors: dict[int, Compressor] = {
+            ZlibCompressor.codec_id: ZlibCompressor(),
+            LzmaCompressor.codec_id: LzmaCompressor(),
+            compressor.codec_id: compressor,
+        }
+
+    def encode(self, data: bytes) -> bytes:
+        if len(data) >= self._threshold:
+            compressed = self._compressor.compress(data)
+            # incompressible payloads are kept as they are
+            if len(compressed) + 1 < len(data):
+                return self._header + compressed
+
+        if data and data[0] <= _MAX_CODEC_ID:
+            return _ESCAPE + data
+        return data
+
+    def decode(self, data: bytes) -> bytes:
+        if not data or data[0] > _MAX_CODEC_ID:
+            return data
+        if data[0] == 0:
+            return data[1:]
+
+        if (decompressor := self._decompressors.get(data[0])) is None:
+            raise ValueError(f'Unknown compression codec id {data[0]}, configure its compressor to read the value')
+        return decompressor.decompress(data[1:])
@@ -2,3 +2,8 @@ from typing import Literal
 
 
 OperationPostfix = Literal['once', 'cached', 'lock', 'pool']
+
+
+def is_cached_value_key(name: str) -> bool:
+    """Keys written by `cached`/`cached_batch`; locks, `once` keys, pool state and leases never match."""
+    return name.endswith('-cached')
@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from typing import Literal, Optional, Union
+
+from typing_extensions import TypeAlias
+
+
+EvictionPolicy: TypeAlias = Literal['lru', 'lfu', 'tinylfu']
+
+
+class LRUPolicy:
+    """Least recently used: evicts the entry that was not read or written for the longest time."""
+
+    def __init__(self) -> None:
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_get(self, name: str, hit: bool) -> None:
+        if hit:
+            self._order.move_to_end(name)
+
+    def on_insert(self, name: str) -> None:
+        self._order[name] = None
+
+    def on_remove(self, name: str) -> None:
+        _ = self._order.pop(name, None)
+
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        return True
+
+
+class LFUPolicy:
+    """Least frequently used with O(1) operations: entries live in per-frequency buckets, ties are broken by LRU."""
+
+    def __init__(self) -> None:
+        self._freqs: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_freq = 0
+
+    def _unlink(self, name: str, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[name]
+        if not bucket:
+            del self._buckets[freq]
+
+    def on_get(self, name: str, hit: bool) -> None:
+        if not hit:
+            return
+
+        freq = self._freqs[name]
+        self._unlink(name, freq)
+        if self._min_freq == freq and freq not in self._buckets:
+            self._min_freq = freq + 1
+
+        self._freqs[name] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[name] = None
+
+    def on_insert(self, name: str) -> None:
+        self._freqs[name] = 1
+        self._buckets.setdefault(1, OrderedDict())[name] = None
+        self._min_freq = 1
+
+    def on_remove(self, name: str) -> None:
+        if (freq := self._freqs.pop(name, None)) is not None:
+            self._unlink(name, freq)
+
+    def victim(self) -> Optional[str]:
+        if not self._buckets:
+            return None
+
+        if self._min_freq not in self._buckets:
+            # the last entry of the min bucket was removed explicitly, this is the only non O(1) step
+            self._min_freq = min(self._buckets)
+
+        return next(iter(self._buckets[self._min_freq]))
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        return True
+
+
+class _FrequencySketch:
+    """Count-min sketch with 4-bit-like saturating counters and periodic halving (aging)."""
+
+    # odd multipliers for multiply-shift hashing, one per row
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int) -> None:
+        width = 64
+        while width < capacity * 4:
+            width *= 2
+
+        self._shift = 64 - (width.bit_length() - 1)
+        self._table = [[0] * width for _ in self._SEEDS]
+        self._additions = 0
+        self._sample_size = width * 10
+
+    def _indexes(self, name: str) -> list[int]:
+        h = hash(name) & 0xFFFFFFFFFFFFFFFF
+        # the high bits of the product depend on all bits of the hash, so rows are independent
+        return [((h * seed) & 0xFFFFFFFFFFFFFFFF) >> self._shift for seed in self._SEEDS]
+
+    def increment(self, name: str) -> None:
+        for row, idx in zip(self._table, self._indexes(name)):
+            if row[idx] < self._MAX_COUNT:
+                row[idx] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def estimate(self, name: str) -> int:
+        return min(row[idx] for row, idx in zip(self._table, self._indexes(name)))
+
+    def _reset(self) -> None:
+        self._additions //= 2
+        for row in self._table:
+            for idx, count in enumerate(row):
+                row[idx] = count >> 1
+
+
+class TinyLFUPolicy(LRUPolicy):
+    """LRU eviction guarded by a TinyLFU admission filter.
+
+    A new entry replaces the LRU victim only if it was requested more often recently,
+    which keeps one-hit wonders from flushing out hot entries.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self._sketch = _FrequencySketch(capacity)
+
+    def on_get(self, name: str, hit: bool) -> None:
+        self._sketch.increment(name)
+        super().on_get(name, hit)
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        return self._sketch.estimate(candidate) > self._sketch.estimate(victim)
+
+
+def make_eviction_policy(
+    policy: EvictionPolicy, max_entries: Optional[int]
+) -> Union[LRUPolicy, LFUPolicy, TinyLFUPolicy]:
+    if policy == 'lru':
+        return LRUPolicy()
+    if policy == 'lfu':
+        return LFUPolicy()
+    if policy == 'tinylfu':
+        return TinyLFUPolicy(capacity=max_entries or 1024)
+
+    raise ValueError(f"Unknown eviction policy '{policy}', expected one of 'lru', 'lfu', 'tinylfu'")
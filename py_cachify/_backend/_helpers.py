@@ -1,5 +1,8 @@
 import functools
 import inspect
+import re
+import string
+import sys
 from collections.abc import Awaitable
 from typing import Any, Callable, TypeVar, Union
 
@@ -15,6 +18,8 @@ _R = TypeVar('_R', covariant=True)
 _P = ParamSpec('_P')
 _S = TypeVar('_S')
 
+_FIELD_ROOT_SEPARATOR_RE = re.compile(r'[.\[]')
+
 
 def _call_original(
     _pyc_original_func: Union[Callable[..., Any], None], _pyc_method_name: str, *args: Any, **kwargs: Any
@@ -58,17 +63,143 @@ def get_full_key_from_signature(
     operation_postfix: OperationPostfix,
 ) -> str:
     bound_args.apply_defaults()
-    _args_repr = f'{bound_args}'
 
     args_dict = bound_args.arguments
-    args: tuple[Any, ...] = args_dict.pop('args', ())
-    kwargs: dict[str, Any] = args_dict.pop('kwargs', {})
-    kwargs.update(args_dict)
+    args: tuple[Any, ...] = args_dict.get('args', ())
+    kwargs: dict[str, Any] = {**args_dict.get('kwargs', {})}
+    kwargs.update((name, val) for name, val in args_dict.items() if name not in ('args', 'kwargs'))
 
     try:
         return f'{key.format(*args, **kwargs)}-{operation_postfix}'
     except (IndexError, KeyError):
-        raise ValueError(f'Arguments in a key({key}) do not match function signature params({_args_repr})') from None
+        raise ValueError(f'Arguments in a key({key}) do not match function signature params({bound_args})') from None
+
+
+class KeyTemplate:
+    """
+    Key format string compiled against the signature of the decorated function once, at decoration time.
+
+    Named placeholders are mapped directly to positional/keyword slots of the signature, so building a key
+    does not need `signature.bind`/`apply_defaults`. Every call is still checked against the signature
+    (unknown or duplicated keyword arguments, missing required ones, too many positional ones). Templates or calls
+    the fast path can't handle (positional placeholders, `*args`/`**kwargs` lookups, calls that don't match
+    the signature) fall back to `get_full_key_from_signature`, which keeps the exact same semantics and errors.
+    """
+
+    __slots__ = (
+        '_constant',
+        '_key',
+        '_keywords',
+        '_max_positional',
+        '_operation_postfix',
+        '_required',
+        '_signature',
+        '_slots',
+        '_template',
+    )
+
+    def __init__(self, key: str, signature: inspect.Signature, operation_postfix: OperationPostfix) -> None:
+        self._key = key
+        self._signature = signature
+        self._operation_postfix: OperationPostfix = operation_postfix
+        self._constant: Union[str, None] = None
+        self._template: Union[str, None] = None
+        self._slots: tuple[tuple[str, Union[int, None], Any], ...] = ()
+        # positional index of every parameter that may be passed by keyword (sys.maxsize for keyword-only ones)
+        # and of every required parameter, None while calls can't be checked without `signature.bind`
+        self._keywords: Union[dict[str, int], None] = None
+        self._required: tuple[tuple[str, int], ...] = ()
+        self._max_positional = 0
+        self._compile()
+
+    def _compile(self) -> None:
+        params = self._signature.parameters
+        if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params.values()):
+            return
+
+        positional = [p for p in params.values() if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        indexes = {name: positional.index(p) if p in positional else sys.maxsize for name, p in params.items()}
+        self._keywords = {name: indexes[name] for name, p in params.items() if p.kind is not p.POSITIONAL_ONLY}
+        self._required = tuple((name, indexes[name]) for name, p in params.items() if p.default is p.empty)
+        self._max_positional = len(positional)
+
+        try:
+            parsed = list(string.Formatter().parse(self._key))
+        except ValueError:
+            return
+
+        if all(field_name is None for _, field_name, _, _ in parsed):
+            self._constant = f'{self._key.format()}-{self._operation_postfix}'
+            return
+
+        if any(name in ('args', 'kwargs') for name in params):
+            return
+
+        slot_names: list[str] = []
+        parts: list[str] = []
+        for literal, field_name, format_spec, conversion in parsed:
+            parts.append(literal.replace('{', '{{').replace('}', '}}'))
+            if field_name is None:
+                continue
+
+            root = _FIELD_ROOT_SEPARATOR_RE.split(field_name, maxsplit=1)[0]
+            if root not in params or (format_spec and '{' in format_spec):
+                return
+
+            if root not in slot_names:
+                slot_names.append(root)
+            parts.append(
+                f'{{{slot_names.index(root)}{field_name[len(root) :]}'
+                f'{"!" + conversion if conversion else ""}{":" + format_spec if format_spec else ""}}}'
+            )
+
+        self._template = f'{"".join(parts)}-{self._operation_postfix}'
+        self._slots = tuple(
+            (name, positional.index(params[name]) if params[name] in positional else None, params[name].default)
+            for name in slot_names
+        )
+
+    def _slow(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        return get_full_key_from_signature(
+            bound_args=self._signature.bind(*args, **kwargs), key=self._key, operation_postfix=self._operation_postfix
+        )
+
+    def _matches_signature(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+        if self._keywords is None or len(args) > self._max_positional:
+            return False
+
+        for name in kwargs:
+            index = self._keywords.get(name)
+            # unknown keyword, or one that was already passed positionally
+            if index is None or index < len(args):
+                return False
+
+        return all(index < len(args) or name in kwargs for name, index in self._required)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        if not self._matches_signature(args, kwargs):
+            # let `signature.bind` raise the usual TypeError (or handle `*args`/`**kwargs`)
+            return self._slow(args, kwargs)
+
+        if self._constant is not None:
+            return self._constant
+
+        if self._template is None:
+            return self._slow(args, kwargs)
+
+        values: list[Any] = []
+        for name, index, default in self._slots:
+            if index is not None and index < len(args):
+                values.append(args[index])
+            elif name in kwargs:
+                values.append(kwargs[name])
+            else:
+                values.append(default)
+
+        try:
+            return self._template.format(*values)
+        except (IndexError, KeyError):
+            return self._slow(args, kwargs)
 
 
 def is_coroutine(
@@ -104,7 +235,10 @@ def reset(
         operation_postfix=_pyc_operation_postfix,
     )
 
-    client.delete(key=_key)
+    if _pyc_operation_postfix == 'lock':
+        client.release_lock(key=_key)
+    else:
+        client.delete(key=_key)
 
     _call_original(_pyc_original_func, 'reset', *args, **kwargs)
 
@@ -123,7 +257,10 @@ async def a_reset(
         bound_args=_pyc_signature.bind(*args, **kwargs), key=_pyc_key, operation_postfix=_pyc_operation_postfix
     )
 
-    await client.a_delete(key=_key)
+    if _pyc_operation_postfix == 'lock':
+        await client.a_release_lock(key=_key)
+    else:
+        await client.a_delete(key=_key)
 
     await _acall_original(_pyc_original_func, 'reset', *args, **kwargs)
 
@@ -0,0 +1,209 @@
+import json
+import queue
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+from typing import Any, Callable, Optional
+
+from ._logger import logger
+from ._types._common import InvalidationTransport
+
+
+DEFAULT_INVALIDATION_CHANNEL = 'py-cachify:invalidate'
+
+
+class InvalidationBus:
+    """Broadcasts the keys written or deleted by this process so other processes can evict them from their L1 tier.
+
+    Keys published within `flush_interval` seconds are coalesced and sent as one message. Messages sent by the bus
+    itself are ignored on receipt, since the local tier is already up to date.
+
+    Args:
+    transport (InvalidationTransport): The transport carrying the messages
+        (RedisPubSubTransport, QueueTransport, LocalTransport).
+    flush_interval (float, optional): How long in seconds keys are collected before being broadcast, 0 sends every
+        publish right away. Together with the transport latency it bounds how long other processes can serve
+        a stale L1 value. Defaults to 0.05.
+    max_batch (int, optional): Number of pending keys that triggers a broadcast before `flush_interval` is over.
+        Defaults to 1000.
+    """
+
+    def __init__(self, transport: InvalidationTransport, flush_interval: float = 0.05, max_batch: int = 1000) -> None:
+        if flush_interval < 0:
+            raise ValueError('flush_interval must not be negative')
+        if max_batch <= 0:
+            raise ValueError('max_batch must be a positive integer')
+
+        self.transport = transport
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.node_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._pending: dict[str, None] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._callbacks: list[Callable[[list[str]], None]] = []
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    def publish(self, names: Iterable[str]) -> None:
+        with self._lock:
+            self._pending.update(dict.fromkeys(names))
+            if not self._pending:
+                return
+            if self.flush_interval and len(self._pending) < self.max_batch:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Broadcasts the pending keys now. Transport errors are logged, L1 ttls still bound the staleness."""
+        with self._lock:
+            names, self._pending = list(self._pending), {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not names:
+            return
+        try:
+            _ = self.transport.publish(json.dumps({'src': self.node_id, 'keys': names}).encode())
+        except Exception as e:
+            logger.warning(f'Broadcasting invalidation of {len(names)} keys failed: {e}')
+
+    def subscribe(self, callback: Callable[[list[str]], None]) -> None:
+        """Calls `callback` with the keys invalidated by other processes."""
+        with self._lock:
+            self._callbacks.append(callback)
+            if self._unsubscribe is None:
+                self._unsubscribe = self.transport.subscribe(self._on_message)
+
+    def close(self) -> None:
+        """Broadcasts the pending keys and stops listening."""
+        self.flush()
+        with self._lock:
+            unsubscribe, self._unsubscribe = self._unsubscribe, None
+            self._callbacks.clear()
+        if unsubscribe is not None:
+            unsubscribe()
+
+    def _on_message(self, message: bytes) -> None:
+        try:
+            payload = json.loads(message)
+            src, names = payload['src'], payload['keys']
+        except (ValueError, TypeError, KeyError) as e:
+            logger.debug(f'Ignoring malformed invalidation message: {e}')
+            return
+
+        if src == self.node_id:
+            return
+        for callback in list(self._callbacks):
+            callback(names)
+
+
+class LocalTransport:
+    """In-process transport delivering every message to all subscribers right away.
+
+    Stands in for a real transport in tests, or connects several buses (one per simulated node) in one process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: list[Callable[[bytes], None]] = []
+
+    def publish(self, message: bytes) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(message)
+
+    def subscribe(self, callback: Callable[[bytes], None]) -> Callable[[], None]:
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+
+class QueueTransport:
+    """Transport over `multiprocessing` (or `queue`) queues, for processes on one machine without a Redis server.
+
+    Every process owns an inbox, passes it as `inbox` and all inboxes (its own included) as `outboxes`.
+    Messages from the inbox are read by a daemon thread.
+
+    Args:
+    inbox (Any): The queue this process reads from.
+    outboxes (Sequence[Any]): The queues every message is put into.
+    poll_interval (float, optional): How long in seconds the reading thread blocks on the inbox before checking
+        whether it was stopped. Defaults to 0.1.
+    """
+
+    def __init__(self, inbox: Any, outboxes: Sequence[Any], poll_interval: float = 0.1) -> None:
+        self.inbox = inbox
+        self.outboxes = list(outboxes)
+        self.poll_interval = poll_interval
+
+    def publish(self, message: bytes) -> None:
+        for outbox in self.outboxes:
+            outbox.put(message)
+
+    def subscribe(self, callback: Callable[[bytes], None]) -> Callable[[], None]:
+        stopped = threading.Event()
+
+        def listen() -> None:
+            while not stopped.is_set():
+                try:
+                    message = self.inbox.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+                callback(message)
+
+        thread = threading.Thread(target=listen, name='py-cachify-invalidation', daemon=True)
+        thread.start()
+
+        def unsubscribe() -> None:
+            stopped.set()
+            thread.join()
+
+        return unsubscribe
+
+
+class RedisPubSubTransport:
+    """Transport over a Redis pub/sub channel.
+
+    Pub/sub delivers messages at most once, so when one is lost (e.g. during a reconnect) the `local_ttl` of the
+    L1 tiers still bounds how long a stale value can be served.
+
+    Args:
+    client (Any): A sync redis-py client (also for async setups, listening happens on a daemon thread).
+    channel (str, optional): The channel messages are published to. Defaults to 'py-cachify:invalidate'.
+    poll_interval (float, optional): How long in seconds the listening thread blocks waiting for a message.
+        Defaults to 1.0.
+    """
+
+    def __init__(self, client: Any, channel: str = DEFAULT_INVALIDATION_CHANNEL, poll_interval: float = 1.0) -> None:
+        self.client = client
+        self.channel = channel
+        self.poll_interval = poll_interval
+
+    def publish(self, message: bytes) -> Any:
+        return self.client.publish(self.channel, message)
+
+    def subscribe(self, callback: Callable[[bytes], None]) -> Callable[[], None]:
+        def handle(message: dict[str, Any]) -> None:
+            callback(message['data'])
+
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.channel: handle})
+        thread = pubsub.run_in_thread(sleep_time=self.poll_interval, daemon=True)
+
+        def unsubscribe() -> None:
+            thread.stop()
+            thread.join()
+
+        return unsubscribe
@@ -1,19 +1,59 @@
+import asyncio
 import pickle
-from typing import TYPE_CHECKING, Any, Optional, Union
+import weakref
+from collections.abc import Awaitable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
+from ._batching import AsyncBatchLoader
+from ._cache_entry import CacheEntry
 from ._clients import AsyncWrapper, MemoryCache
+from ._compression import CompressionLayer
+from ._constants import is_cached_value_key
 from ._exceptions import CachifyInitError
-from ._types._common import UNSET, AsyncClient, Decoder, Encoder, SyncClient, UnsetType
+from ._invalidation import InvalidationBus
+from ._lock_ops import async_incr, async_lock_ops, sync_incr, sync_lock_ops
+from ._lock_wakeups import LockWakeups, LockWatch
+from ._serializers import OutOfBandPayload, OutOfBandPickleSerializer, PickleSerializer
+from ._threaded import ThreadedAsyncClient
+from ._types._common import (
+    UNSET,
+    AsyncClient,
+    AsyncPipeline,
+    Compressor,
+    Decoder,
+    Encoder,
+    Serializer,
+    SyncClient,
+    SyncPipeline,
+    UnsetType,
+    WaitStrategy,
+)
 from ._types._lock_wrap import WrappedFunctionLock
 from ._types._pool_wrap import WrappedFunctionPool
 from ._types._reset_wrap import WrappedFunctionReset
+from ._wait import FixedWait
 
 
 if TYPE_CHECKING:
+    from ._cached import StampedeMode
     from ._lock import lock as _lock_cls
     from ._pool import pool as _pool_cls
 
 
+# locks, pools and other internal state are always pickled, whatever serializer is used for cached values
+_INTERNAL_SERIALIZER = PickleSerializer()
+_LOCK_PAYLOAD = pickle.dumps(1)
+
+
+def _lock_payload(token: Optional[str]) -> bytes:
+    # the owner token is the stored value itself, so a release can compare it in a single atomic call
+    return _LOCK_PAYLOAD if token is None else pickle.dumps(token)
+
+
+def _ttl_for(key: str, ttl: Union[Optional[int], Mapping[str, Optional[int]]]) -> Optional[int]:
+    return ttl.get(key) if isinstance(ttl, Mapping) else ttl
+
+
 class CachifyClient:
     def __init__(
         self,
@@ -24,6 +64,12 @@ class CachifyClient:
         default_cache_ttl: Optional[int] = None,
         lock_poll_interval: float = 0.1,
         default_pool_slot_expiration: Optional[int] = 600,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        compress_threshold: int = 1024,
+        lock_wakeups: Optional[LockWakeups] = None,
+        lock_wait_strategy: Optional[WaitStrategy] = None,
+        invalidation_bus: Optional[InvalidationBus] = None,
     ) -> None:
         self._sync_client = sync_client
         self._async_client = async_client
@@ -31,44 +77,281 @@ class CachifyClient:
         self.default_expiration = default_expiration
         self.default_cache_ttl = default_cache_ttl
         self.lock_poll_interval = lock_poll_interval
+        self.lock_wait_strategy: WaitStrategy = (
+            lock_wait_strategy if lock_wait_strategy is not None else FixedWait(lock_poll_interval)
+        )
+        # releases in this process always wake local lock waiters, a transport is needed to reach other processes
+        self.lock_wakeups = lock_wakeups if lock_wakeups is not None else LockWakeups()
         self.default_pool_slot_expiration = default_pool_slot_expiration
+        # cached values written or deleted here are evicted from the L1 tiers of other processes
+        self.invalidation_bus = invalidation_bus
+        self.serializer: Serializer = serializer if serializer is not None else PickleSerializer()
+        self._compression = CompressionLayer(compressor, compress_threshold) if compressor is not None else None
+        # in-process backends can hold out-of-band buffers by reference instead of a single framed payload
+        self._sync_in_memory = isinstance(sync_client, MemoryCache)
+        self._async_in_memory = isinstance(async_client, AsyncWrapper)
+        # object store mode: values are kept as they are, reads only go through the optional copier
+        self._sync_objects = isinstance(sync_client, MemoryCache) and sync_client.store_objects
+        self._async_objects = isinstance(async_client, AsyncWrapper) and async_client.store_objects
+        self._sync_copier = sync_client.copier if isinstance(sync_client, MemoryCache) else None
+        self._async_copier = async_client.copier if isinstance(async_client, AsyncWrapper) else None
+        # optional batch capabilities of the backends (redis-py style), the batch methods loop over keys without them
+        self._sync_mget: Optional[Callable[[list[str]], list[Optional[Any]]]] = getattr(sync_client, 'mget', None)
+        self._sync_pipeline: Optional[Callable[..., SyncPipeline]] = getattr(sync_client, 'pipeline', None)
+        self._async_mget: Optional[Callable[[list[str]], Awaitable[list[Optional[Any]]]]] = getattr(
+            async_client, 'mget', None
+        )
+        self._async_pipeline: Optional[Callable[..., AsyncPipeline]] = getattr(async_client, 'pipeline', None)
+        # atomic owner checks of locks: client methods, redis-py scripts or a non-atomic get + write fallback
+        self._sync_compare_and_delete, self._sync_compare_and_expire = sync_lock_ops(sync_client)
+        self._async_compare_and_delete, self._async_compare_and_expire = async_lock_ops(async_client)
+        self._sync_incr, self._async_incr = sync_incr(sync_client), async_incr(async_client)
+        self._batch_loaders: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[float, AsyncBatchLoader]] = (
+            weakref.WeakKeyDictionary()
+        )
 
-    def set(self, key: str, val: Any, ttl: Union[int, None] = None) -> Any:
-        _ = self._sync_client.set(f'{self._prefix}{key}', pickle.dumps(val), ex=ttl, nx=False)
-
-    def get(self, key: str) -> Any:
-        return (val := self._sync_client.get(f'{self._prefix}{key}')) and pickle.loads(val)
+    def _dumps(self, val: Any, serializer: Optional[Serializer], in_memory: bool) -> Union[bytes, OutOfBandPayload]:
+        if serializer is None:
+            serializer = _INTERNAL_SERIALIZER
+        elif in_memory and isinstance(serializer, OutOfBandPickleSerializer):
+            return serializer.dumps_parts(val)
+
+        payload = serializer.dumps(val)
+        if self._compression is None:
+            return payload
+        return self._compression.encode(payload)
+
+    def _loads(self, payload: Any, serializer: Optional[Serializer]) -> Any:
+        if isinstance(payload, OutOfBandPayload):
+            return pickle.loads(payload.head, buffers=payload.buffers)
+        if self._compression is not None:
+            payload = self._compression.decode(payload)
+        return (_INTERNAL_SERIALIZER if serializer is None else serializer).loads(payload)
+
+    @staticmethod
+    def _copy(val: Any, copier: Optional[Callable[[Any], Any]]) -> Any:
+        if copier is None:
+            return val
+        if isinstance(val, CacheEntry):
+            # copy the cached value itself, a shallow copier would otherwise only copy the envelope
+            return val._replace(value=copier(val.value))
+        return copier(val)
+
+    def _sync_encode(self, val: Any, serializer: Optional[Serializer]) -> Any:
+        return val if self._sync_objects else self._dumps(val, serializer, self._sync_in_memory)
+
+    def _sync_decode(self, val: Any, serializer: Optional[Serializer]) -> Any:
+        return self._copy(val, self._sync_copier) if self._sync_objects else self._loads(val, serializer)
+
+    def _async_encode(self, val: Any, serializer: Optional[Serializer]) -> Any:
+        return val if self._async_objects else self._dumps(val, serializer, self._async_in_memory)
+
+    def _async_decode(self, val: Any, serializer: Optional[Serializer]) -> Any:
+        return self._copy(val, self._async_copier) if self._async_objects else self._loads(val, serializer)
+
+    def _invalidate(self, keys: Iterable[str]) -> None:
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(
+                name for name in (f'{self._prefix}{key}' for key in keys) if is_cached_value_key(name)
+            )
+
+    def set(self, key: str, val: Any, ttl: Union[int, None] = None, serializer: Optional[Serializer] = None) -> Any:
+        _ = self._sync_client.set(f'{self._prefix}{key}', self._sync_encode(val, serializer), ex=ttl, nx=False)
+        self._invalidate((key,))
+
+    def get(self, key: str, serializer: Optional[Serializer] = None) -> Any:
+        if (val := self._sync_client.get(f'{self._prefix}{key}')) is None:
+            return None
+        return self._sync_decode(val, serializer)
 
     def delete(self, key: str) -> Any:
-        return self._sync_client.delete(f'{self._prefix}{key}')
+        res = self._sync_client.delete(f'{self._prefix}{key}')
+        self._invalidate((key,))
+        return res
 
-    def try_acquire_lock(self, key: str, ttl: Optional[int]) -> bool:
+    def get_many(self, keys: Sequence[str], serializer: Optional[Serializer] = None) -> dict[str, Any]:
+        """
+        Returns the found values by key, missing keys are left out. Uses a single `mget` if the client has one.
+        """
+        if not keys:
+            return {}
+
+        names = [f'{self._prefix}{key}' for key in keys]
+        if self._sync_mget is not None:
+            payloads = self._sync_mget(names)
+        else:
+            payloads = [self._sync_client.get(name) for name in names]
+
+        return {key: self._sync_decode(val, serializer) for key, val in zip(keys, payloads) if val is not None}
+
+    def set_many(
+        self,
+        mapping: Mapping[str, Any],
+        ttl: Union[Optional[int], Mapping[str, Optional[int]]] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> None:
+        """
+        Sets all values, `ttl` is either shared or given per key. Uses a non-transactional `pipeline` if the client
+        has one, so the whole batch costs a single round trip.
+        """
+        items = [
+            (f'{self._prefix}{key}', self._sync_encode(val, serializer), _ttl_for(key, ttl))
+            for key, val in mapping.items()
+        ]
+        if not items:
+            return
+
+        if self._sync_pipeline is None:
+            for name, payload, ex in items:
+                _ = self._sync_client.set(name, payload, ex=ex, nx=False)
+        else:
+            pipe = self._sync_pipeline(transaction=False)
+            for name, payload, ex in items:
+                _ = pipe.set(name, payload, ex=ex)
+            _ = pipe.execute()
+        self._invalidate(mapping)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        if keys:
+            _ = self._sync_client.delete(*(f'{self._prefix}{key}' for key in keys))
+            self._invalidate(keys)
+
+    def try_acquire_lock(self, key: str, ttl: Optional[int], token: Optional[str] = None) -> bool:
         """
         Returns True if the lock was acquired, False if it is already held.
         """
         name = f'{self._prefix}{key}'
-        payload = pickle.dumps(1)
-        res = self._sync_client.set(name, payload, ex=ttl, nx=True)
+        res = self._sync_client.set(name, _lock_payload(token), ex=ttl, nx=True)
         return bool(res)
 
-    async def a_get(self, key: str) -> Any:
-        return (val := await self._async_client.get(f'{self._prefix}{key}')) and pickle.loads(val)
+    def release_lock(self, key: str, token: Optional[str] = None) -> bool:
+        """
+        Releases the lock if it is held by `token` (unconditionally without one), returns whether it was released.
+        """
+        name = f'{self._prefix}{key}'
+        if token is None:
+            _ = self._sync_client.delete(name)
+        elif not self._sync_compare_and_delete(name, _lock_payload(token)):
+            return False
+
+        self.lock_wakeups.notify(name)
+        return True
+
+    def extend_lock(self, key: str, token: str, ttl: int) -> bool:
+        """
+        Makes the lock expire in `ttl` seconds if it is still held by `token`, returns whether it was extended.
+        """
+        return self._sync_compare_and_expire(f'{self._prefix}{key}', _lock_payload(token), ttl)
 
-    async def a_set(self, key: str, val: Any, ttl: Union[int, None] = None) -> Any:
-        await self._async_client.set(f'{self._prefix}{key}', pickle.dumps(val), ex=ttl, nx=False)
+    def fence_lock(self, key: str, token: str) -> Optional[int]:
+        """
+        Returns the next fencing token of the lock held by `token`, None if the lock is not held by it anymore.
+
+        The counter is incremented after the lock was acquired and the ownership is checked afterwards,
+        so a holder that keeps its token incremented the counter before any later holder could acquire the lock.
+        The counter is stored without a TTL: it has to stay monotonic, so it is never expired or reset.
+        """
+        fencing_token = self._sync_incr(f'{self._prefix}{key}-fence')
+        if self._sync_client.get(f'{self._prefix}{key}') != _lock_payload(token):
+            return None
+        return fencing_token
+
+    def watch_lock(self, key: str) -> LockWatch:
+        return self.lock_wakeups.watch(f'{self._prefix}{key}')
+
+    async def a_get(self, key: str, serializer: Optional[Serializer] = None) -> Any:
+        if (val := await self._async_client.get(f'{self._prefix}{key}')) is None:
+            return None
+        return self._async_decode(val, serializer)
+
+    async def a_set(
+        self, key: str, val: Any, ttl: Union[int, None] = None, serializer: Optional[Serializer] = None
+    ) -> Any:
+        await self._async_client.set(f'{self._prefix}{key}', self._async_encode(val, serializer), ex=ttl, nx=False)
+        self._invalidate((key,))
 
     async def a_delete(self, key: str) -> Any:
-        return await self._async_client.delete(f'{self._prefix}{key}')
+        res = await self._async_client.delete(f'{self._prefix}{key}')
+        self._invalidate((key,))
+        return res
+
+    async def _a_fetch_payloads(self, keys: Sequence[str]) -> list[Optional[Any]]:
+        names = [f'{self._prefix}{key}' for key in keys]
+        if self._async_mget is not None:
+            return await self._async_mget(names)
+        return [await self._async_client.get(name) for name in names]
+
+    async def _a_store_payloads(self, items: Sequence[tuple[str, Any, Optional[int]]]) -> None:
+        if self._async_pipeline is None:
+            for key, payload, ex in items:
+                await self._async_client.set(f'{self._prefix}{key}', payload, ex=ex, nx=False)
+        else:
+            pipe = self._async_pipeline(transaction=False)
+            for key, payload, ex in items:
+                _ = pipe.set(f'{self._prefix}{key}', payload, ex=ex)
+            _ = await pipe.execute()
+        self._invalidate(key for key, _, _ in items)
+
+    async def a_get_many(self, keys: Sequence[str], serializer: Optional[Serializer] = None) -> dict[str, Any]:
+        if not keys:
+            return {}
+
+        payloads = await self._a_fetch_payloads(keys)
+        return {key: self._async_decode(val, serializer) for key, val in zip(keys, payloads) if val is not None}
+
+    async def a_set_many(
+        self,
+        mapping: Mapping[str, Any],
+        ttl: Union[Optional[int], Mapping[str, Optional[int]]] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> None:
+        items = [(key, self._async_encode(val, serializer), _ttl_for(key, ttl)) for key, val in mapping.items()]
+        if items:
+            await self._a_store_payloads(items)
 
-    async def a_try_acquire_lock(self, key: str, ttl: Optional[int]) -> bool:
+    async def a_delete_many(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self._async_client.delete(*(f'{self._prefix}{key}' for key in keys))
+            self._invalidate(keys)
+
+    def a_batch_loader(self, window: float) -> AsyncBatchLoader:
+        """
+        Returns the loader batching async reads and writes of the running event loop within `window` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        if (loaders := self._batch_loaders.get(loop)) is None:
+            loaders = self._batch_loaders[loop] = {}
+        if (loader := loaders.get(window)) is None:
+            loader = loaders[window] = AsyncBatchLoader(self, window)
+        return loader
+
+    async def a_try_acquire_lock(self, key: str, ttl: Optional[int], token: Optional[str] = None) -> bool:
         """
         Returns True if the lock was acquired, False if it is already held.
         """
         name = f'{self._prefix}{key}'
-        payload = pickle.dumps(1)
-        res = await self._async_client.set(name, payload, ex=ttl, nx=True)
+        res = await self._async_client.set(name, _lock_payload(token), ex=ttl, nx=True)
         return bool(res)
 
+    async def a_release_lock(self, key: str, token: Optional[str] = None) -> bool:
+        name = f'{self._prefix}{key}'
+        if token is None:
+            _ = await self._async_client.delete(name)
+        elif not await self._async_compare_and_delete(name, _lock_payload(token)):
+            return False
+
+        await self.lock_wakeups.a_notify(name)
+        return True
+
+    async def a_extend_lock(self, key: str, token: str, ttl: int) -> bool:
+        return await self._async_compare_and_expire(f'{self._prefix}{key}', _lock_payload(token), ttl)
+
+    async def a_fence_lock(self, key: str, token: str) -> Optional[int]:
+        fencing_token = await self._async_incr(f'{self._prefix}{key}-fence')
+        if await self._async_client.get(f'{self._prefix}{key}') != _lock_payload(token):
+            return None
+        return fencing_token
+
 
 _cachify: Optional['CachifyClient'] = None
 
@@ -91,6 +374,12 @@ class Cachify:
         default_cache_ttl: Optional[int],
         lock_poll_interval: float = 0.1,
         default_pool_slot_expiration: Optional[int] = 600,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        compress_threshold: int = 1024,
+        lock_wakeups: Optional[LockWakeups] = None,
+        lock_wait_strategy: Optional[WaitStrategy] = None,
+        invalidation_bus: Optional[InvalidationBus] = None,
     ) -> None:
         self._client = CachifyClient(
             sync_client=sync_client,
@@ -100,6 +389,12 @@ class Cachify:
             prefix=prefix,
             lock_poll_interval=lock_poll_interval,
             default_pool_slot_expiration=default_pool_slot_expiration,
+            serializer=serializer,
+            compressor=compressor,
+            compress_threshold=compress_threshold,
+            lock_wakeups=lock_wakeups,
+            lock_wait_strategy=lock_wait_strategy,
+            invalidation_bus=invalidation_bus,
         )
 
     def cached(
@@ -107,6 +402,14 @@ class Cachify:
         key: str,
         ttl: Union[Optional[int], UnsetType] = UNSET,
         enc_dec: Union[tuple[Encoder, Decoder], None] = None,
+        stampede: Optional['StampedeMode'] = None,
+        lease_ttl: int = 10,
+        soft_ttl: Optional[int] = None,
+        early_recompute: Optional[float] = None,
+        cache_none: bool = False,
+        none_ttl: Union[Optional[int], UnsetType] = UNSET,
+        serializer: Optional[Serializer] = None,
+        batch_window: Optional[float] = None,
     ) -> WrappedFunctionReset:
         """
         Decorator that caches the result of a function based on the specified key, time-to-live (ttl),
@@ -120,6 +423,27 @@ class Cachify:
         enc_dec (Union[Tuple[Encoder, Decoder], None], optional): The encoding and decoding functions for
           the cached value.
             Defaults to None.
+        stampede (Optional[Literal['lease']], optional): Cross-process stampede protection mode.
+            If 'lease', the first process that misses takes a short recompute lease in the backend and
+            the others wait for the value to appear instead of recomputing it. Defaults to None (disabled).
+        lease_ttl (int, optional): The time-to-live in seconds of the recompute lease. Defaults to 10.
+        soft_ttl (Optional[int], optional): The time in seconds after which a cached result is considered stale.
+            Stale results are still returned immediately while a single background refresh recomputes them,
+            `ttl` remains the hard expiration in the backend. Defaults to None (disabled).
+        early_recompute (Optional[float], optional): The beta factor of probabilistic early expiration (XFetch).
+            When set, each read may recompute the result before `ttl` runs out, with a probability growing
+            as the expiration approaches and with how long the computation took. 1.0 is a good default,
+            larger values recompute earlier. Defaults to None (disabled).
+        cache_none (bool, optional): If True, `None` results are cached as well (negative caching),
+            instead of being recomputed on every call. Defaults to False.
+        none_ttl (Union[int, None, UnsetType], optional): The time-to-live for cached `None` results.
+            If UNSET (default), the same ttl as for the other results is used.
+        serializer (Optional[Serializer], optional): The serializer for the cached values of this function.
+            Defaults to None, meaning the serializer of this Cachify instance is used.
+        batch_window (Optional[float], optional): Async functions only, enables automatic batching of cache reads
+            and writes: the ones issued within `batch_window` seconds (0 - within the same event loop iteration)
+            by any function using the same window and client are sent as a single multi-get and a single multi-set.
+            Defaults to None (disabled). Setting it on a sync function raises ValueError.
 
         Returns:
         WrappedFunctionReset: Either a synchronous or asynchronous function with reset method attached to it,
@@ -128,7 +452,60 @@ class Cachify:
         """
         from ._cached import _cached_impl  # pyright: ignore[reportPrivateUsage]
 
-        return _cached_impl(key=key, ttl=ttl, enc_dec=enc_dec, client_provider=lambda: self._client)
+        return _cached_impl(
+            key=key,
+            ttl=ttl,
+            enc_dec=enc_dec,
+            stampede=stampede,
+            lease_ttl=lease_ttl,
+            soft_ttl=soft_ttl,
+            early_recompute=early_recompute,
+            cache_none=cache_none,
+            none_ttl=none_ttl,
+            serializer=serializer,
+            batch_window=batch_window,
+            client_provider=lambda: self._client,
+        )
+
+    def cached_batch(
+        self,
+        key: str,
+        ids_arg: Optional[str] = None,
+        ttl: Union[Optional[int], UnsetType] = UNSET,
+        enc_dec: Union[tuple[Encoder, Decoder], None] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> WrappedFunctionReset:
+        """
+        Decorator that caches the results of a batch function (one taking a collection of IDs and returning
+            a mapping of ID to result) per element, so calls with overlapping ID lists share cached entries.
+
+        Args:
+        key (str): The per-element key format string, it must reference the IDs argument,
+            which is substituted by a single ID (i.e. 'user-{ids}' for `def load_users(ids: list[int])`).
+        ids_arg (Optional[str], optional): The name of the argument holding the IDs.
+            Defaults to None, meaning the first argument of the function.
+        ttl (Union[int, None, UnsetType], optional): The time-to-live for the cached results.
+            If UNSET (default), default_cache_ttl from cachify client is used.
+            If None, means indefinitely.
+        enc_dec (Union[Tuple[Encoder, Decoder], None], optional): The encoding and decoding functions for
+            every cached result. Defaults to None.
+        serializer (Optional[Serializer], optional): The serializer for the cached results of this function.
+            Defaults to None, meaning the serializer of this Cachify instance is used.
+
+        Returns:
+        WrappedFunctionReset: Either a synchronous or asynchronous function with reset method attached to it.
+        reset(*args, **kwargs) accepts the same arguments as the function and deletes the entries of the given IDs.
+        """
+        from ._cached_batch import _cached_batch_impl  # pyright: ignore[reportPrivateUsage]
+
+        return _cached_batch_impl(
+            key=key,
+            ids_arg=ids_arg,
+            ttl=ttl,
+            enc_dec=enc_dec,
+            serializer=serializer,
+            client_provider=lambda: self._client,
+        )
 
     def lock(
         self,
@@ -136,6 +513,10 @@ class Cachify:
         nowait: bool = True,
         timeout: Optional[Union[int, float]] = None,
         exp: Union[Optional[int], UnsetType] = UNSET,
+        wait_strategy: Optional[WaitStrategy] = None,
+        watchdog: bool = False,
+        fencing: bool = False,
+        reentrant: bool = False,
     ) -> '_lock_cls':
         """
         Class to manage locking mechanism for synchronous and asynchronous functions.
@@ -147,6 +528,15 @@ class Cachify:
             Defaults to None.
         exp (Union[int, None], optional): The expiration time for the lock.
             Defaults to UNSET and global value from cachify is used in that case.
+        wait_strategy (Optional[WaitStrategy], optional): How long to wait between acquisition attempts
+            if nowait is False. Defaults to None and `lock_wait_strategy` of this instance is used in that case.
+        watchdog (bool, optional): If True, the expiration of the held lock is extended in the background
+            (every third of `exp`) until it is released. Defaults to False.
+        fencing (bool, optional): If True, every acquisition gets a fencing token (`fencing_token`)
+            greater than the ones of all previous holders of the lock. Defaults to False.
+        reentrant (bool, optional): If True, acquiring a key this task (or thread) already holds through
+            a reentrant lock only increments a hold count, and only the outermost release releases the lock.
+            Defaults to False.
 
         Methods:
         __enter__: Acquire a lock for the specified key, synchronous.
@@ -163,13 +553,24 @@ class Cachify:
         """
         from ._lock import lock as _lock
 
-        lk = _lock(key=key, nowait=nowait, timeout=timeout, exp=exp)
+        lk = _lock(
+            key=key,
+            nowait=nowait,
+            timeout=timeout,
+            exp=exp,
+            wait_strategy=wait_strategy,
+            watchdog=watchdog,
+            fencing=fencing,
+            reentrant=reentrant,
+        )
 
         lk._cachify = self._client  # pyright: ignore[reportPrivateUsage]
 
         return lk
 
-    def once(self, key: str, raise_on_locked: bool = False, return_on_locked: Any = None) -> WrappedFunctionLock:
+    def once(
+        self, key: str, raise_on_locked: bool = False, return_on_locked: Any = None, reentrant: bool = False
+    ) -> WrappedFunctionLock:
         """
         Decorator that ensures a function is only called once at a time,
             based on a specified key (could be a format string).
@@ -181,6 +582,8 @@ class Cachify:
             Defaults to False.
         return_on_locked (Any, optional): The value to return when the function is already locked.
             Defaults to None.
+        reentrant (bool, optional): If True, a call made while the same task (or thread) already holds the key
+            runs instead of being treated as locked. Defaults to False.
 
         Returns:
         SyncOrAsyncRelease: Either a synchronous or asynchronous wrapped function with `release` and `is_locked`
@@ -193,6 +596,7 @@ class Cachify:
             raise_on_locked=raise_on_locked,
             return_on_locked=return_on_locked,
             client_provider=lambda: self._client,
+            reentrant=reentrant,
         )
 
     def pool(
@@ -200,6 +604,7 @@ class Cachify:
         key: str,
         max_size: int,
         slot_exp: Union[Optional[int], UnsetType] = UNSET,
+        lock_wait_strategy: Optional[WaitStrategy] = None,
     ) -> '_pool_cls':
         """
         Create a pool instance to manage concurrent execution slots with a maximum size.
@@ -212,6 +617,8 @@ class Cachify:
         max_size (int): Maximum number of concurrent slots in the pool.
         slot_exp (Union[int, None, UnsetType], optional): TTL for pool slots in seconds.
             Defaults to UNSET and uses default_pool_slot_expiration from cachify.
+        lock_wait_strategy (Optional[WaitStrategy], optional): How long to wait for the pool's meta-lock
+            between acquisition attempts. Defaults to None and uses lock_wait_strategy from cachify.
 
         Returns:
         pool: A pool instance that can be used as a context manager.
@@ -229,7 +636,7 @@ class Cachify:
         """
         from ._pool import pool as _pool
 
-        pl = _pool(key=key, max_size=max_size, slot_exp=slot_exp)
+        pl = _pool(key=key, max_size=max_size, slot_exp=slot_exp, lock_wait_strategy=lock_wait_strategy)
 
         pl._cachify = self._client  # pyright: ignore[reportPrivateUsage]
 
@@ -242,6 +649,7 @@ class Cachify:
         on_full: Any = None,
         raise_on_full: bool = False,
         slot_exp: Union[Optional[int], UnsetType] = UNSET,
+        lock_wait_strategy: Optional[WaitStrategy] = None,
     ) -> 'WrappedFunctionPool':
         """
         Decorator factory for pooled functions.
@@ -258,6 +666,8 @@ class Cachify:
                 Defaults to False.
             slot_exp (Union[int, None, UnsetType], optional): TTL for pool slots in seconds.
                 Defaults to UNSET and uses default_pool_slot_expiration from cachify.
+            lock_wait_strategy (Optional[WaitStrategy], optional): How long to wait for the pool's meta-lock
+                between acquisition attempts. Defaults to None and uses lock_wait_strategy from cachify.
 
         Returns:
             WrappedFunctionPool: A decorator that wraps functions with pool acquisition.
@@ -276,10 +686,102 @@ class Cachify:
             on_full=on_full,
             raise_on_full=raise_on_full,
             slot_exp=slot_exp,
+            lock_wait_strategy=lock_wait_strategy,
             pool_instance=None,
             client_provider=lambda: self._client,
         )
 
+    def _resolve_many_ttl(
+        self, keys: Iterable[str], ttl: Union[Optional[int], Mapping[str, Optional[int]], UnsetType]
+    ) -> Union[Optional[int], dict[str, Optional[int]]]:
+        default = self._client.default_cache_ttl
+        if isinstance(ttl, UnsetType):
+            return default
+        if isinstance(ttl, Mapping):
+            return {key: ttl.get(key, default) for key in keys}
+        return ttl
+
+    def get_many(self, keys: Iterable[str], serializer: Optional[Serializer] = None) -> dict[str, Any]:
+        """
+        Get the values of multiple keys at once.
+
+        Args:
+        keys (Iterable[str]): The keys to read.
+        serializer (Optional[Serializer], optional): The serializer the values were stored with.
+            Defaults to None, meaning the serializer of this Cachify instance is used.
+
+        Returns:
+        dict[str, Any]: The found values by key, keys that are missing (or expired) are left out.
+            Uses a single `mget` call when the client supports it.
+        """
+        return self._client.get_many(
+            list(keys), serializer=self._client.serializer if serializer is None else serializer
+        )
+
+    def set_many(
+        self,
+        mapping: Mapping[str, Any],
+        ttl: Union[Optional[int], Mapping[str, Optional[int]], UnsetType] = UNSET,
+        serializer: Optional[Serializer] = None,
+    ) -> None:
+        """
+        Set multiple values at once.
+
+        Args:
+        mapping (Mapping[str, Any]): The values to store by key.
+        ttl (Union[int, None, Mapping[str, Optional[int]], UnsetType], optional): The time-to-live of the values,
+            either shared by all of them or given per key as a mapping.
+            If UNSET (default), or for keys missing from the mapping, default_cache_ttl from cachify client is used.
+            If None, means indefinitely.
+        serializer (Optional[Serializer], optional): The serializer for the values.
+            Defaults to None, meaning the serializer of this Cachify instance is used.
+
+        Uses a single non-transactional `pipeline` when the client supports it.
+        """
+        self._client.set_many(
+            mapping,
+            ttl=self._resolve_many_ttl(mapping, ttl),
+            serializer=self._client.serializer if serializer is None else serializer,
+        )
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete multiple keys with a single `delete` call.
+
+        Args:
+        keys (Iterable[str]): The keys to delete.
+        """
+        self._client.delete_many(list(keys))
+
+    async def a_get_many(self, keys: Iterable[str], serializer: Optional[Serializer] = None) -> dict[str, Any]:
+        """
+        Async version of `get_many`, uses the async client.
+        """
+        return await self._client.a_get_many(
+            list(keys), serializer=self._client.serializer if serializer is None else serializer
+        )
+
+    async def a_set_many(
+        self,
+        mapping: Mapping[str, Any],
+        ttl: Union[Optional[int], Mapping[str, Optional[int]], UnsetType] = UNSET,
+        serializer: Optional[Serializer] = None,
+    ) -> None:
+        """
+        Async version of `set_many`, uses the async client.
+        """
+        await self._client.a_set_many(
+            mapping,
+            ttl=self._resolve_many_ttl(mapping, ttl),
+            serializer=self._client.serializer if serializer is None else serializer,
+        )
+
+    async def a_delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Async version of `delete_many`, uses the async client.
+        """
+        await self._client.a_delete_many(list(keys))
+
 
 def init_cachify(
     sync_client: Optional[SyncClient] = None,
@@ -289,6 +791,12 @@ def init_cachify(
     prefix: str = 'PYC-',
     lock_poll_interval: float = 0.1,
     default_pool_slot_expiration: Optional[int] = 600,
+    serializer: Optional[Serializer] = None,
+    compressor: Optional[Compressor] = None,
+    compress_threshold: int = 1024,
+    lock_wakeups: Optional[LockWakeups] = None,
+    lock_wait_strategy: Optional[WaitStrategy] = None,
+    invalidation_bus: Optional[InvalidationBus] = None,
     *,
     is_global: bool = True,
 ) -> Cachify:
@@ -299,7 +807,8 @@ def init_cachify(
     sync_client (Union[SyncClient, MemoryCache], optional): The synchronous client to use.
         Defaults to MemoryCache().
     async_client (Union[AsyncClient, AsyncWrapper], optional): The asynchronous client to use.
-        Defaults to AsyncWrapper(cache=MemoryCache()).
+        Defaults to AsyncWrapper over the sync_client MemoryCache, or ThreadedAsyncClient(sync_client) for
+        any other sync_client.
     default_lock_expiration (Optional[int], optional): The default expiration time for locks.
         Defaults to 30.
     default_cache_ttl (Optional[int], optional): The default cache TTL (time-to-live) for cached values.
@@ -307,9 +816,25 @@ def init_cachify(
     prefix (str, optional): The prefix to use for keys.
         Defaults to 'PYC-'.
     lock_poll_interval (float, optional): The interval in seconds to wait between lock acquisition
-        attempts when polling. Defaults to 0.1.
+        attempts when polling. Defaults to 0.1. Not used when `lock_wait_strategy` is given.
     default_pool_slot_expiration (Optional[int], optional): The default TTL for pool slots in seconds.
         Defaults to 600 (10 minutes).
+    serializer (Optional[Serializer], optional): The serializer used for cached values.
+        Defaults to None, meaning PickleSerializer() (pickle with the highest protocol).
+        Locks and pools always use pickle internally.
+    compressor (Optional[Compressor], optional): The compressor for payloads of at least `compress_threshold` bytes,
+        e.g. ZlibCompressor() or LzmaCompressor(). Defaults to None (no compression).
+        Must be enabled in every process that reads the same keys.
+    compress_threshold (int, optional): The minimal payload size in bytes to compress. Defaults to 1024.
+    lock_wakeups (Optional[LockWakeups], optional): The channel waking lock waiters up when a lock is released.
+        Defaults to None, meaning LockWakeups() that only wakes waiters in this process; pass
+        LockWakeups(RedisPubSubTransport(...)) to wake waiters in other processes too.
+    lock_wait_strategy (Optional[WaitStrategy], optional): How long waiting locks and pools wait between
+        acquisition attempts, e.g. ExponentialJitterWait() or AdaptiveWait() for heavily contended locks.
+        Defaults to None, meaning FixedWait(lock_poll_interval).
+    invalidation_bus (Optional[InvalidationBus], optional): The bus the keys of cached values written or deleted
+        through this client are published to, so other processes evict them from their L1 tiers.
+        Defaults to None. Tiered clients given the bus publish their own writes as well.
     is_global (bool, optional): Whether to register this client as the global instance.
         Defaults to True.
     """
@@ -317,7 +842,16 @@ def init_cachify(
         sync_client = MemoryCache()
 
     if async_client is None:
-        async_client = AsyncWrapper(cache=isinstance(sync_client, MemoryCache) and sync_client or MemoryCache())
+        # a blocking backend gets its calls offloaded to threads instead of a separate in-memory cache
+        async_client = (
+            AsyncWrapper(cache=sync_client)
+            if isinstance(sync_client, MemoryCache)
+            else ThreadedAsyncClient(sync_client)
+        )
+
+    if lock_wakeups is None:
+        # shared by the global client and the returned instance, so releases through either wake all waiters
+        lock_wakeups = LockWakeups()
 
     global _cachify
     if is_global:
@@ -329,6 +863,12 @@ def init_cachify(
             prefix=prefix,
             lock_poll_interval=lock_poll_interval,
             default_pool_slot_expiration=default_pool_slot_expiration,
+            serializer=serializer,
+            compressor=compressor,
+            compress_threshold=compress_threshold,
+            lock_wakeups=lock_wakeups,
+            lock_wait_strategy=lock_wait_strategy,
+            invalidation_bus=invalidation_bus,
         )
         # is not needed, but kept to not ruin the function signature
         return Cachify(
@@ -339,6 +879,12 @@ def init_cachify(
             default_cache_ttl=default_cache_ttl,
             lock_poll_interval=lock_poll_interval,
             default_pool_slot_expiration=default_pool_slot_expiration,
+            serializer=serializer,
+            compressor=compressor,
+            compress_threshold=compress_threshold,
+            lock_wakeups=lock_wakeups,
+            lock_wait_strategy=lock_wait_strategy,
+            invalidation_bus=invalidation_bus,
         )
 
     return Cachify(
@@ -349,6 +895,12 @@ def init_cachify(
         default_cache_ttl=default_cache_ttl,
         lock_poll_interval=lock_poll_interval,
         default_pool_slot_expiration=default_pool_slot_expiration,
+        serializer=serializer,
+        compressor=compressor,
+        compress_threshold=compress_threshold,
+        lock_wakeups=lock_wakeups,
+        lock_wait_strategy=lock_wait_strategy,
+        invalidation_bus=invalidation_bus,
     )
 
 
@@ -1,17 +1,22 @@
+import asyncio
+import contextvars
 import inspect
+import threading
 import time
-from asyncio import sleep as asleep
-from collections.abc import Awaitable
+import uuid
+from collections.abc import Awaitable, Iterator
 from functools import partial, wraps
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union, cast
 
 from typing_extensions import ParamSpec, Self, final, overload, override
 
 from ._exceptions import CachifyLockError
-from ._helpers import a_reset, get_full_key_from_signature, is_alocked, is_coroutine, is_locked, reset
+from ._helpers import KeyTemplate, a_reset, is_alocked, is_coroutine, is_locked, reset
 from ._lib import get_cachify_client
+from ._lock_wakeups import LockWatch
+from ._lock_watchdog import AsyncLockWatchdog, LockWatchdog
 from ._logger import logger
-from ._types._common import UNSET, LockProtocolBase, UnsetType
+from ._types._common import UNSET, LockAcquisition, LockProtocolBase, UnsetType, WaitStrategy
 from ._types._lock_wrap import AsyncLockWrappedF, SyncLockWrappedF, WrappedFunctionLock
 
 
@@ -23,33 +28,96 @@ _R = TypeVar('_R', covariant=True)
 _P = ParamSpec('_P')
 _S = TypeVar('_S')
 
+# (owner, depth) of every reentrant lock held in this context, by client and key; replaced on every change,
+# so contexts copied into new tasks and threads never change the holds of the context they were copied from
+_reentrant_holds: contextvars.ContextVar[Optional[dict[tuple['CachifyClient', str], tuple[object, int]]]] = (
+    contextvars.ContextVar('py_cachify_reentrant_holds', default=None)
+)
+
+
+# acquisitions of every lock instance held in this context (innermost last), replaced on every change as well;
+# a lock shared between threads or tasks so only ever releases and extends its own acquisition there
+_acquisitions: contextvars.ContextVar[Optional[dict[object, tuple[LockAcquisition, ...]]]] = contextvars.ContextVar(
+    'py_cachify_lock_acquisitions', default=None
+)
+
+
+def _close_delays(delays: Iterator[float]) -> None:
+    # generators (e.g. AdaptiveWait's) run their cleanup right away instead of whenever they are collected
+    close: Optional[Callable[[], None]] = getattr(delays, 'close', None)
+    if close is not None:
+        close()
+
+
+def _current_owner() -> object:
+    # the running task, or the thread outside of an event loop; tasks inherit the holds of the context that
+    # created them, but are different owners and acquire the lock again
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task if task is not None else threading.get_ident()
+
 
 class AsyncLockMethods(LockProtocolBase):
     async def is_alocked(self) -> bool:
         return bool(await self._cachify.a_get(key=self._key))
 
     async def _a_acquire(self, key: str) -> None:
+        if self._reenter():
+            return
+
         stop_at = self._calc_stop_at()
         c = 10
-        poll_interval = self._cachify.lock_poll_interval
-
-        while True:
-            acquired = await self._cachify.a_try_acquire_lock(key=self._key, ttl=self._get_ttl())
-            if acquired:
-                return
-
-            self._raise_if_cached(
-                is_already_cached=True,
-                key=key,
-                do_raise=self._nowait or time.time() > stop_at,
-                do_log=bool(c >= 10),
-            )
-
-            await asleep(poll_interval)
-            c += 1 if c < 10 else -10
+        ttl = self._get_ttl()
+        token = uuid.uuid4().hex
+        fencing_token: Optional[int] = None
+        watch: Optional[LockWatch] = None
+        delays: Iterator[float] = iter(())
+
+        try:
+            while True:
+                acquired = await self._cachify.a_try_acquire_lock(key=self._key, ttl=ttl, token=token)
+                if acquired and self._fencing:
+                    fencing_token = await self._cachify.a_fence_lock(key=self._key, token=token)
+                    # None if the lock expired right after it was acquired, the attempt counts as a failed one
+                    acquired = fencing_token is not None
+                if acquired:
+                    watchdog = None
+                    if self._watchdog and ttl is not None:
+                        watchdog = AsyncLockWatchdog(self._cachify, self._key, token, ttl)
+                    self._take_ownership(LockAcquisition(token, time.monotonic(), fencing_token, watchdog))
+                    self._hold()
+                    return
+
+                self._raise_if_cached(
+                    is_already_cached=True,
+                    key=key,
+                    do_raise=self._nowait or time.time() > stop_at,
+                    do_log=bool(c >= 10),
+                )
+                if watch is None:
+                    # a release right before the watch started would go unnoticed, so retry once right away
+                    watch = self._cachify.watch_lock(key=self._key)
+                    delays = self._get_wait_strategy().delays(self._key)
+                    continue
+
+                _ = await watch.a_wait(next(delays))
+                c += 1 if c < 10 else -10
+        finally:
+            if watch is not None:
+                watch.close()
+                _close_delays(delays)
 
     async def arelease(self) -> None:
-        await self._cachify.a_delete(key=self._key)
+        if self._exit_reentered():
+            return
+
+        acquisition = self._give_up_ownership()
+        token = acquisition.token if acquisition is not None else None
+        if not await self._cachify.a_release_lock(key=self._key, token=token):
+            self._warn_lost()
+        self._record_hold(acquisition)
 
     async def __aenter__(self) -> 'Self':
         await self._a_acquire(key=self._key)
@@ -64,26 +132,59 @@ class SyncLockMethods(LockProtocolBase):
         return bool(self._cachify.get(key=self._key))
 
     def _acquire(self, key: str) -> None:
+        if self._reenter():
+            return
+
         stop_at = self._calc_stop_at()
         c = 10
-        poll_interval = self._cachify.lock_poll_interval
-
-        while True:
-            acquired = self._cachify.try_acquire_lock(key=self._key, ttl=self._get_ttl())
-            if acquired:
-                return
-
-            self._raise_if_cached(
-                is_already_cached=True,
-                key=key,
-                do_raise=self._nowait or time.time() > stop_at,
-                do_log=bool(c >= 10),
-            )
-            time.sleep(poll_interval)
-            c += 1 if c < 10 else -10
+        ttl = self._get_ttl()
+        token = uuid.uuid4().hex
+        fencing_token: Optional[int] = None
+        watch: Optional[LockWatch] = None
+        delays: Iterator[float] = iter(())
+
+        try:
+            while True:
+                acquired = self._cachify.try_acquire_lock(key=self._key, ttl=ttl, token=token)
+                if acquired and self._fencing:
+                    fencing_token = self._cachify.fence_lock(key=self._key, token=token)
+                    # None if the lock expired right after it was acquired, the attempt counts as a failed one
+                    acquired = fencing_token is not None
+                if acquired:
+                    watchdog = None
+                    if self._watchdog and ttl is not None:
+                        watchdog = LockWatchdog(self._cachify, self._key, token, ttl)
+                    self._take_ownership(LockAcquisition(token, time.monotonic(), fencing_token, watchdog))
+                    self._hold()
+                    return
+
+                self._raise_if_cached(
+                    is_already_cached=True,
+                    key=key,
+                    do_raise=self._nowait or time.time() > stop_at,
+                    do_log=bool(c >= 10),
+                )
+                if watch is None:
+                    watch = self._cachify.watch_lock(key=self._key)
+                    delays = self._get_wait_strategy().delays(self._key)
+                    continue
+
+                _ = watch.wait(next(delays))
+                c += 1 if c < 10 else -10
+        finally:
+            if watch is not None:
+                watch.close()
+                _close_delays(delays)
 
     def release(self) -> None:
-        self._cachify.delete(key=self._key)
+        if self._exit_reentered():
+            return
+
+        acquisition = self._give_up_ownership()
+        token = acquisition.token if acquisition is not None else None
+        if not self._cachify.release_lock(key=self._key, token=token):
+            self._warn_lost()
+        self._record_hold(acquisition)
 
     def __enter__(self) -> 'Self':
         self._acquire(key=self._key)
@@ -105,6 +206,20 @@ class lock(AsyncLockMethods, SyncLockMethods):
         Defaults to None.
     exp (Union[int, None], optional): The expiration time for the lock.
         Defaults to UNSET and global value from cachify is used in that case.
+    wait_strategy (Optional[WaitStrategy], optional): How long to wait between acquisition attempts
+        if nowait is False. Defaults to None and `lock_wait_strategy` from cachify is used in that case.
+    watchdog (bool, optional): If True, the expiration of the held lock is extended in the background
+        (every third of `exp`) until it is released, so a short `exp` only matters once the holder dies.
+        Defaults to False.
+    fencing (bool, optional): If True, every acquisition gets a fencing token (`fencing_token`) from a counter
+        in the cache, greater than the tokens of all previous holders. Pass it along with writes to downstream
+        storages so they can reject writes of a holder whose lock already expired. Defaults to False.
+    reentrant (bool, optional): If True, acquiring a key this task (or thread) already holds through
+        a reentrant lock only increments a hold count, without calling the cache, and only the outermost release
+        releases the lock. Defaults to False.
+
+    The lock stores a unique owner token and a release only deletes it while it still holds that token,
+    so a holder whose lock expired never releases the lock of the next holder.
 
     Methods:
     __enter__: Acquire a lock for the specified key, synchronous.
@@ -126,11 +241,19 @@ class lock(AsyncLockMethods, SyncLockMethods):
         nowait: bool = True,
         timeout: Optional[Union[int, float]] = None,
         exp: Union[Optional[int], UnsetType] = UNSET,
+        wait_strategy: Optional[WaitStrategy] = None,
+        watchdog: bool = False,
+        fencing: bool = False,
+        reentrant: bool = False,
     ) -> None:
         self._key = key
         self._nowait = nowait
         self._timeout = timeout
         self._exp = exp
+        self._wait_strategy = wait_strategy
+        self._watchdog = watchdog
+        self._fencing = fencing
+        self._reentrant = reentrant
         self._bound_cachify_client: Union[CachifyClient, None] = None
 
     @overload
@@ -150,20 +273,23 @@ class lock(AsyncLockMethods, SyncLockMethods):
         SyncLockWrappedF[_P, _R],
     ]:
         signature = inspect.signature(_func)
+        key_template = KeyTemplate(self._key, signature, 'lock')
 
         if is_coroutine(_func):
             _awaitable_func = _func
 
             @wraps(_awaitable_func)
             async def _async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-                bound_args = signature.bind(*args, **kwargs)
-                _key = get_full_key_from_signature(bound_args=bound_args, key=self._key, operation_postfix='lock')
+                _key = key_template(*args, **kwargs)
 
                 async with lock(
                     key=_key,
                     nowait=self._nowait,
                     timeout=self._timeout,
                     exp=self._exp,
+                    wait_strategy=self._wait_strategy,
+                    watchdog=self._watchdog,
+                    reentrant=self._reentrant,
                 ):
                     return await _awaitable_func(*args, **kwargs)
 
@@ -198,10 +324,17 @@ class lock(AsyncLockMethods, SyncLockMethods):
 
             @wraps(_sync_func)
             def _sync_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-                bound_args = signature.bind(*args, **kwargs)
-                _key = get_full_key_from_signature(bound_args=bound_args, key=self._key, operation_postfix='lock')
+                _key = key_template(*args, **kwargs)
 
-                with lock(key=_key, nowait=self._nowait, timeout=self._timeout, exp=self._exp):
+                with lock(
+                    key=_key,
+                    nowait=self._nowait,
+                    timeout=self._timeout,
+                    exp=self._exp,
+                    wait_strategy=self._wait_strategy,
+                    watchdog=self._watchdog,
+                    reentrant=self._reentrant,
+                ):
                     return _sync_func(*args, **kwargs)
 
             setattr(
@@ -231,6 +364,18 @@ class lock(AsyncLockMethods, SyncLockMethods):
 
             return cast(SyncLockWrappedF[_P, _R], cast(object, _sync_wrapper))
 
+    @property
+    def fencing_token(self) -> Optional[int]:
+        """The fencing token of the current acquisition, None while not held or created without `fencing`."""
+        acquisition = self._acquisition
+        return acquisition.fencing_token if acquisition is not None else None
+
+    @property
+    def _acquisition(self) -> Optional[LockAcquisition]:
+        # the innermost acquisition of this lock held in the current context
+        held = (_acquisitions.get() or {}).get(self, ())
+        return held[-1] if held else None
+
     @property
     @override
     def _cachify(self) -> 'CachifyClient':
@@ -254,6 +399,79 @@ class lock(AsyncLockMethods, SyncLockMethods):
     def _get_ttl(self) -> Optional[int]:
         return self._cachify.default_expiration if isinstance(self._exp, UnsetType) else self._exp
 
+    @override
+    def _get_wait_strategy(self) -> WaitStrategy:
+        return self._wait_strategy if self._wait_strategy is not None else self._cachify.lock_wait_strategy
+
+    @override
+    def _take_ownership(self, acquisition: LockAcquisition) -> None:
+        acquisitions = _acquisitions.get() or {}
+        _ = _acquisitions.set({**acquisitions, self: (*acquisitions.get(self, ()), acquisition)})
+
+    @override
+    def _give_up_ownership(self) -> Optional[LockAcquisition]:
+        acquisitions: dict[object, tuple[LockAcquisition, ...]] = _acquisitions.get() or {}
+        held = acquisitions.get(self)
+        if not held:
+            # released without being acquired in this context: an explicit, unconditional release
+            return None
+
+        *outer, acquisition = held
+        others = {lk: stack for lk, stack in acquisitions.items() if lk is not self}
+        _ = _acquisitions.set({**others, self: tuple(outer)} if outer else others)
+        if acquisition.watchdog is not None:
+            acquisition.watchdog.stop()
+        return acquisition
+
+    @override
+    def _reenter(self) -> bool:
+        if not self._reentrant:
+            return False
+
+        holds = _reentrant_holds.get() or {}
+        hold_key, owner = (self._cachify, self._key), _current_owner()
+        held_by, depth = holds.get(hold_key, (None, 0))
+        if not depth or held_by != owner:
+            return False
+
+        _ = _reentrant_holds.set({**holds, hold_key: (owner, depth + 1)})
+        return True
+
+    @override
+    def _hold(self) -> None:
+        if self._reentrant:
+            holds = _reentrant_holds.get() or {}
+            _ = _reentrant_holds.set({**holds, (self._cachify, self._key): (_current_owner(), 1)})
+
+    @override
+    def _exit_reentered(self) -> bool:
+        if not self._reentrant:
+            return False
+
+        holds = _reentrant_holds.get() or {}
+        hold_key = self._cachify, self._key
+        held_by, depth = holds.get(hold_key, (None, 0))
+        if not depth or held_by != _current_owner():
+            return False
+
+        if depth > 1:
+            _ = _reentrant_holds.set({**holds, hold_key: (held_by, depth - 1)})
+            return True
+
+        # the outermost release, it releases the lock in the cache
+        _ = _reentrant_holds.set({name: hold for name, hold in holds.items() if name != hold_key})
+        return False
+
+    @override
+    def _warn_lost(self) -> None:
+        # releasing it anyway would have deleted the lock of its current holder
+        logger.warning(f'{self._key} expired before it was released and is not held by this lock anymore')
+
+    @override
+    def _record_hold(self, acquisition: Optional[LockAcquisition]) -> None:
+        if acquisition is not None:
+            self._get_wait_strategy().record_hold(self._key, time.monotonic() - acquisition.acquired_at)
+
     @staticmethod
     @override
     def _raise_if_cached(is_already_cached: bool, key: str, do_raise: bool = True, do_log: bool = True) -> None:
@@ -269,7 +487,9 @@ class lock(AsyncLockMethods, SyncLockMethods):
             raise CachifyLockError(msg)
 
 
-def once(key: str, raise_on_locked: bool = False, return_on_locked: Any = None) -> WrappedFunctionLock:
+def once(
+    key: str, raise_on_locked: bool = False, return_on_locked: Any = None, reentrant: bool = False
+) -> WrappedFunctionLock:
     """
     Decorator that ensures a function is only called once at a time,
         based on a specified key (could be a format string).
@@ -280,12 +500,14 @@ def once(key: str, raise_on_locked: bool = False, return_on_locked: Any = None)
         Defaults to False.
     return_on_locked (Any, optional): The value to return when the function is already locked.
         Defaults to None.
+    reentrant (bool, optional): If True, a call made while the same task (or thread) already holds the key
+        runs instead of being treated as locked. Defaults to False.
 
     Returns:
     SyncOrAsyncRelease: Either a synchronous or asynchronous wrapped function with `release` and `is_locked`
         methods attached to it.
     """
-    return _once_impl(key=key, raise_on_locked=raise_on_locked, return_on_locked=return_on_locked)
+    return _once_impl(key=key, raise_on_locked=raise_on_locked, return_on_locked=return_on_locked, reentrant=reentrant)
 
 
 def _once_impl(
@@ -293,6 +515,7 @@ def _once_impl(
     raise_on_locked: bool = False,
     return_on_locked: Any = None,
     client_provider: Callable[[], 'CachifyClient'] = get_cachify_client,
+    reentrant: bool = False,
 ) -> WrappedFunctionLock:
     @overload
     def _once_inner(  # type: ignore[overload-overlap]
@@ -308,17 +531,17 @@ def _once_impl(
         _func: Union[Callable[_P, _R], Callable[_P, Awaitable[_R]]],
     ) -> Union[AsyncLockWrappedF[_P, _R], SyncLockWrappedF[_P, _R]]:
         signature = inspect.signature(_func)
+        key_template = KeyTemplate(key, signature, 'once')
 
         if is_coroutine(_func):
             _awaitable_func = _func
 
             @wraps(_awaitable_func)
             async def _async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-                bound_args = signature.bind(*args, **kwargs)
-                _key = get_full_key_from_signature(bound_args=bound_args, key=key, operation_postfix='once')
+                _key = key_template(*args, **kwargs)
 
                 try:
-                    lk = lock(key=_key)
+                    lk = lock(key=_key, reentrant=reentrant)
                     lk._cachify = client_provider()  # pyright: ignore[reportPrivateUsage]
                     async with lk:
                         return await _awaitable_func(*args, **kwargs)
@@ -360,11 +583,10 @@ def _once_impl(
 
             @wraps(_sync_func)
             def _sync_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-                bound_args = signature.bind(*args, **kwargs)
-                _key = get_full_key_from_signature(bound_args=bound_args, key=key, operation_postfix='once')
+                _key = key_template(*args, **kwargs)
 
                 try:
-                    lk = lock(key=_key)
+                    lk = lock(key=_key, reentrant=reentrant)
                     lk._cachify = client_provider()  # pyright: ignore[reportPrivateUsage]
                     with lk:
                         return _sync_func(*args, **kwargs)
@@ -0,0 +1,172 @@
+from collections.abc import Awaitable
+from typing import Any, Callable
+
+from ._logger import logger
+from ._types._common import AsyncClient, SyncClient
+
+
+# redis-py clients have no compare-and-delete command, so it runs as a script on the server
+_COMPARE_AND_DELETE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+_COMPARE_AND_EXPIRE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+CompareAndDelete = Callable[[str, bytes], bool]
+CompareAndExpire = Callable[[str, bytes, int], bool]
+AsyncCompareAndDelete = Callable[[str, bytes], Awaitable[bool]]
+AsyncCompareAndExpire = Callable[[str, bytes, int], Awaitable[bool]]
+Incr = Callable[[str], int]
+AsyncIncr = Callable[[str], Awaitable[int]]
+
+
+class _NonAtomicWarning:
+    """Logs once per client that its lock ownership checks are not atomic."""
+
+    def __init__(self, client: Any) -> None:
+        self._client_name = type(client).__name__
+        self._warned = False
+
+    def __call__(self) -> None:
+        if self._warned:
+            return
+
+        self._warned = True
+        logger.warning(
+            f'{self._client_name} has no compare_and_delete/compare_and_expire or register_script, '
+            f'lock ownership checks are not atomic and a lock may be released or extended for its next holder'
+        )
+
+
+def sync_lock_ops(client: SyncClient) -> tuple[CompareAndDelete, CompareAndExpire]:
+    """Compare-and-delete and compare-and-expire of a sync client.
+
+    Uses the client's own `compare_and_delete`/`compare_and_expire` methods, redis-py style `register_script`
+    otherwise, and falls back to a (non-atomic, logged once) read followed by a `delete` or a plain `expire`
+    for clients that have neither. Without an `expire` method the fallback never extends a lock.
+    """
+    compare_and_delete: Any = getattr(client, 'compare_and_delete', None)
+    compare_and_expire: Any = getattr(client, 'compare_and_expire', None)
+    if compare_and_delete is not None and compare_and_expire is not None:
+        return (
+            lambda name, expected: bool(compare_and_delete(name, expected)),
+            lambda name, expected, ex: bool(compare_and_expire(name, expected, ex)),
+        )
+
+    register_script: Any = getattr(client, 'register_script', None)
+    if register_script is not None:
+        delete_script, expire_script = (
+            register_script(_COMPARE_AND_DELETE_SCRIPT),
+            register_script(_COMPARE_AND_EXPIRE_SCRIPT),
+        )
+        return (
+            lambda name, expected: bool(delete_script(keys=[name], args=[expected])),
+            lambda name, expected, ex: bool(expire_script(keys=[name], args=[expected, ex])),
+        )
+
+    warn_once = _NonAtomicWarning(client)
+    expire: Any = getattr(client, 'expire', None)
+
+    def delete_if_equal(name: str, expected: bytes) -> bool:
+        warn_once()
+        if client.get(name) != expected:
+            return False
+        _ = client.delete(name)
+        return True
+
+    def expire_if_equal(name: str, expected: bytes, ex: int) -> bool:
+        warn_once()
+        # never rewrite the value: another holder may have taken the lock since it was read
+        if expire is None or client.get(name) != expected:
+            return False
+        return bool(expire(name, ex))
+
+    return delete_if_equal, expire_if_equal
+
+
+def async_lock_ops(client: AsyncClient) -> tuple[AsyncCompareAndDelete, AsyncCompareAndExpire]:
+    """Async version of `sync_lock_ops`."""
+    compare_and_delete: Any = getattr(client, 'compare_and_delete', None)
+    compare_and_expire: Any = getattr(client, 'compare_and_expire', None)
+    if compare_and_delete is not None and compare_and_expire is not None:
+
+        async def call_compare_and_delete(name: str, expected: bytes) -> bool:
+            return bool(await compare_and_delete(name, expected))
+
+        async def call_compare_and_expire(name: str, expected: bytes, ex: int) -> bool:
+            return bool(await compare_and_expire(name, expected, ex))
+
+        return call_compare_and_delete, call_compare_and_expire
+
+    register_script: Any = getattr(client, 'register_script', None)
+    if register_script is not None:
+        delete_script, expire_script = (
+            register_script(_COMPARE_AND_DELETE_SCRIPT),
+            register_script(_COMPARE_AND_EXPIRE_SCRIPT),
+        )
+
+        async def run_delete_script(name: str, expected: bytes) -> bool:
+            return bool(await delete_script(keys=[name], args=[expected]))
+
+        async def run_expire_script(name: str, expected: bytes, ex: int) -> bool:
+            return bool(await expire_script(keys=[name], args=[expected, ex]))
+
+        return run_delete_script, run_expire_script
+
+    warn_once = _NonAtomicWarning(client)
+    expire: Any = getattr(client, 'expire', None)
+
+    async def delete_if_equal(name: str, expected: bytes) -> bool:
+        warn_once()
+        if await client.get(name) != expected:
+            return False
+        _ = await client.delete(name)
+        return True
+
+    async def expire_if_equal(name: str, expected: bytes, ex: int) -> bool:
+        warn_once()
+        if expire is None or await client.get(name) != expected:
+            return False
+        return bool(await expire(name, ex))
+
+    return delete_if_equal, expire_if_equal
+
+
+def sync_incr(client: SyncClient) -> Incr:
+    """Increments a counter and returns its new value: the client's (redis-py style) `incr`, or a non-atomic
+    read followed by a write for clients without it."""
+    incr: Any = getattr(client, 'incr', None)
+    if incr is not None:
+        return lambda name: int(incr(name))
+
+    def read_and_write(name: str) -> int:
+        value = int(client.get(name) or 0) + 1
+        _ = client.set(name, value)
+        return value
+
+    return read_and_write
+
+
+def async_incr(client: AsyncClient) -> AsyncIncr:
+    """Async version of `sync_incr`."""
+    incr: Any = getattr(client, 'incr', None)
+    if incr is not None:
+
+        async def call_incr(name: str) -> int:
+            return int(await incr(name))
+
+        return call_incr
+
+    async def read_and_write(name: str) -> int:
+        value = int(await client.get(name) or 0) + 1
+        _ = await client.set(name, value)
+        return value
+
+    return read_and_write
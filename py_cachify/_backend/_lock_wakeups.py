@@ -0,0 +1,148 @@
+import asyncio
+import threading
+from typing import Any, Optional
+
+from typing_extensions import Self
+
+from ._logger import logger
+from ._types._common import InvalidationTransport
+
+
+class _Watched:
+    __slots__ = ('cond', 'generation', 'watchers')
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self.cond = threading.Condition(lock)
+        self.generation = 0
+        self.watchers = 0
+
+
+class LockWakeups:
+    """Wakes lock waiters up as soon as the lock they wait for is released, instead of at their next poll.
+
+    A release wakes a single waiter of the lock in every process, the one that can take it over; the others keep
+    following their wait strategy, so a contended lock doesn't get a burst of acquisition attempts per release.
+    Releases in this process wake the local waiters directly. With a `transport` (e.g. a RedisPubSubTransport on
+    a channel of its own) the names of released locks are broadcast too, so waiters in other processes wake up after a
+    single round trip. Waiters keep retrying on their wait strategy as a fallback for lost messages and for
+    locks that expire instead of being released.
+
+    Args:
+    transport (Optional[InvalidationTransport], optional): The transport released lock names are published to
+        and received from. Defaults to None, meaning only waiters in this process are woken up.
+    """
+
+    def __init__(self, transport: Optional[InvalidationTransport] = None) -> None:
+        self.transport = transport
+        self._lock = threading.Lock()
+        # only the names somebody in this process waits for
+        self._watched: dict[str, _Watched] = {}
+        self._async_waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]] = {}
+        self._unsubscribe = transport.subscribe(self._on_message) if transport is not None else None
+
+    def watch(self, name: str) -> 'LockWatch':
+        """Starts tracking releases of `name`, releases before this call are not reported by the returned watch."""
+        return LockWatch(self, name)
+
+    def notify(self, name: str) -> None:
+        self._wake(name)
+        if self.transport is not None:
+            self._publish(name)
+
+    async def a_notify(self, name: str) -> None:
+        self._wake(name)
+        if self.transport is not None:
+            # transports block on I/O, keep it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._publish, name)
+
+    def close(self) -> None:
+        """Stops listening to the transport."""
+        unsubscribe, self._unsubscribe = self._unsubscribe, None
+        if unsubscribe is not None:
+            unsubscribe()
+
+    def _publish(self, name: str) -> None:
+        try:
+            _ = self.transport.publish(name.encode())  # pyright: ignore[reportOptionalMemberAccess]
+        except Exception as e:
+            logger.warning(f'Broadcasting release of {name} failed: {e}')
+
+    def _on_message(self, message: bytes) -> None:
+        self._wake(message.decode())
+
+    def _wake(self, name: str) -> None:
+        with self._lock:
+            if (state := self._watched.get(name)) is None:
+                return
+            state.generation += 1
+            if (waiters := self._async_waiters.get(name)) is None:
+                state.cond.notify()
+                return
+
+            loop, fut = waiters.pop(0)
+            if not waiters:
+                del self._async_waiters[name]
+
+        _ = loop.call_soon_threadsafe(fut.set_result, None)
+
+
+class LockWatch:
+    """Tracks the releases of one lock name for a single waiter, see `LockWakeups.watch`."""
+
+    def __init__(self, wakeups: LockWakeups, name: str) -> None:
+        self._wakeups = wakeups
+        self._name = name
+        with wakeups._lock:  # pyright: ignore[reportPrivateUsage]
+            watched = wakeups._watched  # pyright: ignore[reportPrivateUsage]
+            if (state := watched.get(name)) is None:
+                state = watched[name] = _Watched(wakeups._lock)  # pyright: ignore[reportPrivateUsage]
+            state.watchers += 1
+            self._state = state
+            self._seen = state.generation
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until the lock is released or `timeout` seconds pass, returns whether it was released.
+
+        Only one waiter is woken per release, the others notice it when their timeout is over.
+        """
+        state = self._state
+        with state.cond:
+            released = state.cond.wait_for(lambda: state.generation != self._seen, timeout)
+            self._seen = state.generation
+        return released
+
+    async def a_wait(self, timeout: float) -> bool:
+        """Async version of `wait`, the event loop keeps running while waiting."""
+        wakeups = self._wakeups
+        loop = asyncio.get_running_loop()
+        with wakeups._lock:  # pyright: ignore[reportPrivateUsage]
+            if self._state.generation != self._seen:
+                self._seen = self._state.generation
+                return True
+            waiter = (loop, loop.create_future())
+            wakeups._async_waiters.setdefault(self._name, []).append(waiter)  # pyright: ignore[reportPrivateUsage]
+
+        try:
+            done, _ = await asyncio.wait((waiter[1],), timeout=timeout)
+        finally:
+            with wakeups._lock:  # pyright: ignore[reportPrivateUsage]
+                self._seen = self._state.generation
+                # a release pops the waiters it wakes, only a timed out or cancelled waiter is still listed
+                waiters = wakeups._async_waiters.get(self._name, [])  # pyright: ignore[reportPrivateUsage]
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    _ = wakeups._async_waiters.pop(self._name, None)  # pyright: ignore[reportPrivateUsage]
+        return bool(done)
+
+    def close(self) -> None:
+        with self._wakeups._lock:  # pyright: ignore[reportPrivateUsage]
+            self._state.watchers -= 1
+            if self._state.watchers == 0:
+                del self._wakeups._watched[self._name]  # pyright: ignore[reportPrivateUsage]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+from ._logger import logger
+
+
+if TYPE_CHECKING:
+    from ._lib import CachifyClient
+
+
+# the TTL is renewed three times per period, so a single slow or failed renewal doesn't let the lock expire
+_RENEWALS_PER_TTL = 3
+
+
+class LockWatchdog:
+    """Keeps extending the TTL of a held lock on a daemon thread until `stop` is called.
+
+    A lock with a short TTL then stays held for as long as its holder is alive, and expires within one TTL after
+    the holder dies. The watchdog stops on its own once the lock is no longer held by its owner token.
+    """
+
+    def __init__(self, client: 'CachifyClient', key: str, token: str, ttl: int) -> None:
+        self._client = client
+        self._key = key
+        self._token = token
+        self._ttl = ttl
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'py-cachify-watchdog-{key}', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._ttl / _RENEWALS_PER_TTL):
+            try:
+                extended = self._client.extend_lock(key=self._key, token=self._token, ttl=self._ttl)
+            except Exception as e:
+                logger.warning(f'Extending {self._key} failed: {e}')
+                continue
+
+            if not extended:
+                logger.warning(f'{self._key} is no longer held by this owner, stopped extending it')
+                return
+
+
+class AsyncLockWatchdog:
+    """Async version of LockWatchdog, extends the TTL from a task on the running event loop."""
+
+    def __init__(self, client: 'CachifyClient', key: str, token: str, ttl: int) -> None:
+        self._client = client
+        self._key = key
+        self._token = token
+        self._ttl = ttl
+        self._task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        # an extension still in flight is harmless, it only succeeds while the key holds our token
+        _ = self._task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._ttl / _RENEWALS_PER_TTL)
+            try:
+                extended = await self._client.a_extend_lock(key=self._key, token=self._token, ttl=self._ttl)
+            except Exception as e:
+                logger.warning(f'Extending {self._key} failed: {e}')
+                continue
+
+            if not extended:
+                logger.warning(f'{self._key} is no longer held by this owner, stopped extending it')
+                return
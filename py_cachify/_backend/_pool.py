@@ -1,5 +1,6 @@
 import contextvars
 import inspect
+import math
 import time
 import uuid
 from collections.abc import Awaitable
@@ -9,15 +10,16 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union, cast
 from typing_extensions import ParamSpec, Self, final, overload
 
 from ._exceptions import CachifyLockError, CachifyPoolFullError
-from ._helpers import get_full_key_from_signature, is_coroutine
+from ._helpers import KeyTemplate, is_coroutine
 from ._lib import get_cachify_client
 from ._pool_state import PoolState
-from ._types._common import UNSET, UnsetType
+from ._types._common import UNSET, UnsetType, WaitStrategy
 from ._types._pool_wrap import AsyncPoolWrappedF, SyncPoolWrappedF, WrappedFunctionPool
 
 
 if TYPE_CHECKING:
     from ._lib import CachifyClient
+    from ._lock import lock as _lock_cls
 
 _P = ParamSpec('_P')
 _R = TypeVar('_R', covariant=True)
@@ -31,10 +33,12 @@ class _PoolBase:
         key: str,
         max_size: int,
         slot_exp: Union[Optional[int], UnsetType] = UNSET,
+        lock_wait_strategy: Optional[WaitStrategy] = None,
     ) -> None:
         self._key = key
         self._max_size = max_size
         self._slot_exp = slot_exp
+        self._lock_wait_strategy = lock_wait_strategy
         self._bound_cachify_client: Optional[CachifyClient] = None
         self._slot_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
             f'pool-slot-{key}', default=None
@@ -61,6 +65,26 @@ class _PoolBase:
     def _get_state_key(self) -> str:
         return f'{self._key}-state'
 
+    @staticmethod
+    def _get_state_ttl(state: PoolState) -> Optional[int]:
+        """The state is only needed until its last slot expires, None if one of the slots never expires."""
+        latest = max(state.slots.values())
+        if latest == float('inf'):
+            return None
+        return max(1, math.ceil(latest - time.time()))
+
+    def _meta_lock(self) -> '_lock_cls':
+        from ._lock import lock as _lock_cls
+
+        meta_lock = _lock_cls(
+            key=self._get_meta_lock_key(),
+            nowait=False,
+            timeout=self._get_lock_timeout(),
+            wait_strategy=self._lock_wait_strategy,
+        )
+        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        return meta_lock
+
     def _get_lock_timeout(self) -> float:
         """Calculate meta-lock timeout based on max_size.
 
@@ -89,7 +113,11 @@ class _PoolSync(_PoolBase):
 
     def _save_state(self, state: PoolState) -> None:
         state_key = self._get_state_key()
-        _ = self._cachify.set(key=state_key, val=state)
+        if not state.slots:
+            _ = self._cachify.delete(key=state_key)
+            return
+
+        _ = self._cachify.set(key=state_key, val=state, ttl=self._get_state_ttl(state))
 
     def _acquire_slot(self) -> Optional[str]:
         now = time.time()
@@ -115,10 +143,7 @@ class _PoolSync(_PoolBase):
 
     def _acquire_or_raise(self) -> str:
         """Try to acquire a slot. Raises CachifyPoolFullError if pool is full."""
-        from ._lock import lock as _lock_cls
-
-        meta_lock = _lock_cls(key=self._get_meta_lock_key(), nowait=False, timeout=self._get_lock_timeout())
-        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        meta_lock = self._meta_lock()
 
         try:
             with meta_lock:
@@ -132,10 +157,7 @@ class _PoolSync(_PoolBase):
 
     def _release_with_lock(self, slot_id: str) -> None:
         """Release a slot with meta-lock protection."""
-        from ._lock import lock as _lock_cls
-
-        meta_lock = _lock_cls(key=self._get_meta_lock_key(), nowait=False, timeout=self._get_lock_timeout())
-        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        meta_lock = self._meta_lock()
 
         with meta_lock:
             self._release_slot(slot_id)
@@ -155,10 +177,7 @@ class _PoolSync(_PoolBase):
         self._slot_id_var.set(None)
 
     def size(self) -> int:
-        from ._lock import lock as _lock_cls
-
-        meta_lock = _lock_cls(key=self._get_meta_lock_key(), nowait=False, timeout=self._get_lock_timeout())
-        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        meta_lock = self._meta_lock()
 
         with meta_lock:
             state = self._load_state()
@@ -178,7 +197,11 @@ class _PoolAsync(_PoolBase):
 
     async def _asave_state(self, state: PoolState) -> None:
         state_key = self._get_state_key()
-        _ = await self._cachify.a_set(key=state_key, val=state)
+        if not state.slots:
+            _ = await self._cachify.a_delete(key=state_key)
+            return
+
+        _ = await self._cachify.a_set(key=state_key, val=state, ttl=self._get_state_ttl(state))
 
     async def _a_acquire_slot(self) -> Optional[str]:
         now = time.time()
@@ -204,10 +227,7 @@ class _PoolAsync(_PoolBase):
 
     async def _a_acquire_or_raise(self) -> str:
         """Try to acquire a slot. Raises CachifyPoolFullError if pool is full."""
-        from ._lock import lock as _lock_cls
-
-        meta_lock = _lock_cls(key=self._get_meta_lock_key(), nowait=False, timeout=self._get_lock_timeout())
-        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        meta_lock = self._meta_lock()
 
         try:
             async with meta_lock:
@@ -221,10 +241,7 @@ class _PoolAsync(_PoolBase):
 
     async def _a_release_with_lock(self, slot_id: str) -> None:
         """Release a slot with meta-lock protection."""
-        from ._lock import lock as _lock_cls
-
-        meta_lock = _lock_cls(key=self._get_meta_lock_key(), nowait=False, timeout=self._get_lock_timeout())
-        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        meta_lock = self._meta_lock()
 
         async with meta_lock:
             await self._a_release_slot(slot_id)
@@ -244,10 +261,7 @@ class _PoolAsync(_PoolBase):
         self._slot_id_var.set(None)
 
     async def asize(self) -> int:
-        from ._lock import lock as _lock_cls
-
-        meta_lock = _lock_cls(key=self._get_meta_lock_key(), nowait=False, timeout=self._get_lock_timeout())
-        meta_lock._cachify = self._cachify  # pyright: ignore[reportPrivateUsage]
+        meta_lock = self._meta_lock()
 
         async with meta_lock:
             state = await self._aload_state()
@@ -265,6 +279,8 @@ class pool(_PoolSync, _PoolAsync):
         max_size (int): Maximum number of concurrent slots in the pool.
         raise_on_full (bool): If True, raise CachifyPoolFullError when pool is full. Defaults to False.
         slot_exp (Union[Optional[int], UnsetType]): TTL for pool slots. Uses default_pool_slot_expiration if UNSET.
+        lock_wait_strategy (Optional[WaitStrategy]): How long to wait for the meta-lock between acquisition attempts.
+            Uses lock_wait_strategy from cachify if None.
 
     Usage as context manager:
         async with pool(key='worker-pool', max_size=10):
@@ -305,6 +321,7 @@ class pool(_PoolSync, _PoolAsync):
             on_full=on_full,
             raise_on_full=raise_on_full,
             slot_exp=self._slot_exp,
+            lock_wait_strategy=self._lock_wait_strategy,
             pool_instance=self,
         )
 
@@ -315,18 +332,19 @@ def _pooled_impl(
     on_full: Optional[Callable[..., Any]] = None,
     raise_on_full: bool = False,
     slot_exp: Union[Optional[int], UnsetType] = UNSET,
+    lock_wait_strategy: Optional[WaitStrategy] = None,
     pool_instance: Optional['pool'] = None,
     client_provider: Callable[[], 'CachifyClient'] = get_cachify_client,
 ) -> WrappedFunctionPool:
     """Internal pooled decorator implementation with optional pool_instance or client_provider."""
 
-    def _get_pool(bound_args: inspect.BoundArguments) -> 'pool':
+    def _get_pool(key_template: KeyTemplate, args: Any, kwargs: Any) -> 'pool':
         """Get pool instance - use provided or create new one."""
         if pool_instance is not None:
             return pool_instance
 
-        _key = get_full_key_from_signature(bound_args=bound_args, key=key, operation_postfix='pool')
-        _pool = pool(key=_key, max_size=max_size, slot_exp=slot_exp)
+        _key = key_template(*args, **kwargs)
+        _pool = pool(key=_key, max_size=max_size, slot_exp=slot_exp, lock_wait_strategy=lock_wait_strategy)
         _pool._cachify = client_provider()  # pyright: ignore[reportPrivateUsage]
 
         return _pool
@@ -344,15 +362,14 @@ def _pooled_impl(
     def _pooled_inner(
         _func: Union[Callable[_P, _R], Callable[_P, Awaitable[_R]]],
     ) -> Union[AsyncPoolWrappedF[_P, Optional[_R]], SyncPoolWrappedF[_P, Optional[_R]]]:
-        signature = inspect.signature(_func)
+        key_template = KeyTemplate(key, inspect.signature(_func), 'pool')
 
         if is_coroutine(_func):
             _awaitable_func = _func
 
             @wraps(_awaitable_func)
             async def _async_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Optional[_R]:
-                bound_args = signature.bind(*args, **kwargs)
-                _pool = _get_pool(bound_args)
+                _pool = _get_pool(key_template, args, kwargs)
 
                 try:
                     async with _pool:
@@ -369,8 +386,7 @@ def _pooled_impl(
                     return None
 
             async def _size(*args: Any, **kwargs: Any) -> int:
-                bound_args = signature.bind(*args, **kwargs)
-                _pool = _get_pool(bound_args)
+                _pool = _get_pool(key_template, args, kwargs)
                 return await _pool.asize()
 
             setattr(_async_wrapper, 'size', _size)
@@ -380,8 +396,7 @@ def _pooled_impl(
 
             @wraps(_sync_func)
             def _sync_wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Optional[_R]:
-                bound_args = signature.bind(*args, **kwargs)
-                _pool = _get_pool(bound_args)
+                _pool = _get_pool(key_template, args, kwargs)
 
                 try:
                     with _pool:
@@ -395,8 +410,7 @@ def _pooled_impl(
                     return None
 
             def _sync_size(*args: Any, **kwargs: Any) -> int:
-                bound_args = signature.bind(*args, **kwargs)
-                _pool = _get_pool(bound_args)
+                _pool = _get_pool(key_template, args, kwargs)
                 return _pool.size()
 
             setattr(_sync_wrapper, 'size', _sync_size)
@@ -411,6 +425,7 @@ def pooled(
     on_full: Optional[Callable[..., Any]] = None,
     raise_on_full: bool = False,
     slot_exp: Union[Optional[int], UnsetType] = UNSET,
+    lock_wait_strategy: Optional[WaitStrategy] = None,
 ) -> WrappedFunctionPool:
     """Standalone decorator factory for pooled functions.
 
@@ -420,6 +435,7 @@ def pooled(
         on_full: Callback called when pool is full (receives function args)
         raise_on_full: If True, raise CachifyPoolFullError when pool is full instead of calling on_full.
         slot_exp: TTL for pool slots in seconds
+        lock_wait_strategy: How long to wait for the pool's meta-lock between acquisition attempts
 
     Returns:
         Decorator that wraps functions with pool acquisition
@@ -435,6 +451,7 @@ def pooled(
         on_full=on_full,
         raise_on_full=raise_on_full,
         slot_exp=slot_exp,
+        lock_wait_strategy=lock_wait_strategy,
         pool_instance=None,
         client_provider=get_cachify_client,
     )
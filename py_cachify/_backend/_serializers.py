@@ -0,0 +1,146 @@
+import json
+import pickle
+import struct
+from typing import Any, Callable, Optional, Union, cast
+
+from typing_extensions import override
+
+
+def _load_orjson() -> Optional[Any]:
+    try:
+        import orjson  # pyright: ignore[reportMissingImports]
+    except ModuleNotFoundError:
+        return None
+
+    return orjson  # pyright: ignore[reportUnknownVariableType]
+
+
+_orjson = _load_orjson()
+
+
+class PickleSerializer:
+    """Pickles values with the given protocol, the highest available one by default."""
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        self.protocol = protocol
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=self.protocol)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class RawSerializer:
+    """Stores bytes-like values as they are, for functions that already return encoded payloads."""
+
+    def dumps(self, value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, (bytearray, memoryview)):
+            return bytes(cast(Union[bytearray, memoryview], value))
+
+        raise TypeError(f'RawSerializer can only store bytes-like values, got {type(value).__name__}')
+
+    def loads(self, data: bytes) -> Any:
+        return data
+
+
+def _stdlib_json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode()
+
+
+class JSONSerializer:
+    """Serializes JSON-compatible values, uses orjson when it is installed and the stdlib json module otherwise."""
+
+    def __init__(self) -> None:
+        self._dumps: Callable[[Any], bytes] = _orjson.dumps if _orjson is not None else _stdlib_json_dumps
+        self._loads: Callable[[bytes], Any] = _orjson.loads if _orjson is not None else json.loads
+
+    def dumps(self, value: Any) -> bytes:
+        return self._dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class OutOfBandPayload:
+    """Pickle stream with its large buffers kept aside (by reference), as stored in MemoryCache."""
+
+    __slots__ = ('buffers', 'head')
+
+    def __init__(self, head: bytes, buffers: list[memoryview]) -> None:
+        self.head = head
+        self.buffers = buffers
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.head) + sum(buf.nbytes for buf in self.buffers)
+
+
+_OOB_MAGIC = b'OOB5'
+_OOB_HEADER = struct.Struct('<II')  # head length, number of buffers
+_OOB_LENGTH = struct.Struct('<Q')
+
+
+class OutOfBandPickleSerializer(PickleSerializer):
+    """Pickle protocol 5 serializer that keeps buffers of at least `min_buffer_size` bytes out of band.
+
+    Objects that pickle their memory as PickleBuffer (NumPy arrays, for example) are not copied into the pickle
+    stream: MemoryCache stores the buffers by reference, other backends get one framed payload whose buffers
+    are handed back to pickle as zero-copy slices on reads. Cached buffers are exposed read-only.
+
+    MemoryCache entries alias the source memory: mutating the original object after caching it changes the
+    cached value too. Cache a copy (or stop writing to the object) when that is not wanted.
+    """
+
+    def __init__(self, min_buffer_size: int = 64 * 1024) -> None:
+        super().__init__(protocol=5)
+        self.min_buffer_size = min_buffer_size
+
+    def dumps_parts(self, value: Any) -> OutOfBandPayload:
+        buffers: list[memoryview] = []
+
+        def collect(buf: pickle.PickleBuffer) -> bool:
+            raw = buf.raw()
+            if raw.nbytes < self.min_buffer_size:
+                return True  # small enough to stay in band
+            buffers.append(raw.toreadonly())
+            return False
+
+        head = pickle.dumps(value, protocol=5, buffer_callback=collect)
+        return OutOfBandPayload(head, buffers)
+
+    @override
+    def dumps(self, value: Any) -> bytes:
+        payload = self.dumps_parts(value)
+        if not payload.buffers:
+            return payload.head
+
+        lengths = b''.join(_OOB_LENGTH.pack(buf.nbytes) for buf in payload.buffers)
+        return b''.join(
+            (_OOB_MAGIC, _OOB_HEADER.pack(len(payload.head), len(payload.buffers)), lengths, payload.head)
+            + tuple(payload.buffers)
+        )
+
+    @override
+    def loads(self, data: Union[bytes, OutOfBandPayload]) -> Any:
+        if isinstance(data, OutOfBandPayload):
+            return pickle.loads(data.head, buffers=data.buffers)
+        if not data.startswith(_OOB_MAGIC):
+            return pickle.loads(data)
+
+        view = memoryview(data)
+        head_len, count = _OOB_HEADER.unpack_from(view, len(_OOB_MAGIC))
+        offset = len(_OOB_MAGIC) + _OOB_HEADER.size
+        lengths = [_OOB_LENGTH.unpack_from(view, offset + i * _OOB_LENGTH.size)[0] for i in range(count)]
+        offset += count * _OOB_LENGTH.size
+
+        head = view[offset : offset + head_len]
+        offset += head_len
+        buffers: list[memoryview] = []
+        for length in lengths:
+            buffers.append(view[offset : offset + length])
+            offset += length
+
+        return pickle.loads(head, buffers=buffers)
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Hashable
+from typing import Any, Callable, Optional, TypeVar
+
+
+_T = TypeVar('_T')
+
+
+class _Call:
+    __slots__ = ('error', 'event', 'owner', 'result')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.owner = threading.get_ident()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent synchronous calls sharing the same key into a single execution."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            # a nested call for the same key from the leader itself would wait on itself forever
+            if call.owner == threading.get_ident():
+                return func()
+
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = func()
+            return call.result  # type: ignore[no-any-return]
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutine calls sharing the same key into a single execution per event loop."""
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, Hashable], tuple[asyncio.Future[Any], Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        task = asyncio.current_task()
+
+        while (in_flight := self._calls.get(flight_key)) is not None:
+            fut, owner = in_flight
+            if owner is task:
+                return await func()
+
+            # wait without propagating our own cancellation into the shared future
+            _ = await asyncio.wait((fut,))
+            if not fut.cancelled():
+                return fut.result()  # type: ignore[no-any-return]
+            # the leader was cancelled, compete to become the next one
+
+        fut = loop.create_future()
+        self._calls[flight_key] = fut, task
+        try:
+            res = await func()
+        except asyncio.CancelledError:
+            _ = fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            # mark the exception as retrieved, followers (if any) will re-raise it themselves
+            _ = fut.exception()
+            raise
+        else:
+            fut.set_result(res)
+            return res
+        finally:
+            del self._calls[flight_key]
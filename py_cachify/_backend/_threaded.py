@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
+
+from ._lock_ops import sync_incr, sync_lock_ops
+from ._types._common import SyncClient
+
+
+_T = TypeVar('_T')
+
+
+class ThreadedClientStats(NamedTuple):
+    """Counters of a ThreadedAsyncClient, `in_flight` and `queue_wait` show when the executor falls behind."""
+
+    submitted: int
+    completed: int
+    in_flight: int
+    peak_in_flight: int
+    coalesced_gets: int
+    queue_wait: float
+
+
+class ThreadedAsyncClient:
+    """AsyncClient running the calls of a blocking SyncClient on a bounded thread pool.
+
+    The event loop only awaits the results, so a slow backend never stalls it. Concurrent `get`s of the same key
+    on one event loop share a single backend call, a `set` or `delete` of the key is never served by a `get`
+    that started before it. `mget` and `pipeline` take one executor job per batch and use the methods of the
+    sync client when it has them, as do `incr`, `compare_and_delete` and `compare_and_expire` (used by locks).
+
+    Args:
+    sync_client (SyncClient): The blocking client.
+    executor (Optional[Executor], optional): The executor to run the calls on. Defaults to None, meaning
+        a ThreadPoolExecutor with `max_workers` threads owned (and shut down by `close`) by this client.
+    max_workers (int, optional): The size of the default executor, i.e. the number of concurrent backend calls.
+        Defaults to 8.
+    """
+
+    def __init__(self, sync_client: SyncClient, executor: Optional[Executor] = None, max_workers: int = 8) -> None:
+        if max_workers <= 0:
+            raise ValueError('max_workers must be a positive integer')
+
+        self.sync_client = sync_client
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='py-cachify')
+        self._sync_mget: Optional[Callable[[list[str]], list[Optional[Any]]]] = getattr(sync_client, 'mget', None)
+        self._sync_pipeline: Optional[Callable[..., Any]] = getattr(sync_client, 'pipeline', None)
+        self._sync_compare_and_delete, self._sync_compare_and_expire = sync_lock_ops(sync_client)
+        self._sync_incr = sync_incr(sync_client)
+        self._gets: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future[Any]] = {}
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._peak_in_flight = 0
+        self._coalesced_gets = 0
+        self._queue_wait = 0.0
+
+    def stats(self) -> ThreadedClientStats:
+        with self._lock:
+            return ThreadedClientStats(
+                submitted=self._submitted,
+                completed=self._completed,
+                in_flight=self._submitted - self._completed,
+                peak_in_flight=self._peak_in_flight,
+                coalesced_gets=self._coalesced_gets,
+                queue_wait=self._queue_wait,
+            )
+
+    def close(self) -> None:
+        """Shuts the default executor down, an executor passed in is left to its owner."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def get(self, name: str) -> Optional[Any]:
+        loop = asyncio.get_running_loop()
+        key = (loop, name)
+        if (fut := self._gets.get(key)) is not None:
+            with self._lock:
+                self._coalesced_gets += 1
+        else:
+            fut = self._gets[key] = self._submit(loop, self.sync_client.get, name)
+            fut.add_done_callback(lambda done: self._forget_get(key, done))
+
+        # one cancelled caller must not cancel the call the others are waiting for
+        return await asyncio.shield(fut)
+
+    async def mget(self, names: Iterable[str]) -> list[Optional[Any]]:
+        names = list(names)
+        if self._sync_mget is not None:
+            return await self._submit(asyncio.get_running_loop(), self._sync_mget, names)
+        return await self._submit(asyncio.get_running_loop(), self._get_each, names)
+
+    async def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Any:
+        loop = asyncio.get_running_loop()
+        self._detach_gets(loop, (name,))
+        return await self._submit(loop, lambda: self.sync_client.set(name, value, ex=ex, nx=nx))
+
+    async def delete(self, *names: str) -> Any:
+        loop = asyncio.get_running_loop()
+        self._detach_gets(loop, names)
+        return await self._submit(loop, self.sync_client.delete, *names)
+
+    async def incr(self, name: str) -> int:
+        loop = asyncio.get_running_loop()
+        self._detach_gets(loop, (name,))
+        return await self._submit(loop, self._sync_incr, name)
+
+    async def compare_and_delete(self, name: str, expected: bytes) -> bool:
+        loop = asyncio.get_running_loop()
+        self._detach_gets(loop, (name,))
+        return await self._submit(loop, self._sync_compare_and_delete, name, expected)
+
+    async def compare_and_expire(self, name: str, expected: bytes, ex: int) -> bool:
+        return await self._submit(asyncio.get_running_loop(), self._sync_compare_and_expire, name, expected, ex)
+
+    def pipeline(self, transaction: bool = True) -> '_ThreadedPipeline':
+        return _ThreadedPipeline(self, transaction)
+
+    def _get_each(self, names: list[str]) -> list[Optional[Any]]:
+        return [self.sync_client.get(name) for name in names]
+
+    def _forget_get(self, key: tuple[asyncio.AbstractEventLoop, str], fut: 'asyncio.Future[Any]') -> None:
+        if self._gets.get(key) is fut:
+            del self._gets[key]
+
+    def _detach_gets(self, loop: asyncio.AbstractEventLoop, names: Iterable[str]) -> None:
+        # gets issued after a write must not join a read that may have been served before it
+        for name in names:
+            _ = self._gets.pop((loop, name), None)
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, func: Callable[..., _T], *args: Any) -> 'asyncio.Future[_T]':
+        submitted_at = time.perf_counter()
+
+        def run() -> _T:
+            waited = time.perf_counter() - submitted_at
+            with self._lock:
+                self._queue_wait += waited
+            return func(*args)
+
+        with self._lock:
+            self._submitted += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._submitted - self._completed)
+        try:
+            job = self._executor.submit(run)
+        except BaseException:
+            self._on_done(None)
+            raise
+
+        job.add_done_callback(self._on_done)
+        return asyncio.wrap_future(job, loop=loop)
+
+    def _on_done(self, _: 'Optional[Future[Any]]') -> None:
+        with self._lock:
+            self._completed += 1
+
+
+class _ThreadedPipeline:
+    def __init__(self, client: ThreadedAsyncClient, transaction: bool) -> None:
+        self._client = client
+        self._transaction = transaction
+        self._commands: list[tuple[str, Any, Union[int, None]]] = []
+
+    def set(self, name: str, value: Any, *, ex: Union[int, None] = None) -> '_ThreadedPipeline':
+        self._commands.append((name, value, ex))
+        return self
+
+    async def execute(self) -> list[Any]:
+        client = self._client
+        loop = asyncio.get_running_loop()
+        client._detach_gets(loop, (name for name, _, _ in self._commands))  # pyright: ignore[reportPrivateUsage]
+        return await client._submit(loop, self._execute_sync)  # pyright: ignore[reportPrivateUsage]
+
+    def _execute_sync(self) -> list[Any]:
+        client = self._client
+        sync_pipeline = client._sync_pipeline  # pyright: ignore[reportPrivateUsage]
+        if sync_pipeline is None:
+            return [client.sync_client.set(name, value, ex=ex) for name, value, ex in self._commands]
+
+        pipe = sync_pipeline(transaction=self._transaction)
+        for name, value, ex in self._commands:
+            _ = pipe.set(name, value, ex=ex)
+        res: list[Any] = pipe.execute()
+        return res
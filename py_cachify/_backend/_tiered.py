@@ -0,0 +1,275 @@
+from collections.abc import Iterable
+from typing import Any, Callable, Optional, Union
+
+from ._clients import MemoryCache
+from ._constants import is_cached_value_key
+from ._invalidation import InvalidationBus
+from ._lock_ops import async_incr, async_lock_ops, sync_incr, sync_lock_ops
+from ._types._common import AsyncClient, SyncClient
+
+
+_DEFAULT_LOCAL_MAX_ENTRIES = 10_000
+
+
+class _TieredBase:
+    def __init__(
+        self,
+        local: Optional[MemoryCache],
+        local_ttl: int,
+        local_keys: Callable[[str], bool],
+        bus: Optional[InvalidationBus],
+    ) -> None:
+        if local_ttl <= 0:
+            raise ValueError('local_ttl must be a positive integer')
+
+        self.local = (
+            local if local is not None else MemoryCache(max_entries=_DEFAULT_LOCAL_MAX_ENTRIES, evictable=local_keys)
+        )
+        self.local_ttl = local_ttl
+        self.bus = bus
+        self._local_keys = local_keys
+        if bus is not None:
+            bus.subscribe(self._evict)
+
+    def _evict(self, names: list[str]) -> None:
+        self.local.delete(*names)
+
+    def _invalidate(self, names: Iterable[str]) -> None:
+        if self.bus is not None:
+            self.bus.publish(name for name in names if self._local_keys(name))
+
+    def _local_get(self, name: str) -> Optional[Any]:
+        return self.local.get(name) if self._local_keys(name) else None
+
+    def _local_fill(self, name: str, value: Any) -> None:
+        if value is not None and self._local_keys(name):
+            _ = self.local.set(name, value, ex=self.local_ttl)
+
+    def _local_write(self, name: str, value: Any, ex: Union[int, None], nx: bool) -> None:
+        if not self._local_keys(name):
+            return
+        if nx:
+            # whether the remote write happened is up to the remote, so just drop the local copy
+            self.local.delete(name)
+            return
+
+        _ = self.local.set(name, value, ex=self.local_ttl if ex is None else min(ex, self.local_ttl))
+
+
+class TieredClient(_TieredBase):
+    """Sync client fronting a remote client (L2, e.g. Redis) with a bounded in-process MemoryCache (L1).
+
+    Reads of keys selected by `local_keys` check L1 first, L2 hits are copied to L1 for `local_ttl` seconds,
+    writes go to both tiers and deletes clear both. Everything else (locks, `once`, pools, leases) always
+    goes to L2, so distributed semantics are unchanged.
+
+    Args:
+    remote (SyncClient): The L2 client.
+    local (Optional[MemoryCache], optional): The L1 cache. Can be shared with an AsyncTieredClient fronting
+        the same remote backend. Defaults to None, meaning a MemoryCache(max_entries=10_000) is created.
+    local_ttl (int, optional): Maximum time in seconds a value is served from L1, which bounds how stale it
+        can get when another process changes it in L2. Defaults to 5.
+    local_keys (Callable[[str], bool], optional): Predicate selecting the keys kept in L1.
+        Defaults to selecting the keys of `cached` values.
+    bus (Optional[InvalidationBus], optional): The bus the L1 keys written or deleted here are published to,
+        and that evicts the keys published by other processes from L1. Defaults to None, meaning other
+        processes' changes are only seen once the L1 copy expires.
+    """
+
+    def __init__(
+        self,
+        remote: SyncClient,
+        local: Optional[MemoryCache] = None,
+        local_ttl: int = 5,
+        local_keys: Callable[[str], bool] = is_cached_value_key,
+        bus: Optional[InvalidationBus] = None,
+    ) -> None:
+        super().__init__(local, local_ttl, local_keys, bus)
+        self.remote = remote
+        self._remote_mget: Optional[Callable[[list[str]], list[Optional[Any]]]] = getattr(remote, 'mget', None)
+        self._remote_pipeline: Optional[Callable[..., Any]] = getattr(remote, 'pipeline', None)
+        self._remote_compare_and_delete, self._remote_compare_and_expire = sync_lock_ops(remote)
+        self._remote_incr = sync_incr(remote)
+
+    def get(self, name: str) -> Optional[Any]:
+        if (val := self._local_get(name)) is not None:
+            return val
+
+        val = self.remote.get(name)
+        self._local_fill(name, val)
+        return val
+
+    def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Any:
+        res = self.remote.set(name, value, ex=ex, nx=nx)
+        self._local_write(name, value, ex, nx)
+        self._invalidate((name,))
+        return res
+
+    def delete(self, *names: str) -> Any:
+        self.local.delete(*names)
+        res = self.remote.delete(*names)
+        self._invalidate(names)
+        return res
+
+    def mget(self, names: list[str]) -> list[Optional[Any]]:
+        values = [self._local_get(name) for name in names]
+        if not (missing := [idx for idx, val in enumerate(values) if val is None]):
+            return values
+
+        missing_names = [names[idx] for idx in missing]
+        if self._remote_mget is not None:
+            fetched = self._remote_mget(missing_names)
+        else:
+            fetched = [self.remote.get(name) for name in missing_names]
+
+        for idx, name, val in zip(missing, missing_names, fetched):
+            values[idx] = val
+            self._local_fill(name, val)
+        return values
+
+    def incr(self, name: str) -> int:
+        # used by locks, their keys are only in L1 with a custom `local_keys`
+        self.local.delete(name)
+        return self._remote_incr(name)
+
+    def compare_and_delete(self, name: str, expected: bytes) -> bool:
+        self.local.delete(name)
+        return self._remote_compare_and_delete(name, expected)
+
+    def compare_and_expire(self, name: str, expected: bytes, ex: int) -> bool:
+        return self._remote_compare_and_expire(name, expected, ex)
+
+    def pipeline(self, transaction: bool = True) -> '_TieredPipeline':
+        return _TieredPipeline(self, transaction)
+
+
+class _TieredPipeline:
+    def __init__(self, client: TieredClient, transaction: bool) -> None:
+        self._client = client
+        self._transaction = transaction
+        self._commands: list[tuple[str, Any, Union[int, None]]] = []
+
+    def set(self, name: str, value: Any, *, ex: Union[int, None] = None) -> '_TieredPipeline':
+        self._commands.append((name, value, ex))
+        return self
+
+    def execute(self) -> list[Any]:
+        client = self._client
+        if client._remote_pipeline is None:  # pyright: ignore[reportPrivateUsage]
+            return [client.set(name, value, ex=ex) for name, value, ex in self._commands]
+
+        pipe = client._remote_pipeline(transaction=self._transaction)  # pyright: ignore[reportPrivateUsage]
+        for name, value, ex in self._commands:
+            _ = pipe.set(name, value, ex=ex)
+        res: list[Any] = pipe.execute()
+
+        for name, value, ex in self._commands:
+            client._local_write(name, value, ex, nx=False)  # pyright: ignore[reportPrivateUsage]
+        client._invalidate(name for name, _, _ in self._commands)  # pyright: ignore[reportPrivateUsage]
+        return res
+
+
+class AsyncTieredClient(_TieredBase):
+    """Async version of TieredClient, L1 is accessed directly and only L1 misses wait for the remote client.
+
+    Args:
+    remote (AsyncClient): The async L2 client.
+    local (Optional[MemoryCache], optional): The L1 cache. Can be shared with a TieredClient fronting
+        the same remote backend. Defaults to None, meaning a MemoryCache(max_entries=10_000) is created.
+    local_ttl (int, optional): Maximum time in seconds a value is served from L1. Defaults to 5.
+    local_keys (Callable[[str], bool], optional): Predicate selecting the keys kept in L1.
+        Defaults to selecting the keys of `cached` values.
+    bus (Optional[InvalidationBus], optional): The bus shared with the other tiers, can be the one of
+        a TieredClient in the same process. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        remote: AsyncClient,
+        local: Optional[MemoryCache] = None,
+        local_ttl: int = 5,
+        local_keys: Callable[[str], bool] = is_cached_value_key,
+        bus: Optional[InvalidationBus] = None,
+    ) -> None:
+        super().__init__(local, local_ttl, local_keys, bus)
+        self.remote = remote
+        self._remote_mget: Optional[Callable[[list[str]], Any]] = getattr(remote, 'mget', None)
+        self._remote_pipeline: Optional[Callable[..., Any]] = getattr(remote, 'pipeline', None)
+        self._remote_compare_and_delete, self._remote_compare_and_expire = async_lock_ops(remote)
+        self._remote_incr = async_incr(remote)
+
+    async def get(self, name: str) -> Optional[Any]:
+        if (val := self._local_get(name)) is not None:
+            return val
+
+        val = await self.remote.get(name)
+        self._local_fill(name, val)
+        return val
+
+    async def set(self, name: str, value: Any, ex: Union[int, None] = None, nx: bool = False) -> Any:
+        res = await self.remote.set(name, value, ex=ex, nx=nx)
+        self._local_write(name, value, ex, nx)
+        self._invalidate((name,))
+        return res
+
+    async def delete(self, *names: str) -> Any:
+        self.local.delete(*names)
+        res = await self.remote.delete(*names)
+        self._invalidate(names)
+        return res
+
+    async def mget(self, names: list[str]) -> list[Optional[Any]]:
+        values = [self._local_get(name) for name in names]
+        if not (missing := [idx for idx, val in enumerate(values) if val is None]):
+            return values
+
+        missing_names = [names[idx] for idx in missing]
+        if self._remote_mget is not None:
+            fetched: list[Optional[Any]] = await self._remote_mget(missing_names)
+        else:
+            fetched = [await self.remote.get(name) for name in missing_names]
+
+        for idx, name, val in zip(missing, missing_names, fetched):
+            values[idx] = val
+            self._local_fill(name, val)
+        return values
+
+    async def incr(self, name: str) -> int:
+        self.local.delete(name)
+        return await self._remote_incr(name)
+
+    async def compare_and_delete(self, name: str, expected: bytes) -> bool:
+        self.local.delete(name)
+        return await self._remote_compare_and_delete(name, expected)
+
+    async def compare_and_expire(self, name: str, expected: bytes, ex: int) -> bool:
+        return await self._remote_compare_and_expire(name, expected, ex)
+
+    def pipeline(self, transaction: bool = True) -> '_AsyncTieredPipeline':
+        return _AsyncTieredPipeline(self, transaction)
+
+
+class _AsyncTieredPipeline:
+    def __init__(self, client: AsyncTieredClient, transaction: bool) -> None:
+        self._client = client
+        self._transaction = transaction
+        self._commands: list[tuple[str, Any, Union[int, None]]] = []
+
+    def set(self, name: str, value: Any, *, ex: Union[int, None] = None) -> '_AsyncTieredPipeline':
+        self._commands.append((name, value, ex))
+        return self
+
+    async def execute(self) -> list[Any]:
+        client = self._client
+        if client._remote_pipeline is None:  # pyright: ignore[reportPrivateUsage]
+            return [await client.set(name, value, ex=ex) for name, value, ex in self._commands]
+
+        pipe = client._remote_pipeline(transaction=self._transaction)  # pyright: ignore[reportPrivateUsage]
+        for name, value, ex in self._commands:
+            _ = pipe.set(name, value, ex=ex)
+        res: list[Any] = await pipe.execute()
+
+        for name, value, ex in self._commands:
+            client._local_write(name, value, ex, nx=False)  # pyright: ignore[reportPrivateUsage]
+        client._invalidate(name for name, _, _ in self._commands)  # pyright: ignore[reportPrivateUsage]
+        return res
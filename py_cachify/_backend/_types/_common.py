@@ -1,11 +1,12 @@
-from collections.abc import Awaitable
-from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Union
+from collections.abc import Awaitable, Iterator
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Protocol, Union
 
 from typing_extensions import TypeAlias
 
 
 if TYPE_CHECKING:
     from .._lib import CachifyClient
+    from .._lock_watchdog import AsyncLockWatchdog, LockWatchdog
 
 
 Encoder: TypeAlias = Callable[[Any], Any]
@@ -48,6 +49,67 @@ class SyncClient(Protocol):
         raise NotImplementedError
 
 
+class SyncPipeline(Protocol):
+    """Command buffer returned by the optional `pipeline()` method of a sync client (redis-py style)."""
+
+    def set(self, name: str, value: Any, *, ex: Union[int, None] = None) -> Any:
+        raise NotImplementedError
+
+    def execute(self) -> Any:
+        raise NotImplementedError
+
+
+class AsyncPipeline(Protocol):
+    """Command buffer returned by the optional `pipeline()` method of an async client, `execute` is awaited."""
+
+    def set(self, name: str, value: Any, *, ex: Union[int, None] = None) -> Any:
+        raise NotImplementedError
+
+    def execute(self) -> Awaitable[Any]:
+        raise NotImplementedError
+
+
+class Serializer(Protocol):
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class Compressor(Protocol):
+    codec_id: int
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def decompress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+
+class InvalidationTransport(Protocol):
+    """Broadcasts invalidation messages between processes, see `InvalidationBus`."""
+
+    def publish(self, message: bytes) -> Any:
+        raise NotImplementedError
+
+    def subscribe(self, callback: Callable[[bytes], None]) -> Callable[[], None]:
+        """Calls `callback` with every published message (own ones included), returns an unsubscribe function."""
+        raise NotImplementedError
+
+
+class WaitStrategy(Protocol):
+    """Decides how long a waiting lock sleeps between acquisition attempts (unless a release wakes it earlier)."""
+
+    def delays(self, name: str) -> Iterator[float]:
+        """Successive waits in seconds of one waiter of the lock `name`."""
+        raise NotImplementedError
+
+    def record_hold(self, name: str, seconds: float) -> None:
+        """Called on release with how long the lock was held in this process."""
+        raise NotImplementedError
+
+
 class UnsetType:
     def __bool__(self) -> bool:
         return False
@@ -56,11 +118,24 @@ class UnsetType:
 UNSET = UnsetType()
 
 
+class LockAcquisition(NamedTuple):
+    """State of one acquisition of a lock, kept per context so acquisitions through a shared lock never mix."""
+
+    token: str
+    acquired_at: float
+    fencing_token: Optional[int]
+    watchdog: Optional[Union['LockWatchdog', 'AsyncLockWatchdog']]
+
+
 class LockProtocolBase(Protocol):
     _key: str
     _nowait: bool
     _timeout: Optional[Union[int, float]]
     _exp: Union[Optional[int], UnsetType]
+    _wait_strategy: Optional[WaitStrategy]
+    _watchdog: bool
+    _fencing: bool
+    _reentrant: bool
 
     @staticmethod
     def _raise_if_cached(
@@ -73,3 +148,19 @@ class LockProtocolBase(Protocol):
     def _calc_stop_at(self) -> float: ...  # pragma: no cover
 
     def _get_ttl(self) -> Optional[int]: ...  # pragma: no cover
+
+    def _get_wait_strategy(self) -> WaitStrategy: ...  # pragma: no cover
+
+    def _record_hold(self, acquisition: Optional[LockAcquisition]) -> None: ...  # pragma: no cover
+
+    def _take_ownership(self, acquisition: LockAcquisition) -> None: ...  # pragma: no cover
+
+    def _give_up_ownership(self) -> Optional[LockAcquisition]: ...  # pragma: no cover
+
+    def _warn_lost(self) -> None: ...  # pragma: no cover
+
+    def _reenter(self) -> bool: ...  # pragma: no cover
+
+    def _hold(self) -> None: ...  # pragma: no cover
+
+    def _exit_reentered(self) -> bool: ...  # pragma: no cover
@@ -0,0 +1,144 @@
+import itertools
+import random
+import threading
+from collections.abc import Iterator
+from typing import Optional
+
+
+class FixedWait:
+    """Waits the same `interval` between lock acquisition attempts, the default built from `lock_poll_interval`."""
+
+    def __init__(self, interval: float = 0.1) -> None:
+        if interval < 0:
+            raise ValueError('interval must not be negative')
+
+        self.interval = interval
+
+    def delays(self, name: str) -> Iterator[float]:
+        return itertools.repeat(self.interval)
+
+    def record_hold(self, name: str, seconds: float) -> None:
+        pass
+
+
+class ExponentialJitterWait:
+    """Exponential backoff with full jitter: the n-th wait is uniform(0, min(cap, base * 2 ** n)).
+
+    Spreads waiters that started together, so a contended lock sees few acquisition attempts per release.
+    """
+
+    def __init__(self, base: float = 0.01, cap: float = 1.0) -> None:
+        if base <= 0 or cap < base:
+            raise ValueError('base must be positive and cap must not be smaller than base')
+
+        self.base = base
+        self.cap = cap
+
+    def delays(self, name: str) -> Iterator[float]:
+        ceiling = self.base
+        while True:
+            yield random.uniform(0, ceiling)
+            ceiling = min(self.cap, ceiling * 2)
+
+    def record_hold(self, name: str, seconds: float) -> None:
+        pass
+
+
+class DecorrelatedJitterWait:
+    """Decorrelated jitter: every wait is uniform(base, previous wait * 3), capped at `cap`.
+
+    Grows like exponential backoff, but each waiter follows its own random sequence.
+    """
+
+    def __init__(self, base: float = 0.01, cap: float = 1.0) -> None:
+        if base <= 0 or cap < base:
+            raise ValueError('base must be positive and cap must not be smaller than base')
+
+        self.base = base
+        self.cap = cap
+
+    def delays(self, name: str) -> Iterator[float]:
+        delay = self.base
+        while True:
+            delay = min(self.cap, random.uniform(self.base, delay * 3))
+            yield delay
+
+    def record_hold(self, name: str, seconds: float) -> None:
+        pass
+
+
+class AdaptiveWait:
+    """Waits according to how long the lock is usually held and how many waiters queue for it in this process.
+
+    Hold times are averaged per lock name (exponentially weighted by `smoothing`) from the locks released in this
+    process. Each wait is `fraction` of the average hold time for every waiter of the name, with jitter, clamped to
+    [min_interval, max_interval], so a queue of waiters retries about once per hold time in total instead of once
+    per hold time each. Names without a recorded hold time back off exponentially from `min_interval`.
+
+    Args:
+    min_interval (float, optional): The shortest wait in seconds. Defaults to 0.005.
+    max_interval (float, optional): The longest wait in seconds. Defaults to 1.0.
+    fraction (float, optional): The share of the average hold time to wait per waiter, lower values retry sooner
+        after a release. Defaults to 0.5.
+    smoothing (float, optional): The weight of the latest hold time in the average. Defaults to 0.2.
+    max_keys (int, optional): The number of lock names to remember hold times for, the oldest are forgotten first.
+        Defaults to 10_000.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.005,
+        max_interval: float = 1.0,
+        fraction: float = 0.5,
+        smoothing: float = 0.2,
+        max_keys: int = 10_000,
+    ) -> None:
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError('min_interval must be positive and max_interval must not be smaller than min_interval')
+        if not 0 < fraction <= 1 or not 0 < smoothing <= 1:
+            raise ValueError('fraction and smoothing must be in (0, 1]')
+        if max_keys <= 0:
+            raise ValueError('max_keys must be a positive integer')
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.fraction = fraction
+        self.smoothing = smoothing
+        self.max_keys = max_keys
+        self._holds: dict[str, float] = {}
+        self._waiters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def average_hold(self, name: str) -> Optional[float]:
+        return self._holds.get(name)
+
+    def waiters(self, name: str) -> int:
+        return self._waiters.get(name, 0)
+
+    def delays(self, name: str) -> Iterator[float]:
+        self._add_waiter(name, 1)
+        try:
+            backoff = self.min_interval
+            while True:
+                if (hold := self._holds.get(name)) is None:
+                    target, backoff = backoff, min(self.max_interval, backoff * 2)
+                else:
+                    target = hold * self.fraction * self._waiters[name]
+                yield min(self.max_interval, max(self.min_interval, target * random.uniform(0.5, 1.0)))
+        finally:
+            # runs when the waiter drops the iterator, i.e. once it got the lock or gave up
+            self._add_waiter(name, -1)
+
+    def record_hold(self, name: str, seconds: float) -> None:
+        with self._lock:
+            previous = self._holds.pop(name, None)
+            self._holds[name] = seconds if previous is None else previous + self.smoothing * (seconds - previous)
+            if len(self._holds) > self.max_keys:
+                del self._holds[next(iter(self._holds))]
+
+    def _add_waiter(self, name: str, count: int) -> None:
+        with self._lock:
+            if waiters := self._waiters.get(name, 0) + count:
+                self._waiters[name] = waiters
+            else:
+                del self._waiters[name]
@@ -1,10 +1,12 @@
 # pyright: reportPrivateUsage=false
-from typing import Any
+import threading
+import time
+from typing import Any, Callable, Optional
 
 import pytest
 
 import py_cachify._backend._lib
-from py_cachify import init_cachify
+from py_cachify import MemoryCache, init_cachify
 
 
 @pytest.fixture(scope='function')
@@ -12,5 +14,167 @@ def init_cachify_fixture() -> Any:
     init_cachify()
     yield
     assert py_cachify._backend._lib._cachify
-    py_cachify._backend._lib._cachify._sync_client._cache = {}  # pyright: ignore[reportAttributeAccessIssue]
+    py_cachify._backend._lib._cachify._sync_client.clear()  # pyright: ignore[reportAttributeAccessIssue]
     py_cachify._backend._lib._cachify = None
+
+
+class FakeClient:
+    """Client with only the required methods and `expire`, backed by a `MemoryCache`.
+
+    Records every call as `'<op> <names>'` and, like a network round trip, waits for `release` and sleeps for
+    `delay` seconds before each one. Setting `fail` makes every call raise `ConnectionError`.
+    """
+
+    def __init__(self) -> None:
+        self.cache = MemoryCache()
+        self.calls: list[str] = []
+        self.delay = 0.0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def _call(self, op: str) -> None:
+        self.calls.append(op)
+        if self.fail:
+            raise ConnectionError('backend is down')
+        _ = self.release.wait()
+        time.sleep(self.delay)
+
+    def get(self, name: str) -> Any:
+        self._call(f'get {name}')
+        return self.cache.get(name)
+
+    def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Any:
+        self._call(f'set {name}')
+        return self.cache.set(name, value, ex=ex, nx=nx)
+
+    def delete(self, *names: str) -> Any:
+        self._call(f'delete {" ".join(names)}')
+        return self.cache.delete(*names)
+
+    def expire(self, name: str, ex: int) -> bool:
+        self._call(f'expire {name}')
+        return self.cache.compare_and_expire(name, self.cache.get(name), ex)
+
+    def as_async(self) -> 'AsyncFakeClient':
+        return AsyncFakeClient(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeClient) -> None:
+        self.client = client
+        self.commands: list[tuple[str, Any, Optional[int]]] = []
+
+    def set(self, name: str, value: Any, *, ex: Optional[int] = None) -> 'FakePipeline':
+        self.commands.append((name, value, ex))
+        return self
+
+    def execute(self) -> list[Any]:
+        self.client._call(f'pipeline {" ".join(name for name, _, _ in self.commands)}')
+        return [self.client.cache.set(name, value, ex=ex) for name, value, ex in self.commands]
+
+
+class PipelinedFakeClient(FakeClient):
+    """Fake client with `mget` and `pipeline`, the transaction flag of every pipeline is kept in `transactions`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.transactions: list[bool] = []
+
+    def mget(self, names: list[str]) -> list[Any]:
+        self._call(f'mget {" ".join(names)}')
+        return self.cache.mget(names)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        self.transactions.append(transaction)
+        return FakePipeline(self)
+
+    def as_async(self) -> 'AsyncPipelinedFakeClient':
+        return AsyncPipelinedFakeClient(self)
+
+
+def _run_script(cache: MemoryCache, script: str, keys: list[str], args: list[Any]) -> int:
+    if "'del'" in script:
+        return int(cache.compare_and_delete(keys[0], args[0]))
+    return int(cache.compare_and_expire(keys[0], args[0], args[1]))
+
+
+class ScriptingFakeClient(FakeClient):
+    """redis-py style fake client running the lock ownership checks as registered server-side scripts."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.scripts: list[str] = []
+
+    def register_script(self, script: str) -> Callable[..., int]:
+        self.scripts.append(script)
+        return lambda keys, args: _run_script(self.cache, script, keys, args)
+
+    def as_async(self) -> 'AsyncScriptingFakeClient':
+        return AsyncScriptingFakeClient(self)
+
+
+class AsyncFakeClient:
+    """Async face of a fake client, calls are recorded on the wrapped sync client."""
+
+    def __init__(self, sync: FakeClient) -> None:
+        self.sync = sync
+
+    async def get(self, name: str) -> Any:
+        return self.sync.get(name)
+
+    async def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Any:
+        return self.sync.set(name, value, ex=ex, nx=nx)
+
+    async def delete(self, *names: str) -> Any:
+        return self.sync.delete(*names)
+
+    async def expire(self, name: str, ex: int) -> bool:
+        return self.sync.expire(name, ex)
+
+
+class AsyncFakePipeline(FakePipeline):
+    async def execute(self) -> list[Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return super().execute()
+
+
+class AsyncPipelinedFakeClient(AsyncFakeClient):
+    def __init__(self, sync: PipelinedFakeClient) -> None:
+        super().__init__(sync)
+        self.sync: PipelinedFakeClient = sync
+
+    async def mget(self, names: list[str]) -> list[Any]:
+        return self.sync.mget(names)
+
+    def pipeline(self, transaction: bool = True) -> AsyncFakePipeline:
+        self.sync.transactions.append(transaction)
+        return AsyncFakePipeline(self.sync)
+
+
+class AsyncScriptingFakeClient(AsyncFakeClient):
+    def __init__(self, sync: ScriptingFakeClient) -> None:
+        super().__init__(sync)
+        self.sync: ScriptingFakeClient = sync
+
+    def register_script(self, script: str) -> Callable[..., Any]:
+        self.sync.scripts.append(script)
+
+        async def run(keys: list[str], args: list[Any]) -> int:
+            return _run_script(self.sync.cache, script, keys, args)
+
+        return run
+
+
+@pytest.fixture
+def fake_client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def pipelined_client() -> PipelinedFakeClient:
+    return PipelinedFakeClient()
+
+
+@pytest.fixture
+def scripting_client() -> ScriptingFakeClient:
+    return ScriptingFakeClient()
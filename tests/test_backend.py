@@ -1,5 +1,10 @@
 # pyright: reportPrivateUsage=false
+import asyncio
+import copy
+import gc
+import threading
 import time
+import weakref
 from types import SimpleNamespace
 from typing import Any
 
@@ -7,9 +12,11 @@ import pytest
 from pytest_mock import MockerFixture
 
 import py_cachify._backend._lib
-from py_cachify import CachifyInitError
-from py_cachify._backend._clients import AsyncWrapper, MemoryCache
+from py_cachify import CachifyInitError, JSONSerializer, LzmaCompressor, PickleSerializer, RawSerializer, ZlibCompressor
+from py_cachify._backend._cache_entry import CacheEntry
+from py_cachify._backend._clients import AsyncWrapper, MemoryCache, _sweeper_loop
 from py_cachify._backend._lib import Cachify, CachifyClient, get_cachify_client, init_cachify
+from py_cachify._backend._threaded import ThreadedAsyncClient
 from py_cachify._backend._types._common import UNSET
 
 
@@ -45,6 +52,14 @@ def cachify_instance(memory_cache: MemoryCache, async_wrapper: AsyncWrapper) ->
     )
 
 
+def _entries(cache: MemoryCache) -> int:
+    return sum(len(shard) for shard in cache._shards)
+
+
+def _any_key(name: str) -> bool:
+    return True
+
+
 def test_memory_cache_set_and_get(memory_cache: MemoryCache) -> None:
     memory_cache.set('key', 'value', ex=10)
     assert memory_cache.get('key') == 'value'
@@ -71,6 +86,291 @@ def test_memory_cache_delete_nonexistent(memory_cache: MemoryCache) -> None:
     assert memory_cache.get('nonexistent_key') is None
 
 
+def test_memory_cache_rejects_invalid_budget() -> None:
+    with pytest.raises(ValueError, match='max_entries'):
+        _ = MemoryCache(max_entries=0)
+    with pytest.raises(ValueError, match='max_bytes'):
+        _ = MemoryCache(max_bytes=0)
+    with pytest.raises(ValueError, match='stripes'):
+        _ = MemoryCache(stripes=0)
+    with pytest.raises(ValueError, match='sweep_interval'):
+        _ = MemoryCache(sweep_interval=0)
+
+
+def test_memory_cache_max_entries_lru() -> None:
+    cache = MemoryCache(max_entries=2, stripes=1, evictable=_any_key)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.evictions == 1
+    assert _entries(cache) == 2
+
+
+def test_memory_cache_overwrite_does_not_evict() -> None:
+    cache = MemoryCache(max_entries=2, stripes=1)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 10)
+
+    assert cache.get('a') == 10
+    assert cache.get('b') == 2
+    assert cache.evictions == 0
+
+
+def test_memory_cache_max_entries_lfu() -> None:
+    cache = MemoryCache(max_entries=2, policy='lfu', stripes=1, evictable=_any_key)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    _ = cache.get('b')
+    _ = cache.get('a')
+    _ = cache.get('a')
+
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.evictions == 1
+
+
+def test_memory_cache_tinylfu_rejects_one_hit_wonders() -> None:
+    cache = MemoryCache(max_entries=1, policy='tinylfu', evictable=_any_key)
+    cache.set('hot', 1)
+    for _ in range(3):
+        _ = cache.get('hot')
+
+    cache.set('once', 2)
+    assert cache.get('once') is None
+    assert cache.get('hot') == 1
+    assert cache.evictions == 1
+
+    for _ in range(5):
+        _ = cache.get('popular')
+    cache.set('popular', 3)
+    assert cache.get('popular') == 3
+    assert cache.get('hot') is None
+
+
+def test_memory_cache_max_bytes() -> None:
+    cache = MemoryCache(max_bytes=10, stripes=1, evictable=_any_key)
+    cache.set('a', b'12345')
+    cache.set('b', b'1234')
+    assert cache.total_bytes == 9
+
+    cache.set('c', b'123')
+
+    assert cache.get('a') is None
+    assert cache.total_bytes == 7
+    assert cache.evictions == 1
+
+    # a value larger than the whole budget is never stored
+    cache.set('big', b'x' * 11)
+    assert cache.get('big') is None
+    assert cache.get('b') == b'1234'
+    assert cache.evictions == 2
+
+    cache.delete('b', 'c', 'missing')
+    assert cache.total_bytes == 0
+
+
+def test_memory_cache_max_bytes_non_bytes_values() -> None:
+    cache = MemoryCache(max_bytes=10_000)
+    cache.set('a', 'value')
+
+    assert cache.total_bytes > 0
+
+
+def test_memory_cache_bounded_never_evicts_nx_keys() -> None:
+    cache = MemoryCache(max_entries=1, evictable=_any_key)
+    assert cache.set('lock', 1, nx=True) is True
+    assert cache.set('lock', 2, nx=True) is False
+    assert cache.get('lock') == 1
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    assert cache.get('lock') == 1
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.delete('lock')
+    assert cache.get('lock') is None
+
+
+def test_memory_cache_bounded_expired_entries(mocker: MockerFixture) -> None:
+    cache = MemoryCache(max_entries=2, stripes=1)
+    mocker.patch.object(time, 'time', return_value=100)
+    cache.set('a', 1, ex=10)
+    assert cache.set('lock', 1, ex=10, nx=True) is True
+
+    mocker.patch.object(time, 'time', return_value=200)
+    assert cache.get('a') is None
+    assert cache.get('lock') is None
+    assert _entries(cache) == 0
+    assert cache.set('lock', 2, ex=10, nx=True) is True
+    assert cache.get('lock') == 2
+
+
+def test_memory_cache_writes_sweep_expired_entries(mocker: MockerFixture) -> None:
+    cache = MemoryCache(sweep_batch=2, stripes=1)
+    mocker.patch.object(time, 'time', return_value=100)
+    for i in range(3):
+        cache.set(f'k{i}', i, ex=10)
+    cache.set('persistent', 'value')
+
+    mocker.patch.object(time, 'time', return_value=200)
+    cache.set('other', 'value')
+
+    # one bounded step per write
+    assert _entries(cache) == 3
+
+    cache.set('other', 'value')
+    assert set(cache._shards[0]._cache) == {'persistent', 'other'}
+    assert cache._shards[0]._expiry_heap == []
+
+
+def test_memory_cache_sweep_skips_overwritten_and_deleted_keys(mocker: MockerFixture) -> None:
+    cache = MemoryCache(stripes=1)
+    mocker.patch.object(time, 'time', return_value=100)
+    cache.set('overwritten', 1, ex=10)
+    cache.set('overwritten', 2, ex=1000)
+    cache.set('deleted', 1, ex=10)
+    cache.delete('deleted')
+
+    mocker.patch.object(time, 'time', return_value=200)
+    assert cache.sweep_expired() == 0
+    assert cache.get('overwritten') == 2
+    assert len(cache._shards[0]._expiry_heap) == 1
+
+
+def test_memory_cache_sweep_bounded_cache(mocker: MockerFixture) -> None:
+    cache = MemoryCache(max_bytes=100, stripes=1)
+    mocker.patch.object(time, 'time', return_value=100)
+    cache.set('a', b'123', ex=10)
+    assert cache.set('lock', b'1', ex=10, nx=True) is True
+
+    mocker.patch.object(time, 'time', return_value=200)
+    assert cache.sweep_expired(limit=1) == 1
+    assert cache.sweep_expired() == 1
+    assert _entries(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_memory_cache_compacts_expiry_heap() -> None:
+    cache = MemoryCache(stripes=1)
+    for _ in range(200):
+        cache.set('key', 'value', ex=100)
+
+    assert len(cache._shards[0]._expiry_heap) <= 2 * _entries(cache) + 64
+
+
+def test_memory_cache_background_sweeper(mocker: MockerFixture) -> None:
+    # the loop is driven step by step here, a real thread would compete with timing-based tests
+    start_sweeper = mocker.patch('py_cachify._backend._clients._start_sweeper')
+    cache = MemoryCache(sweep_interval=0.01, sweep_batch=1)
+    start_sweeper.assert_called_once_with(cache, 0.01)
+    for i in range(3):
+        cache.set(f'k{i}', i, ex=1)
+
+    mocker.patch.object(time, 'time', return_value=time.time() + 2)
+    stop = mocker.Mock()
+    stop.wait.side_effect = [False, True]
+    _sweeper_loop(weakref.ref(cache), 0.01, stop)
+
+    stop.wait.assert_called_with(0.01)
+    assert _entries(cache) == 0
+
+
+def test_memory_cache_background_sweeper_stops_with_cache() -> None:
+    # a long interval keeps the thread blocked until the finalizer stops it
+    cache = MemoryCache(sweep_interval=60)
+    cache_ref = weakref.ref(cache)
+    del cache
+    _ = gc.collect()
+    assert cache_ref() is None
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and any(t.name == 'py-cachify-sweeper' for t in threading.enumerate()):
+        time.sleep(0.01)
+    assert not any(t.name == 'py-cachify-sweeper' for t in threading.enumerate())
+
+
+def test_sweeper_loop_exits_when_cache_is_gone() -> None:
+    _sweeper_loop(lambda: None, 0, threading.Event())  # pyright: ignore[reportArgumentType]
+
+
+def test_bounded_memory_cache_uses_one_shard_and_exact_budgets() -> None:
+    assert len(MemoryCache()._shards) == 16
+    by_bytes = MemoryCache(max_bytes=1000)
+    for i in range(5):
+        by_bytes.set(f'k{i}', b'x' * 150)
+
+    assert len(by_bytes._shards) == 1
+    assert all(by_bytes.get(f'k{i}') == b'x' * 150 for i in range(5))
+
+    for max_entries in (10, 100):
+        by_entries = MemoryCache(max_entries=max_entries, evictable=_any_key)
+        for i in range(2 * max_entries):
+            by_entries.set(f'k{i}', i)
+        assert _entries(by_entries) == max_entries
+
+    with pytest.raises(ValueError, match='stripes=1'):
+        _ = MemoryCache(max_entries=32, stripes=4)
+
+
+def test_memory_cache_stripes_keep_keys_apart() -> None:
+    cache = MemoryCache(stripes=8)
+    for i in range(100):
+        cache.set(f'k{i}', i)
+
+    assert _entries(cache) == 100
+    assert sum(1 for shard in cache._shards if len(shard)) > 1
+    assert all(cache.get(f'k{i}') == i for i in range(100))
+
+    cache.clear()
+    assert _entries(cache) == 0
+    assert cache.get('k1') is None
+
+
+def test_memory_cache_get_keeps_value_overwritten_during_expiry(mocker: MockerFixture) -> None:
+    cache = MemoryCache(stripes=1)
+    mocker.patch.object(time, 'time', return_value=100)
+    cache.set('key', 'old', ex=10)
+
+    def overwrite_and_advance() -> float:
+        cache._shards[0]._cache['key'] = 'new', None
+        return 200
+
+    mocker.patch.object(time, 'time', side_effect=overwrite_and_advance)
+    assert cache.get('key') is None
+    assert cache.get('key') == 'new'
+
+
+def test_memory_cache_nx_is_exclusive_across_threads() -> None:
+    cache = MemoryCache()
+    acquired: list[int] = []
+    barrier = threading.Barrier(8)
+
+    def contend(worker: int) -> None:
+        _ = barrier.wait()
+        for i in range(200):
+            if cache.set(f'lock-{i}', worker, ex=10, nx=True):
+                acquired.append(i)
+
+    threads = [threading.Thread(target=contend, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(acquired) == list(range(200))
+
+
 @pytest.mark.asyncio
 async def test_async_wrapper_get(async_wrapper: AsyncWrapper, mocker: MockerFixture) -> None:
     mocker.patch.object(time, 'time', return_value=0)
@@ -103,6 +403,271 @@ async def test_async_wrapper_set(async_wrapper: AsyncWrapper, mocker: MockerFixt
     assert async_wrapper._cache.get('key') == 'value'
 
 
+def test_async_wrapper_works_across_event_loops(async_wrapper: AsyncWrapper) -> None:
+    async def roundtrip(key: str) -> Any:
+        assert await async_wrapper.set(key, 'value', nx=True) is True
+        return await async_wrapper.get(key)
+
+    assert asyncio.run(roundtrip('first-loop')) == 'value'
+    assert asyncio.run(roundtrip('second-loop')) == 'value'
+
+    results: list[Any] = []
+    thread = threading.Thread(target=lambda: results.append(asyncio.run(roundtrip('thread-loop'))))
+    thread.start()
+    thread.join()
+    assert results == ['value']
+
+
+def test_cachify_client_defaults_to_pickle_serializer(cachify: CachifyClient) -> None:
+    assert isinstance(cachify.serializer, PickleSerializer)
+
+
+def test_cachify_client_uses_given_serializer_for_values_only(
+    cachify: CachifyClient, memory_cache: MemoryCache
+) -> None:
+    serializer = JSONSerializer()
+    cachify.set('key', {'a': 1}, serializer=serializer)
+
+    assert memory_cache.get('_PYC_key') == b'{"a":1}'
+    assert cachify.get('key', serializer=serializer) == {'a': 1}
+
+    # internal state without an explicit serializer is pickled
+    cachify.set('state', {'a': 1})
+    assert cachify.get('state') == {'a': 1}
+    assert memory_cache.get('_PYC_state') != b'{"a":1}'
+
+
+@pytest.mark.asyncio
+async def test_cachify_client_async_uses_given_serializer(cachify: CachifyClient, memory_cache: MemoryCache) -> None:
+    serializer = JSONSerializer()
+    await cachify.a_set('key', [1, 2], serializer=serializer)
+
+    assert memory_cache.get('_PYC_key') == b'[1,2]'
+    assert await cachify.a_get('key', serializer=serializer) == [1, 2]
+    assert await cachify.a_get('missing', serializer=serializer) is None
+
+
+def test_cachify_client_compresses_large_values(memory_cache: MemoryCache, async_wrapper: AsyncWrapper) -> None:
+    client = CachifyClient(
+        sync_client=memory_cache,
+        async_client=async_wrapper,
+        default_expiration=30,
+        prefix='_PYC_',
+        compressor=ZlibCompressor(),
+        compress_threshold=100,
+    )
+    large = 'row;' * 1000
+    client.set('large', large)
+    client.set('small', 'row')
+
+    assert memory_cache.get('_PYC_large')[0] == ZlibCompressor.codec_id
+    assert len(memory_cache.get('_PYC_large')) < len(large)
+    assert memory_cache.get('_PYC_small')[0] == 0x80
+    assert client.get('large') == large
+    assert client.get('small') == 'row'
+
+
+@pytest.mark.asyncio
+async def test_cachify_client_compresses_large_values_async(
+    memory_cache: MemoryCache, async_wrapper: AsyncWrapper
+) -> None:
+    client = CachifyClient(
+        sync_client=memory_cache,
+        async_client=async_wrapper,
+        default_expiration=30,
+        prefix='_PYC_',
+        compressor=LzmaCompressor(),
+        compress_threshold=100,
+    )
+    large = b'row;' * 1000
+    await client.a_set('large', large, serializer=RawSerializer())
+    await client.a_set('small', b'\x01raw', serializer=RawSerializer())
+
+    assert memory_cache.get('_PYC_large')[0] == LzmaCompressor.codec_id
+    assert memory_cache.get('_PYC_small') == b'\x00\x01raw'
+    assert await client.a_get('large', serializer=RawSerializer()) == large
+    assert await client.a_get('small', serializer=RawSerializer()) == b'\x01raw'
+
+
+def test_memory_cache_copier_requires_store_objects() -> None:
+    with pytest.raises(ValueError, match='store_objects'):
+        _ = MemoryCache(copier=copy.deepcopy)
+
+
+def test_cachify_client_stores_live_objects() -> None:
+    cache = MemoryCache(store_objects=True)
+    client = CachifyClient(sync_client=cache, async_client=AsyncWrapper(cache), default_expiration=30, prefix='_PYC_')
+    value = {'rows': [1, 2, 3]}
+    client.set('key', value, serializer=JSONSerializer())
+
+    assert cache.get('_PYC_key') is value
+    assert client.get('key') is value
+    assert client.get('missing') is None
+
+
+def test_cachify_client_copies_live_objects_on_read() -> None:
+    cache = MemoryCache(store_objects=True, copier=copy.deepcopy)
+    client = CachifyClient(sync_client=cache, async_client=AsyncWrapper(cache), default_expiration=30, prefix='_PYC_')
+    value = {'rows': [1, 2, 3]}
+    client.set('key', value)
+    client.set('entry', CacheEntry(value=value, stored_at=1.0))
+
+    read = client.get('key')
+    read['rows'].append(4)
+    assert read is not value
+    assert client.get('key') == {'rows': [1, 2, 3]}
+
+    entry = client.get('entry')
+    assert entry == CacheEntry(value=value, stored_at=1.0)
+    assert entry.value is not value
+
+
+@pytest.mark.asyncio
+async def test_cachify_client_stores_live_objects_async() -> None:
+    cache = MemoryCache(store_objects=True, copier=list)
+    client = CachifyClient(sync_client=cache, async_client=AsyncWrapper(cache), default_expiration=30, prefix='_PYC_')
+    value = [1, 2]
+    await client.a_set('key', value)
+
+    assert cache.get('_PYC_key') is value
+    assert await client.a_get('key') == value
+    assert await client.a_get('key') is not value
+    assert await client.a_get('missing') is None
+
+
+def _batch_instance(sync_client: Any, async_client: Any) -> Cachify:
+    return Cachify(
+        sync_client=sync_client, async_client=async_client, prefix='_PYC_', default_expiration=30, default_cache_ttl=60
+    )
+
+
+def test_memory_cache_mget(memory_cache: MemoryCache) -> None:
+    memory_cache.set('a', b'1')
+    memory_cache.set('b', b'2', ex=-1)
+
+    assert memory_cache.mget(['a', 'b', 'c']) == [b'1', None, None]
+
+
+def test_cachify_batch_methods_on_memory_cache(cachify_instance: Cachify, memory_cache: MemoryCache) -> None:
+    cachify_instance.set_many({'a': 1, 'b': [2], 'c': None})
+
+    assert cachify_instance.get_many(['a', 'b', 'c', 'missing']) == {'a': 1, 'b': [2], 'c': None}
+    assert cachify_instance._client.get('b') == [2]
+
+    cachify_instance.delete_many(['a', 'c'])
+    assert cachify_instance.get_many(iter(['a', 'b', 'c'])) == {'b': [2]}
+    assert memory_cache.get('_PYC_a') is None
+
+
+def test_cachify_set_many_resolves_ttls(mocker: MockerFixture) -> None:
+    instance = _batch_instance(MemoryCache(), AsyncWrapper(MemoryCache()))
+    set_many = mocker.spy(instance._client, 'set_many')
+
+    instance.set_many({'a': 1, 'b': 2})
+    instance.set_many({'a': 1, 'b': 2}, ttl=None)
+    instance.set_many({'a': 1, 'b': 2}, ttl={'a': 5})
+
+    assert [call.kwargs['ttl'] for call in set_many.call_args_list] == [60, None, {'a': 5, 'b': 60}]
+
+
+def test_cachify_batch_methods_use_mget_and_pipeline(mocker: MockerFixture, pipelined_client: Any) -> None:
+    client = pipelined_client
+    instance = _batch_instance(client, client.as_async())
+    cache_set = mocker.spy(client.cache, 'set')
+
+    instance.set_many({'a': 1, 'b': 2}, ttl={'a': 5})
+    assert instance.get_many(['a', 'b', 'c']) == {'a': 1, 'b': 2}
+    instance.delete_many(['a', 'b'])
+
+    assert client.calls == ['pipeline _PYC_a _PYC_b', 'mget _PYC_a _PYC_b _PYC_c', 'delete _PYC_a _PYC_b']
+    assert client.transactions == [False]
+    assert [(call.args[0], call.kwargs['ex']) for call in cache_set.call_args_list] == [('_PYC_a', 5), ('_PYC_b', 60)]
+    assert client.cache.mget(['_PYC_a', '_PYC_b']) == [None, None]
+
+
+def test_cachify_batch_methods_fall_back_to_single_key_calls(fake_client: Any) -> None:
+    client = fake_client
+    instance = _batch_instance(client, client.as_async())
+
+    instance.set_many({'a': 1, 'b': 2})
+    assert instance.get_many(['a', 'c']) == {'a': 1}
+    instance.delete_many(['a', 'b'])
+
+    assert client.calls == ['set _PYC_a', 'set _PYC_b', 'get _PYC_a', 'get _PYC_c', 'delete _PYC_a _PYC_b']
+
+
+def test_cachify_batch_methods_skip_empty_batches(pipelined_client: Any) -> None:
+    client = pipelined_client
+    instance = _batch_instance(client, client.as_async())
+
+    instance.set_many({})
+    assert instance.get_many([]) == {}
+    instance.delete_many([])
+
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_cachify_async_batch_methods_use_mget_and_pipeline(pipelined_client: Any) -> None:
+    client = pipelined_client
+    instance = _batch_instance(MemoryCache(), client.as_async())
+
+    await instance.a_set_many({'a': 1, 'b': 2}, ttl=10)
+    assert await instance.a_get_many(['a', 'b', 'c']) == {'a': 1, 'b': 2}
+    await instance.a_delete_many(['a'])
+    assert await instance.a_get_many(['a', 'b']) == {'b': 2}
+
+    assert client.calls == [
+        'pipeline _PYC_a _PYC_b',
+        'mget _PYC_a _PYC_b _PYC_c',
+        'delete _PYC_a',
+        'mget _PYC_a _PYC_b',
+    ]
+    assert client.transactions == [False]
+
+
+@pytest.mark.asyncio
+async def test_cachify_async_batch_methods_fall_back_to_single_key_calls(fake_client: Any) -> None:
+    client = fake_client
+    instance = _batch_instance(MemoryCache(), client.as_async())
+
+    await instance.a_set_many({'a': 1, 'b': 2})
+    assert await instance.a_get_many(['a', 'c']) == {'a': 1}
+    await instance.a_delete_many(['a', 'b'])
+
+    assert client.calls == ['set _PYC_a', 'set _PYC_b', 'get _PYC_a', 'get _PYC_c', 'delete _PYC_a _PYC_b']
+
+
+@pytest.mark.asyncio
+async def test_cachify_async_batch_methods_skip_empty_batches(cachify_instance: Cachify) -> None:
+    await cachify_instance.a_set_many({}, serializer=JSONSerializer())
+    assert await cachify_instance.a_get_many([], serializer=JSONSerializer()) == {}
+    await cachify_instance.a_delete_many([])
+
+
+@pytest.mark.asyncio
+async def test_cachify_async_batch_methods_on_memory_cache(cachify_instance: Cachify) -> None:
+    await cachify_instance.a_set_many({'a': [1]}, serializer=JSONSerializer())
+
+    assert await cachify_instance.a_get_many(['a'], serializer=JSONSerializer()) == {'a': [1]}
+    assert cachify_instance.get_many(['a'], serializer=JSONSerializer()) == {'a': [1]}
+
+
+def test_init_cachify_passes_compression() -> None:
+    instance = init_cachify(compressor=ZlibCompressor(), compress_threshold=10, is_global=False)
+
+    assert instance._client._compression is not None
+    assert instance._client._compression._threshold == 10
+    assert init_cachify(is_global=False)._client._compression is None
+
+
+def test_init_cachify_passes_serializer() -> None:
+    serializer = JSONSerializer()
+    instance = init_cachify(serializer=serializer, is_global=False)
+
+    assert instance._client.serializer is serializer
+
+
 def test_cachify_set_and_get(cachify: CachifyClient) -> None:
     cachify.set('key', 'value', ttl=10)
     assert cachify.get('key') == 'value'
@@ -204,6 +769,7 @@ def test_get_cachify_client_returns_global_value(init_cachify_fixture: None) ->
 
 def test_cachify_cached_delegates_to__cached_impl(cachify_instance: Cachify, mocker: MockerFixture) -> None:
     dummy_cached = SimpleNamespace()
+    serializer = JSONSerializer()
     mocked_impl = mocker.patch(
         'py_cachify._backend._cached._cached_impl',
         return_value=dummy_cached,
@@ -213,6 +779,14 @@ def test_cachify_cached_delegates_to__cached_impl(cachify_instance: Cachify, moc
         key='k-{x}',
         ttl=123,
         enc_dec=('enc', 'dec'),  # pyright: ignore[reportArgumentType]
+        stampede='lease',
+        lease_ttl=3,
+        soft_ttl=1,
+        early_recompute=1.5,
+        cache_none=True,
+        none_ttl=5,
+        serializer=serializer,
+        batch_window=0.005,
     )
 
     assert result is dummy_cached
@@ -221,6 +795,14 @@ def test_cachify_cached_delegates_to__cached_impl(cachify_instance: Cachify, moc
     assert call.kwargs['key'] == 'k-{x}'
     assert call.kwargs['ttl'] == 123
     assert call.kwargs['enc_dec'] == ('enc', 'dec')
+    assert call.kwargs['stampede'] == 'lease'
+    assert call.kwargs['lease_ttl'] == 3
+    assert call.kwargs['soft_ttl'] == 1
+    assert call.kwargs['early_recompute'] == 1.5
+    assert call.kwargs['cache_none'] is True
+    assert call.kwargs['none_ttl'] == 5
+    assert call.kwargs['serializer'] is serializer
+    assert call.kwargs['batch_window'] == 0.005
 
     client_provider = call.kwargs['client_provider']
     client = client_provider()
@@ -360,7 +942,7 @@ def test_init_cachify_uses_provided_async_client_unchanged() -> None:
     assert cachify_instance._client._async_client is explicit_async
 
 
-def test_init_cachify_creates_new_memory_cache_when_sync_not_memorycache(mocker: MockerFixture) -> None:
+def test_init_cachify_derives_threaded_async_client_when_sync_not_memorycache(mocker: MockerFixture) -> None:
     py_cachify._backend._lib._cachify = None
 
     class DummySyncClient:
@@ -385,8 +967,7 @@ def test_init_cachify_creates_new_memory_cache_when_sync_not_memorycache(mocker:
     # internal sync client is our dummy
     assert cachify_instance._client._sync_client is sync_client
 
-    # async client must be AsyncWrapper with a fresh MemoryCache, not the dummy
+    # async client must offload the dummy onto threads, so both code paths share the same backend
     async_client = cachify_instance._client._async_client
-    assert isinstance(async_client, AsyncWrapper)
-    assert async_client._cache is not sync_client
-    assert isinstance(async_client._cache, MemoryCache)
+    assert isinstance(async_client, ThreadedAsyncClient)
+    assert async_client.sync_client is sync_client
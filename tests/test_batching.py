@@ -0,0 +1,176 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from py_cachify import JSONSerializer, MemoryCache, RawSerializer, init_cachify
+from py_cachify._backend._clients import AsyncWrapper
+from py_cachify._backend._lib import Cachify, CachifyClient
+
+
+@pytest.fixture
+def instance(pipelined_client: Any) -> Cachify:
+    return init_cachify(
+        sync_client=MemoryCache(), async_client=pipelined_client.as_async(), prefix='B-', is_global=False
+    )
+
+
+async def test_cached_batch_window_collapses_concurrent_lookups(instance: Cachify, pipelined_client: Any) -> None:
+    calls: list[str] = []
+
+    @instance.cached(key='user-{user_id}', batch_window=0)
+    async def get_user(user_id: int) -> str:
+        calls.append('user')
+        return f'user-{user_id}'
+
+    @instance.cached(key='order-{order_id}', batch_window=0, serializer=JSONSerializer())
+    async def get_order(order_id: int) -> dict[str, int]:
+        calls.append('order')
+        return {'id': order_id}
+
+    first = await asyncio.gather(get_user(1), get_user(2), get_order(1), get_user(1))
+    second = await asyncio.gather(get_user(1), get_user(2), get_order(1))
+
+    assert first == ['user-1', 'user-2', {'id': 1}, 'user-1']
+    assert second == ['user-1', 'user-2', {'id': 1}]
+    assert calls == ['user', 'user', 'order']
+    assert pipelined_client.calls == [
+        'mget B-user-1-cached B-user-2-cached B-order-1-cached',
+        'pipeline B-user-1-cached B-user-2-cached B-order-1-cached',
+        'mget B-user-1-cached B-user-2-cached B-order-1-cached',
+    ]
+
+
+async def test_cached_batch_window_collects_lookups_spread_over_the_window(
+    instance: Cachify, pipelined_client: Any
+) -> None:
+    @instance.cached(key='item-{x}', batch_window=0.05)
+    async def get_item(x: int) -> int:
+        return x
+
+    async def delayed(x: int) -> int:
+        await asyncio.sleep(0.01 * x)
+        return await get_item(x)
+
+    assert await asyncio.gather(delayed(0), delayed(1), delayed(2)) == [0, 1, 2]
+    assert pipelined_client.calls[0] == 'mget B-item-0-cached B-item-1-cached B-item-2-cached'
+    assert len(pipelined_client.calls) == 2
+
+
+async def test_cached_batch_window_with_envelope_and_lease(instance: Cachify, pipelined_client: Any) -> None:
+    @instance.cached(key='neg-{x}', batch_window=0, cache_none=True, stampede='lease', soft_ttl=60)
+    async def lookup(x: int) -> Optional[int]:
+        return None
+
+    assert await asyncio.gather(lookup(1), lookup(2)) == [None, None]
+    assert await asyncio.gather(lookup(1), lookup(2)) == [None, None]
+    assert [call for call in pipelined_client.calls if call.startswith('mget')][
+        -1
+    ] == 'mget B-neg-1-cached B-neg-2-cached'
+
+
+def test_cached_batch_window_must_not_be_negative(instance: Cachify) -> None:
+    with pytest.raises(ValueError, match='batch_window'):
+        _ = instance.cached(key='x', batch_window=-1)
+
+
+def test_cached_batch_window_is_rejected_for_sync_functions(instance: Cachify) -> None:
+    def get_item(x: int) -> int:
+        return x
+
+    with pytest.raises(ValueError, match='batch_window is only supported for async functions'):
+        _ = instance.cached(key='item-{x}', batch_window=0)(get_item)
+
+
+async def test_loader_read_your_writes_and_last_write_wins(instance: Cachify, pipelined_client: Any) -> None:
+    loader = instance._client.a_batch_loader(0)
+
+    first = loader.set('k', 1, 10, None)
+    second = loader.set('k', 2, None, None)
+    read = loader.get('k', None)
+
+    assert await asyncio.gather(first, second, read) == [None, None, 2]
+    assert pipelined_client.calls == ['pipeline B-k']
+    assert await instance._client.a_get('k') == 2
+
+
+async def test_loader_deduplicates_keys_and_decodes_per_serializer(instance: Cachify, pipelined_client: Any) -> None:
+    _ = pipelined_client.set('B-raw', b'[1]')
+    loader = instance._client.a_batch_loader(0)
+
+    res = await asyncio.gather(
+        loader.get('raw', RawSerializer()), loader.get('raw', JSONSerializer()), loader.get('missing', None)
+    )
+
+    assert res == [b'[1]', [1], None]
+    assert pipelined_client.calls[1:] == ['mget B-raw B-missing']
+
+
+async def test_loader_propagates_backend_errors(instance: Cachify, pipelined_client: Any) -> None:
+    pipelined_client.fail = True
+    loader = instance._client.a_batch_loader(0)
+
+    res = await asyncio.gather(loader.get('a', None), loader.set('b', 1, None, None), return_exceptions=True)
+
+    assert [type(exc) for exc in res] == [ConnectionError, ConnectionError]
+
+
+async def test_loader_propagates_decode_errors_to_the_caller_only(instance: Cachify, pipelined_client: Any) -> None:
+    _ = pipelined_client.set('B-text', b'not json')
+    loader = instance._client.a_batch_loader(0)
+
+    res = await asyncio.gather(
+        loader.get('text', JSONSerializer()), loader.get('text', RawSerializer()), return_exceptions=True
+    )
+
+    assert isinstance(res[0], ValueError)
+    assert res[1] == b'not json'
+
+
+async def test_loader_skips_cancelled_callers(instance: Cachify, pipelined_client: Any) -> None:
+    _ = pipelined_client.set('B-c', instance._client._async_encode(3, None))
+    loader = instance._client.a_batch_loader(0)
+    cancelled_get, cancelled_set = loader.get('a', None), loader.set('b', 1, None, None)
+    kept = loader.get('c', None)
+    _ = cancelled_get.cancel()
+    _ = cancelled_set.cancel()
+
+    assert await kept == 3
+    assert pipelined_client.calls[1:] == ['mget B-a B-c', 'pipeline B-b']
+
+
+async def test_loader_failure_after_cancelled_callers(instance: Cachify, pipelined_client: Any) -> None:
+    pipelined_client.fail = True
+    loader = instance._client.a_batch_loader(0)
+    cancelled = loader.get('a', None)
+    _ = cancelled.cancel()
+
+    with pytest.raises(ConnectionError):
+        await loader.get('c', None)
+
+
+def test_batch_loaders_are_per_event_loop_and_window() -> None:
+    client = CachifyClient(
+        sync_client=MemoryCache(), async_client=AsyncWrapper(MemoryCache()), default_expiration=30, prefix=''
+    )
+
+    async def loaders() -> tuple[Any, Any, Any]:
+        return client.a_batch_loader(0), client.a_batch_loader(0), client.a_batch_loader(0.01)
+
+    first, same, other_window = asyncio.run(loaders())
+    other_loop, _, _ = asyncio.run(loaders())
+
+    assert first is same
+    assert first is not other_window
+    assert first is not other_loop
+
+
+async def test_loader_falls_back_to_single_key_calls() -> None:
+    cache = MemoryCache()
+    client = CachifyClient(sync_client=cache, async_client=AsyncWrapper(cache), default_expiration=30, prefix='')
+    loader = client.a_batch_loader(0)
+
+    _ = await asyncio.gather(loader.set('a', 1, None, None), loader.set('b', 2, 5, None))
+
+    assert await asyncio.gather(loader.get('a', None), loader.get('b', None)) == [1, 2]
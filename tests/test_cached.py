@@ -1,13 +1,20 @@
 # pyright: reportPrivateUsage=false
+import asyncio
 import inspect
 import sys
-from typing import Optional
+import threading
+import time
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 import pytest
 from pytest_mock import MockerFixture
 
-from py_cachify import CachifyInitError, cached, init_cachify
-from py_cachify._backend._lib import Cachify, CachifyClient
+from py_cachify import CachifyInitError, JSONSerializer, OutOfBandPickleSerializer, RawSerializer, cached, init_cachify
+from py_cachify._backend._cache_entry import CacheEntry, FramedEntrySerializer
+from py_cachify._backend._cached import _a_compute_under_lease, _check_freshness, _compute_under_lease
+from py_cachify._backend._lib import Cachify, CachifyClient, get_cachify_client
 from py_cachify._backend._types._common import UNSET
 
 
@@ -74,6 +81,26 @@ async def test_cached_decorator_with_encoder_and_decoder(init_cachify_fixture: N
     decoder_spy.assert_called_once_with(12)
 
 
+@pytest.mark.parametrize('key', ['sum-{a}', 'constant'])
+async def test_cached_rejects_invalid_calls_on_a_cache_hit(init_cachify_fixture: None, key: str) -> None:
+    @cached(key=key)
+    def sync_sum(a: int, b: int = 1) -> int:
+        return a + b
+
+    @cached(key=f'async-{key}')
+    async def async_sum(a: int, b: int = 1) -> int:
+        return a + b
+
+    assert sync_sum(1) == 2
+    assert await async_sum(1) == 2
+
+    for args, kwargs in (((1,), {'unknown': 3}), ((), {'b': 3})):
+        with pytest.raises(TypeError):
+            _ = sync_sum(*args, **kwargs)
+        with pytest.raises(TypeError):
+            _ = await async_sum(*args, **kwargs)
+
+
 def test_cached_decorator_check_cachify_init() -> None:
     sync_function_wrapped = cached(key='test_key')(sync_function)
     with pytest.raises(CachifyInitError, match='Cachify is not initialized, did you forget to call `init_cachify`?'):
@@ -345,3 +372,683 @@ def test_cached_accepts_unset_type_ttl_without_overriding_default(mocker: Mocker
     assert spy_set.call_count == 1
     _, kwargs = spy_set.call_args
     assert kwargs['ex'] == 33
+
+
+def test_cached_coalesces_concurrent_sync_misses(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+    started = threading.Event()
+
+    @cached(key='coalesce_sync_{arg}')
+    def slow(arg: int) -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return arg * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        first = executor.submit(slow, 4)
+        _ = started.wait(1)
+        rest = [executor.submit(slow, 4) for _ in range(7)]
+
+    assert [f.result() for f in [first, *rest]] == [8] * 8
+    assert sum(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_async_misses(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    @cached(key='coalesce_async_{arg}')
+    async def slow(arg: int) -> int:
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return arg * 2
+
+    results = await asyncio.gather(*(slow(4) for _ in range(10)), slow(5))
+
+    assert results == [8] * 10 + [10]
+    assert sum(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesced_async_misses_share_errors(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    @cached(key='coalesce_async_error')
+    async def failing() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise RuntimeError('boom')
+
+    results = await asyncio.gather(failing(), failing(), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert sum(calls) == 1
+
+
+def test_cached_rejects_unknown_stampede_mode() -> None:
+    with pytest.raises(ValueError, match="Unknown stampede mode 'probabilistic'"):
+        _ = cached(key='k', stampede='probabilistic')  # pyright: ignore[reportArgumentType]
+
+
+def test_cached_lease_makes_other_processes_wait_for_value(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+    started = threading.Event()
+
+    def report(arg: int) -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return arg * 3
+
+    # separately decorated functions do not share the in-process single-flight, like two different processes
+    node_a = cached(key='lease_report_{arg}', stampede='lease')(report)
+    node_b = cached(key='lease_report_{arg}', stampede='lease')(report)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(node_a, 2)
+        _ = started.wait(1)
+        second = executor.submit(node_b, 2)
+
+    assert first.result() == 6
+    assert second.result() == 6
+    assert sum(calls) == 1
+    assert get_cachify_client().get(key='lease_report_2-cached-lease') is None
+
+
+def test_cached_lease_is_taken_over_when_holder_fails(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+    started = threading.Event()
+
+    def failing(arg: int) -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError('db is down')
+
+    def working(arg: int) -> int:
+        calls.append(1)
+        return arg
+
+    node_a = cached(key='lease_takeover_{arg}', stampede='lease')(failing)
+    node_b = cached(key='lease_takeover_{arg}', stampede='lease')(working)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(node_a, 1)
+        _ = started.wait(1)
+        second = executor.submit(node_b, 1)
+
+    with pytest.raises(RuntimeError, match='db is down'):
+        _ = first.result()
+    assert second.result() == 1
+    assert sum(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_lease_makes_other_processes_wait_for_value_async(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    async def report(arg: int) -> int:
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return arg * 3
+
+    node_a = cached(key='lease_report_async_{arg}', stampede='lease')(report)
+    node_b = cached(key='lease_report_async_{arg}', stampede='lease')(report)
+
+    assert await asyncio.gather(node_a(2), node_b(2)) == [6, 6]
+    assert sum(calls) == 1
+    assert await get_cachify_client().a_get(key='lease_report_async_2-cached-lease') is None
+
+
+@pytest.mark.asyncio
+async def test_cached_lease_is_taken_over_when_holder_fails_async(init_cachify_fixture: None) -> None:
+    async def failing(arg: int) -> int:
+        await asyncio.sleep(0.05)
+        raise RuntimeError('db is down')
+
+    async def working(arg: int) -> int:
+        return arg
+
+    node_a = cached(key='lease_takeover_async_{arg}', stampede='lease')(failing)
+    node_b = cached(key='lease_takeover_async_{arg}', stampede='lease')(working)
+
+    results = await asyncio.gather(node_a(1), node_b(1), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == 1
+
+
+def test_compute_under_lease_rechecks_cache_after_waiting(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    client = get_cachify_client()
+    _ = mocker.patch.object(client, 'try_acquire_lock', side_effect=[False, True])
+    lookups = iter([UNSET, 'stored-by-previous-holder'])
+    compute = mocker.Mock()
+
+    result = _compute_under_lease(client, 'k', 5, compute, lambda: next(lookups))
+
+    assert result == 'stored-by-previous-holder'
+    compute.assert_not_called()
+
+
+@pytest.mark.parametrize('is_async', [False, True])
+async def test_leader_past_the_lease_ttl_keeps_the_next_lease(init_cachify_fixture: None, is_async: bool) -> None:
+    client = get_cachify_client()
+
+    def overrun() -> str:
+        # the lease expired while computing and another process took it over
+        client.delete(key='k-lease')
+        assert client.try_acquire_lock(key='k-lease', ttl=5, token='next-leader')
+        return 'value'
+
+    async def a_overrun() -> str:
+        return overrun()
+
+    async def lookup() -> Any:
+        return UNSET
+
+    if is_async:
+        assert await _a_compute_under_lease(client, 'k', 5, a_overrun, lookup) == 'value'
+    else:
+        assert _compute_under_lease(client, 'k', 5, overrun, lambda: UNSET) == 'value'
+
+    assert not client.try_acquire_lock(key='k-lease', ttl=5)
+    assert client.release_lock(key='k-lease', token='next-leader')
+
+
+@pytest.mark.asyncio
+async def test_a_compute_under_lease_rechecks_cache_after_waiting(
+    init_cachify_fixture: None, mocker: MockerFixture
+) -> None:
+    client = get_cachify_client()
+    _ = mocker.patch.object(client, 'a_try_acquire_lock', side_effect=[False, True])
+    lookups = iter([UNSET, 'stored-by-previous-holder'])
+    compute = mocker.AsyncMock()
+
+    async def lookup() -> Any:
+        return next(lookups)
+
+    result = await _a_compute_under_lease(client, 'k', 5, compute, lookup)
+
+    assert result == 'stored-by-previous-holder'
+    compute.assert_not_called()
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, 'condition was not met in time'
+        time.sleep(0.01)
+
+
+async def _a_wait_until(predicate: Callable[[], Awaitable[bool]], timeout: float = 2.0) -> None:
+    deadline = time.time() + timeout
+    while not await predicate():
+        assert time.time() < deadline, 'condition was not met in time'
+        await asyncio.sleep(0.01)
+
+
+def test_cached_soft_ttl_stores_entry_timestamp(init_cachify_fixture: None) -> None:
+    wrapped = cached(key='swr_envelope_{arg}', soft_ttl=10)(lambda arg: arg + 1)
+
+    assert wrapped(1) == 2
+
+    entry = get_cachify_client().get(key='swr_envelope_1-cached')
+    assert isinstance(entry, CacheEntry)
+    assert entry.value == 2
+    assert time.time() - entry.stored_at < 5
+
+
+def test_cached_soft_ttl_serves_stale_and_refreshes_in_background(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+    release = threading.Event()
+
+    def compute(arg: int) -> str:
+        calls.append(1)
+        _ = release.wait(2)
+        return f'fresh-{arg}'
+
+    wrapped = cached(key='swr_sync_{arg}', soft_ttl=5, enc_dec=(str.upper, str.lower))(compute)
+    client = get_cachify_client()
+    client.set(key='swr_sync_1-cached', val=CacheEntry(value='STALE', stored_at=time.time() - 10))
+
+    # stale value is returned right away, the refresh is started only once while it is in flight
+    assert [wrapped(1) for _ in range(5)] == ['stale'] * 5
+    release.set()
+
+    _wait_until(lambda: client.get(key='swr_sync_1-cached').value == 'FRESH-1')
+    assert wrapped(1) == 'fresh-1'
+    assert sum(calls) == 1
+
+
+def test_cached_soft_ttl_background_refresh_failure_is_logged(
+    init_cachify_fixture: None, mocker: MockerFixture
+) -> None:
+    warning = mocker.patch('py_cachify._backend._cached.logger.warning')
+
+    def compute(arg: int) -> int:
+        raise RuntimeError('db is down')
+
+    wrapped = cached(key='swr_sync_fail_{arg}', soft_ttl=5)(compute)
+    get_cachify_client().set(key='swr_sync_fail_1-cached', val=CacheEntry(value=1, stored_at=time.time() - 10))
+
+    assert wrapped(1) == 1
+    _wait_until(lambda: warning.call_count == 1)
+    assert 'db is down' in warning.call_args.args[0]
+
+
+def test_cached_soft_ttl_treats_plain_values_as_fresh(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    compute = mocker.Mock(return_value=2)
+    wrapped = cached(key='swr_plain_{arg}', soft_ttl=5)(lambda arg: compute(arg))
+    get_cachify_client().set(key='swr_plain_1-cached', val=1)
+
+    assert wrapped(1) == 1
+    compute.assert_not_called()
+
+
+def test_cached_without_soft_ttl_unwraps_entries(init_cachify_fixture: None) -> None:
+    wrapped = cached(key='swr_disabled_{arg}')(lambda arg: arg)
+    get_cachify_client().set(key='swr_disabled_1-cached', val=CacheEntry(value=10, stored_at=0))
+
+    assert wrapped(1) == 10
+
+
+def test_cached_soft_ttl_with_lease_refreshes_once_across_processes(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    def compute(arg: int) -> str:
+        calls.append(1)
+        return 'fresh'
+
+    client = get_cachify_client()
+    client.set(key='swr_lease_1-cached', val=CacheEntry(value='stale', stored_at=time.time() - 10))
+    node_a = cached(key='swr_lease_{arg}', soft_ttl=5, stampede='lease')(compute)
+    node_b = cached(key='swr_lease_{arg}', soft_ttl=5, stampede='lease')(compute)
+
+    # another process holds the lease, so this one keeps serving the stale value without recomputing
+    assert client.try_acquire_lock(key='swr_lease_1-cached-lease', ttl=5)
+    assert node_a(1) == 'stale'
+    time.sleep(0.1)
+    assert sum(calls) == 0
+
+    client.delete(key='swr_lease_1-cached-lease')
+    assert node_b(1) == 'stale'
+    _wait_until(lambda: client.get(key='swr_lease_1-cached').value == 'fresh')
+    assert sum(calls) == 1
+    assert client.get(key='swr_lease_1-cached-lease') is None
+
+
+@pytest.mark.asyncio
+async def test_cached_soft_ttl_serves_stale_and_refreshes_in_background_async(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+    release = asyncio.Event()
+
+    async def compute(arg: int) -> str:
+        calls.append(1)
+        _ = await release.wait()
+        return f'fresh-{arg}'
+
+    wrapped = cached(key='swr_async_{arg}', soft_ttl=5)(compute)
+    client = get_cachify_client()
+    await client.a_set(key='swr_async_1-cached', val=CacheEntry(value='stale', stored_at=time.time() - 10))
+
+    assert await asyncio.gather(*(wrapped(1) for _ in range(5))) == ['stale'] * 5
+    release.set()
+
+    async def _refreshed() -> bool:
+        return (await client.a_get(key='swr_async_1-cached')).value == 'fresh-1'
+
+    await _a_wait_until(_refreshed)
+    assert await wrapped(1) == 'fresh-1'
+    assert sum(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_soft_ttl_background_refresh_failure_is_logged_async(
+    init_cachify_fixture: None, mocker: MockerFixture
+) -> None:
+    warning = mocker.patch('py_cachify._backend._cached.logger.warning')
+
+    async def compute(arg: int) -> int:
+        raise RuntimeError('db is down')
+
+    wrapped = cached(key='swr_async_fail_{arg}', soft_ttl=5)(compute)
+    await get_cachify_client().a_set(key='swr_async_fail_1-cached', val=CacheEntry(value=1, stored_at=0))
+
+    assert await wrapped(1) == 1
+
+    async def _logged() -> bool:
+        return warning.call_count == 1
+
+    await _a_wait_until(_logged)
+    assert 'db is down' in warning.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_cached_soft_ttl_with_lease_refreshes_once_across_processes_async(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    async def compute(arg: int) -> str:
+        calls.append(1)
+        return 'fresh'
+
+    client = get_cachify_client()
+    await client.a_set(key='swr_lease_async_1-cached', val=CacheEntry(value='stale', stored_at=0))
+    node_a = cached(key='swr_lease_async_{arg}', soft_ttl=5, stampede='lease')(compute)
+    node_b = cached(key='swr_lease_async_{arg}', soft_ttl=5, stampede='lease')(compute)
+
+    assert await client.a_try_acquire_lock(key='swr_lease_async_1-cached-lease', ttl=5)
+    assert await node_a(1) == 'stale'
+    await asyncio.sleep(0.05)
+    assert sum(calls) == 0
+
+    await client.a_delete(key='swr_lease_async_1-cached-lease')
+    assert await node_b(1) == 'stale'
+
+    async def _refreshed() -> bool:
+        return (await client.a_get(key='swr_lease_async_1-cached')).value == 'fresh'
+
+    await _a_wait_until(_refreshed)
+    assert sum(calls) == 1
+
+
+def test_check_freshness_early_recompute_probability_depends_on_delta_and_remaining_ttl(
+    mocker: MockerFixture,
+) -> None:
+    now = time.time()
+    slow_entry = CacheEntry(value=1, stored_at=now - 50, delta=2.0, expires_at=now + 5)
+    fast_entry = CacheEntry(value=1, stored_at=now - 50, delta=0.01, expires_at=now + 5)
+    far_entry = CacheEntry(value=1, stored_at=now - 50, delta=2.0, expires_at=now + 500)
+
+    # 1 - 0.95 -> -log(0.05) ~= 3, so the recompute window is ~3 * delta * beta seconds before the expiration
+    _ = mocker.patch('py_cachify._backend._cached.random.random', return_value=0.95)
+
+    assert _check_freshness(slow_entry, soft_ttl=None, early_recompute=1.0) == 'expiring'
+    assert _check_freshness(fast_entry, soft_ttl=None, early_recompute=1.0) == 'fresh'
+    assert _check_freshness(far_entry, soft_ttl=None, early_recompute=1.0) == 'fresh'
+    assert _check_freshness(fast_entry, soft_ttl=None, early_recompute=200.0) == 'expiring'
+    assert _check_freshness(slow_entry, soft_ttl=None, early_recompute=None) == 'fresh'
+    assert _check_freshness(slow_entry, soft_ttl=10, early_recompute=None) == 'stale'
+
+
+def test_check_freshness_ignores_entries_without_expiration() -> None:
+    entry = CacheEntry(value=1, stored_at=0, delta=100.0, expires_at=None)
+
+    assert _check_freshness(entry, soft_ttl=None, early_recompute=100.0) == 'fresh'
+
+
+def test_cached_early_recompute_stores_delta_and_expiration(init_cachify_fixture: None) -> None:
+    def compute(arg: int) -> int:
+        time.sleep(0.05)
+        return arg
+
+    wrapped = cached(key='xfetch_envelope_{arg}', ttl=60, early_recompute=1.0)(compute)
+    assert wrapped(1) == 1
+
+    entry = get_cachify_client().get(key='xfetch_envelope_1-cached')
+    assert isinstance(entry, CacheEntry)
+    assert entry.delta >= 0.05
+    assert entry.expires_at is not None
+    assert entry.expires_at - entry.stored_at == 60
+
+
+def test_cached_early_recompute_recomputes_in_foreground(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    calls: list[int] = []
+
+    def compute(arg: int) -> int:
+        calls.append(1)
+        return len(calls)
+
+    wrapped = cached(key='xfetch_sync_{arg}', ttl=60, early_recompute=1.0)(compute)
+    client = get_cachify_client()
+    client.set(key='xfetch_sync_1-cached', val=CacheEntry(value=0, stored_at=0, delta=1.0, expires_at=time.time() + 1))
+
+    random_mock = mocker.patch('py_cachify._backend._cached.random.random', return_value=0.0)
+    assert wrapped(1) == 0
+    assert calls == []
+
+    random_mock.return_value = 0.9999
+    assert wrapped(1) == 1
+    assert client.get(key='xfetch_sync_1-cached').value == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_early_recompute_recomputes_in_foreground_async(
+    init_cachify_fixture: None, mocker: MockerFixture
+) -> None:
+    calls: list[int] = []
+
+    async def compute(arg: int) -> int:
+        calls.append(1)
+        return len(calls)
+
+    wrapped = cached(key='xfetch_async_{arg}', ttl=60, early_recompute=1.0)(compute)
+    client = get_cachify_client()
+    await client.a_set(
+        key='xfetch_async_1-cached', val=CacheEntry(value=0, stored_at=0, delta=1.0, expires_at=time.time() + 1)
+    )
+
+    random_mock = mocker.patch('py_cachify._backend._cached.random.random', return_value=0.0)
+    assert await wrapped(1) == 0
+
+    random_mock.return_value = 0.9999
+    assert await wrapped(1) == 1
+    assert (await client.a_get(key='xfetch_async_1-cached')).value == 1
+
+
+def test_cached_cache_none_stores_negative_results(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    calls: list[int] = []
+
+    def find_user(user_id: int) -> Optional[str]:
+        calls.append(1)
+        return None
+
+    client = get_cachify_client()
+    spy_set = mocker.spy(client._sync_client, 'set')  # type: ignore[attr-defined]
+    wrapped = cached(key='negative_{user_id}', ttl=60, cache_none=True, none_ttl=5)(find_user)
+
+    assert wrapped(1) is None
+    assert wrapped(1) is None
+    assert sum(calls) == 1
+    assert spy_set.call_args.kwargs['ex'] == 5
+
+    entry = client.get(key='negative_1-cached')
+    assert isinstance(entry, CacheEntry)
+    assert entry.value is None
+
+
+def test_cached_cache_none_keeps_regular_ttl_and_format_for_other_results(
+    init_cachify_fixture: None, mocker: MockerFixture
+) -> None:
+    client = get_cachify_client()
+    spy_set = mocker.spy(client._sync_client, 'set')  # type: ignore[attr-defined]
+    wrapped = cached(key='negative_found_{user_id}', ttl=60, cache_none=True, none_ttl=5)(lambda user_id: 'user')
+
+    assert wrapped(1) == 'user'
+    assert spy_set.call_args.kwargs['ex'] == 60
+    assert client.get(key='negative_found_1-cached') == 'user'
+
+
+def test_cached_cache_none_defaults_to_regular_ttl(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    spy_set = mocker.spy(get_cachify_client()._sync_client, 'set')  # type: ignore[attr-defined]
+    wrapped = cached(key='negative_default_ttl_{user_id}', ttl=60, cache_none=True)(lambda user_id: None)
+
+    assert wrapped(1) is None
+    assert spy_set.call_args.kwargs['ex'] == 60
+
+
+def test_cached_without_cache_none_recomputes_none_results(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    def find_user(user_id: int) -> Optional[str]:
+        calls.append(1)
+        return None
+
+    wrapped = cached(key='negative_disabled_{user_id}')(find_user)
+
+    assert wrapped(1) is None
+    assert wrapped(1) is None
+    assert sum(calls) == 2
+
+
+@pytest.mark.parametrize('options', [{'soft_ttl': 30}, {'early_recompute': 1.0}], ids=['soft_ttl', 'early_recompute'])
+async def test_cached_envelope_modes_without_cache_none_do_not_store_none(
+    init_cachify_fixture: None, mocker: MockerFixture, options: dict[str, Any]
+) -> None:
+    calls: list[int] = []
+
+    def find_user(user_id: int) -> Optional[str]:
+        calls.append(1)
+        return None
+
+    async def a_find_user(user_id: int) -> Optional[str]:
+        return find_user(user_id)
+
+    spy_set = mocker.spy(get_cachify_client()._sync_client, 'set')  # type: ignore[attr-defined]
+    wrapped = cached(key='negative_envelope_{user_id}', ttl=60, **options)(find_user)
+    a_wrapped = cached(key='a_negative_envelope_{user_id}', ttl=60, **options)(a_find_user)
+
+    assert [wrapped(1), wrapped(1), await a_wrapped(1), await a_wrapped(1)] == [None] * 4
+    assert sum(calls) == 4
+    assert spy_set.call_count == 0
+
+
+@pytest.mark.parametrize('falsy', [0, '', False, [], b''])
+def test_cached_hits_falsy_results(init_cachify_fixture: None, falsy: Any) -> None:
+    calls: list[int] = []
+
+    def compute(arg: int) -> Any:
+        calls.append(1)
+        return falsy
+
+    wrapped = cached(key='falsy_{arg}')(compute)
+
+    assert wrapped(1) == falsy
+    assert wrapped(1) == falsy
+    assert sum(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_cache_none_stores_negative_results_async(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    async def find_user(user_id: int) -> Optional[str]:
+        calls.append(1)
+        return None
+
+    wrapped = cached(key='negative_async_{user_id}', cache_none=True, none_ttl=5)(find_user)
+
+    assert await wrapped(1) is None
+    assert await wrapped(1) is None
+    assert sum(calls) == 1
+
+
+def test_cached_uses_client_serializer(init_cachify_fixture: None) -> None:
+    instance = init_cachify(serializer=JSONSerializer(), is_global=False)
+    calls: list[int] = []
+
+    @instance.cached(key='json_{x}')
+    def get_data(x: int) -> dict[str, int]:
+        calls.append(1)
+        return {'x': x}
+
+    assert get_data(1) == {'x': 1}
+    assert get_data(1) == {'x': 1}
+    assert sum(calls) == 1
+    assert instance._client._sync_client.get('PYC-json_1-cached') == b'{"x":1}'
+
+
+def test_cached_serializer_override(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    @cached(key='raw_{x}', serializer=RawSerializer())
+    def render(x: int) -> bytes:
+        calls.append(1)
+        return f'<p>{x}</p>'.encode()
+
+    assert render(1) == b'<p>1</p>'
+    assert render(1) == b'<p>1</p>'
+    assert sum(calls) == 1
+    assert get_cachify_client()._sync_client.get('PYC-raw_1-cached') == b'<p>1</p>'
+
+
+@pytest.mark.asyncio
+async def test_cached_serializer_frames_envelope_async(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    @cached(key='raw_none_{x}', serializer=RawSerializer(), cache_none=True, soft_ttl=60)
+    async def render(x: int) -> Optional[bytes]:
+        calls.append(1)
+        return None if x == 0 else b'page'
+
+    assert await render(0) is None
+    assert await render(0) is None
+    assert await render(1) == b'page'
+    assert await render(1) == b'page'
+    assert sum(calls) == 2
+
+    entry = await get_cachify_client().a_get(key='raw_none_1-cached', serializer=FramedEntrySerializer(RawSerializer()))
+    assert isinstance(entry, CacheEntry)
+    assert entry.value == b'page'
+
+
+def test_cached_cache_none_frames_plain_values_with_json(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    @cached(key='json_none_{x}', serializer=JSONSerializer(), cache_none=True)
+    def find(x: int) -> Optional[list[int]]:
+        calls.append(1)
+        return None if x == 0 else [x]
+
+    assert find(0) is None
+    assert find(0) is None
+    assert find(1) == [1]
+    assert find(1) == [1]
+    assert sum(calls) == 2
+    assert get_cachify_client()._sync_client.get('PYC-json_none_1-cached') == b'\x00[1]'
+
+
+def test_cached_envelope_can_be_turned_on_over_plain_values(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    def find(x: int) -> list[int]:
+        calls.append(1)
+        return [x]
+
+    assert cached(key='json_toggle_on_{x}', serializer=JSONSerializer())(find)(1) == [1]
+    assert get_cachify_client()._sync_client.get('PYC-json_toggle_on_1-cached') == b'[1]'
+
+    assert cached(key='json_toggle_on_{x}', serializer=JSONSerializer(), soft_ttl=60)(find)(1) == [1]
+    assert sum(calls) == 1
+
+
+def test_cached_envelope_can_be_turned_off_over_framed_values(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    def find(x: int) -> Optional[list[int]]:
+        calls.append(1)
+        return None if x == 0 else [x]
+
+    with_envelope = cached(key='json_toggle_off_{x}', serializer=JSONSerializer(), soft_ttl=60)(find)
+    assert with_envelope(1) == [1]
+    assert with_envelope(0) is None
+
+    without_envelope = cached(key='json_toggle_off_{x}', serializer=JSONSerializer())(find)
+    assert without_envelope(1) == [1]
+    assert sum(calls) == 2
+
+    assert without_envelope(2) == [2]
+    assert get_cachify_client()._sync_client.get('PYC-json_toggle_off_2-cached') == b'[2]'
+
+
+def test_cached_out_of_band_serializer_with_envelope(init_cachify_fixture: None) -> None:
+    calls: list[int] = []
+
+    @cached(key='oob_{x}', serializer=OutOfBandPickleSerializer(min_buffer_size=16), soft_ttl=60)
+    def load(x: int) -> bytearray:
+        calls.append(1)
+        return bytearray(b'x' * 100 * x)
+
+    assert load(1) == bytearray(b'x' * 100)
+    assert load(1) == bytearray(b'x' * 100)
+    assert sum(calls) == 1
@@ -0,0 +1,169 @@
+# pyright: reportPrivateUsage=false
+from typing import Any, Optional
+
+import pytest
+from pytest_mock import MockerFixture
+
+from py_cachify import CachifyInitError, JSONSerializer, cached, cached_batch, init_cachify
+from py_cachify._backend._lib import get_cachify_client
+
+
+def _load(ids: list[int], calls: list[list[int]]) -> dict[int, str]:
+    calls.append(list(ids))
+    return {id_: f'user-{id_}' for id_ in ids}
+
+
+async def _a_load(ids: list[int], calls: list[list[int]]) -> dict[int, str]:
+    calls.append(list(ids))
+    return {id_: f'user-{id_}' for id_ in ids}
+
+
+def test_cached_batch_calls_function_with_missing_ids_only(init_cachify_fixture: None) -> None:
+    calls: list[list[int]] = []
+    load = cached_batch(key='user-{ids}')(_load)
+
+    assert load([1, 2], calls) == {1: 'user-1', 2: 'user-2'}
+    assert load([3, 2, 1, 3], calls) == {3: 'user-3', 2: 'user-2', 1: 'user-1'}
+    assert list(load([3, 2, 1], calls)) == [3, 2, 1]
+    assert calls == [[1, 2], [3]]
+
+
+def test_cached_batch_shares_entries_with_cached(init_cachify_fixture: None) -> None:
+    calls: list[list[int]] = []
+    load = cached_batch(key='user-{ids}')(_load)
+    _ = load([1], calls)
+
+    @cached(key='user-{user_id}')
+    def load_one(user_id: int) -> str:
+        raise AssertionError('must be served from the cache')
+
+    assert load_one(1) == 'user-1'
+
+
+def test_cached_batch_ids_arg_and_other_key_arguments(init_cachify_fixture: None) -> None:
+    calls: list[tuple[str, list[int]]] = []
+
+    @cached_batch(key='{tenant}-item-{item_ids}', ids_arg='item_ids')
+    def load(tenant: str, item_ids: tuple[int, ...], *, suffix: str = '') -> dict[int, str]:
+        calls.append((tenant, list(item_ids)))
+        return {id_: f'{tenant}-{id_}{suffix}' for id_ in item_ids}
+
+    assert load('a', (1, 2), suffix='!') == {1: 'a-1!', 2: 'a-2!'}
+    assert load('b', item_ids=(1,)) == {1: 'b-1'}
+    assert load(tenant='a', item_ids=[2, 3]) == {2: 'a-2!', 3: 'a-3'}
+    assert calls == [('a', [1, 2]), ('b', [1]), ('a', [3])]
+    assert get_cachify_client().get('a-item-3-cached') == 'a-3'
+
+
+def test_cached_batch_does_not_cache_none_and_unrequested_results(init_cachify_fixture: None) -> None:
+    calls: list[list[int]] = []
+
+    @cached_batch(key='item-{ids}')
+    def load(ids: list[int]) -> dict[int, Optional[str]]:
+        calls.append(list(ids))
+        return {1: None, 2: 'two', 99: 'extra'}
+
+    assert load([1, 2, 3]) == {1: None, 2: 'two'}
+    assert load([1, 2, 3]) == {1: None, 2: 'two'}
+    assert calls == [[1, 2, 3], [1, 3]]
+    assert get_cachify_client().get('item-99-cached') is None
+
+
+def test_cached_batch_skips_call_on_full_hit_and_empty_ids(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    calls: list[list[int]] = []
+    load = cached_batch(key='user-{ids}')(_load)
+    _ = load([1, 2], calls)
+    set_many = mocker.spy(get_cachify_client(), 'set_many')
+
+    assert load([2, 1], calls) == {2: 'user-2', 1: 'user-1'}
+    assert load([], calls) == {}
+    assert calls == [[1, 2]]
+    set_many.assert_not_called()
+
+
+def test_cached_batch_ttl_enc_dec_and_serializer(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    client = get_cachify_client()
+    set_many = mocker.spy(client, 'set_many')
+    client.default_cache_ttl = 30
+
+    @cached_batch(key='score-{ids}', enc_dec=(lambda val: val * 10, lambda val: val // 10), serializer=JSONSerializer())
+    def scores(ids: list[str]) -> dict[str, int]:
+        return {id_: len(id_) for id_ in ids}
+
+    @cached_batch(key='flag-{ids}', ttl=None)
+    def flags(ids: list[int]) -> dict[int, bool]:
+        return dict.fromkeys(ids, True)
+
+    assert scores(['ab', 'c']) == {'ab': 2, 'c': 1}
+    assert scores(['ab', 'c']) == {'ab': 2, 'c': 1}
+    assert client._sync_client.get('PYC-score-ab-cached') == b'20'
+    _ = flags([1])
+
+    assert [call.kwargs['ttl'] for call in set_many.call_args_list] == [30, None]
+
+
+def test_cached_batch_reset_deletes_given_ids(init_cachify_fixture: None) -> None:
+    calls: list[list[int]] = []
+    load = cached_batch(key='user-{ids}')(_load)
+    _ = load([1, 2, 3], calls)
+
+    load.reset([1, 3], calls)
+
+    assert load([1, 2, 3], calls) == {1: 'user-1', 2: 'user-2', 3: 'user-3'}
+    assert calls == [[1, 2, 3], [1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_cached_batch_async(init_cachify_fixture: None) -> None:
+    calls: list[list[int]] = []
+    load = cached_batch(key='user-{ids}')(_a_load)
+
+    assert await load([1, 2], calls) == {1: 'user-1', 2: 'user-2'}
+    assert await load([2, 3], calls) == {2: 'user-2', 3: 'user-3'}
+    assert await load([3], calls) == {3: 'user-3'}
+
+    await load.reset([2], calls)
+    assert await load([1, 2], calls) == {1: 'user-1', 2: 'user-2'}
+    assert calls == [[1, 2], [3], [2]]
+
+
+def test_cached_batch_on_cachify_instance() -> None:
+    local = init_cachify(prefix='LOCAL-', is_global=False)
+    calls: list[list[int]] = []
+    load = local.cached_batch(key='user-{ids}', ttl=60)(_load)
+
+    assert load([1], calls) == {1: 'user-1'}
+    assert load([1], calls) == {1: 'user-1'}
+    assert calls == [[1]]
+    assert local._client._sync_client.get('LOCAL-user-1-cached') is not None
+
+
+@pytest.mark.parametrize(
+    'key,ids_arg,func,match',
+    [
+        ('user-{other}', None, lambda ids, other: {}, "must reference the IDs argument 'ids'"),
+        ('user', None, lambda ids: {}, 'must reference'),
+        ('user-{ids}', 'missing', lambda ids: {}, "'missing' is not a named parameter"),
+        ('user-{ids}', None, lambda *ids: {}, "'ids' is not a named parameter"),
+        ('user', None, lambda: {}, 'takes the IDs as an argument'),
+    ],
+)
+def test_cached_batch_validates_key_and_ids_arg(key: str, ids_arg: Optional[str], func: Any, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        _ = cached_batch(key=key, ids_arg=ids_arg)(func)
+
+
+def test_cached_batch_accepts_attribute_and_index_placeholders(init_cachify_fixture: None) -> None:
+    @cached_batch(key='pair-{ids[0]}-{ids[1]}')
+    def load(ids: list[tuple[int, int]]) -> dict[tuple[int, int], int]:
+        return {id_: id_[0] + id_[1] for id_ in ids}
+
+    assert load([(1, 2)]) == {(1, 2): 3}
+    assert get_cachify_client().get('pair-1-2-cached') == 3
+
+
+def test_cached_batch_without_init_raises() -> None:
+    load = cached_batch(key='user-{ids}')(_load)
+
+    with pytest.raises(CachifyInitError):
+        _ = load([1], [])
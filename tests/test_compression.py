@@ -0,0 +1,81 @@
+import pytest
+
+from py_cachify import LzmaCompressor, ZlibCompressor
+from py_cachify._backend._compression import CompressionLayer
+
+
+LARGE = b'report-row;' * 500
+
+
+class ReverseCompressor:
+    codec_id = 0x10
+
+    def compress(self, data: bytes) -> bytes:
+        return data[::-1][:10]
+
+    def decompress(self, data: bytes) -> bytes:
+        return b'restored'
+
+
+@pytest.mark.parametrize('compressor', [ZlibCompressor(), LzmaCompressor(), ZlibCompressor(level=1)])
+def test_compression_roundtrip_large_payload(compressor: ZlibCompressor) -> None:
+    layer = CompressionLayer(compressor, threshold=100)
+    encoded = layer.encode(LARGE)
+
+    assert encoded[0] == compressor.codec_id
+    assert len(encoded) < len(LARGE)
+    assert layer.decode(encoded) == LARGE
+
+
+def test_compression_keeps_small_payloads_as_is() -> None:
+    layer = CompressionLayer(ZlibCompressor(), threshold=100)
+    small = b'\x80\x05small pickle'
+
+    assert layer.encode(small) is small
+    assert layer.decode(small) is small
+    assert layer.encode(b'') == b''
+    assert layer.decode(b'') == b''
+
+
+def test_compression_keeps_incompressible_payloads_as_is() -> None:
+    layer = CompressionLayer(ZlibCompressor(), threshold=10)
+    payload = bytes(range(0x20, 0x80))
+
+    assert layer.encode(payload) == payload
+
+
+def test_compression_escapes_payloads_starting_with_reserved_byte() -> None:
+    layer = CompressionLayer(ZlibCompressor(), threshold=100)
+    payload = b'\x01looks like a header'
+
+    encoded = layer.encode(payload)
+
+    assert encoded == b'\x00' + payload
+    assert layer.decode(encoded) == payload
+
+
+def test_compression_reads_builtin_codecs_regardless_of_configured_one() -> None:
+    writer = CompressionLayer(LzmaCompressor(), threshold=100)
+    reader = CompressionLayer(ZlibCompressor(), threshold=100)
+
+    assert reader.decode(writer.encode(LARGE)) == LARGE
+
+
+def test_compression_custom_codec() -> None:
+    layer = CompressionLayer(ReverseCompressor(), threshold=100)
+    encoded = layer.encode(LARGE)
+
+    assert encoded[0] == 0x10
+    assert layer.decode(encoded) == b'restored'
+
+    with pytest.raises(ValueError, match='Unknown compression codec id 16'):
+        _ = CompressionLayer(ZlibCompressor()).decode(encoded)
+
+
+@pytest.mark.parametrize('codec_id', [0, 0x20])
+def test_compression_rejects_codec_ids_outside_reserved_range(codec_id: int) -> None:
+    compressor = ReverseCompressor()
+    compressor.codec_id = codec_id
+
+    with pytest.raises(ValueError, match='codec_id must be between 1 and 31'):
+        _ = CompressionLayer(compressor)
@@ -0,0 +1,115 @@
+# pyright: reportPrivateUsage=false
+import pytest
+
+from py_cachify._backend._eviction import LFUPolicy, LRUPolicy, TinyLFUPolicy, _FrequencySketch, make_eviction_policy
+
+
+def test_lru_policy_evicts_least_recently_used() -> None:
+    policy = LRUPolicy()
+    for name in ('a', 'b', 'c'):
+        policy.on_insert(name)
+
+    policy.on_get('a', hit=True)
+    policy.on_get('missing', hit=False)
+    assert policy.victim() == 'b'
+
+    policy.on_remove('b')
+    policy.on_remove('missing')
+    assert policy.victim() == 'c'
+    assert policy.admit('d', 'c') is True
+
+
+def test_lru_policy_empty_has_no_victim() -> None:
+    assert LRUPolicy().victim() is None
+
+
+def test_lfu_policy_evicts_least_frequently_used() -> None:
+    policy = LFUPolicy()
+    for name in ('a', 'b', 'c'):
+        policy.on_insert(name)
+
+    policy.on_get('a', hit=True)
+    policy.on_get('b', hit=True)
+    policy.on_get('missing', hit=False)
+    assert policy.victim() == 'c'
+
+    policy.on_get('c', hit=True)
+    # all at frequency 2 now, ties are broken by recency
+    assert policy.victim() == 'a'
+    assert policy.admit('d', 'a') is True
+
+
+def test_lfu_policy_recovers_min_frequency_after_remove() -> None:
+    policy = LFUPolicy()
+    policy.on_insert('a')
+    policy.on_insert('b')
+    policy.on_get('b', hit=True)
+    policy.on_get('b', hit=True)
+
+    policy.on_remove('a')
+    policy.on_remove('missing')
+    assert policy.victim() == 'b'
+
+    policy.on_remove('b')
+    assert policy.victim() is None
+
+
+def test_lfu_policy_insert_resets_min_frequency() -> None:
+    policy = LFUPolicy()
+    policy.on_insert('a')
+    policy.on_get('a', hit=True)
+    policy.on_insert('b')
+
+    assert policy.victim() == 'b'
+
+
+def test_frequency_sketch_counts_and_ages() -> None:
+    sketch = _FrequencySketch(capacity=1)
+    for _ in range(20):
+        sketch.increment('hot')
+
+    # counters saturate
+    assert sketch.estimate('hot') == 15
+    assert sketch.estimate('cold') <= sketch.estimate('hot')
+
+    for i in range(sketch._sample_size):
+        sketch.increment(f'k{i}')
+
+    # the periodic reset halves all counters
+    assert sketch.estimate('hot') < 15
+
+
+def test_tinylfu_policy_admits_only_more_frequent_candidates() -> None:
+    policy = TinyLFUPolicy(capacity=10)
+    policy.on_insert('victim')
+    policy.on_get('victim', hit=True)
+    policy.on_get('victim', hit=True)
+
+    policy.on_get('candidate', hit=False)
+    assert policy.admit('candidate', 'victim') is False
+
+    for _ in range(3):
+        policy.on_get('candidate', hit=False)
+    assert policy.admit('candidate', 'victim') is True
+
+
+@pytest.mark.parametrize(
+    'name,expected',
+    [
+        ('lru', LRUPolicy),
+        ('lfu', LFUPolicy),
+        ('tinylfu', TinyLFUPolicy),
+    ],
+)
+def test_make_eviction_policy(name: str, expected: type) -> None:
+    assert type(make_eviction_policy(name, 10)) is expected  # type: ignore[arg-type]
+
+
+def test_make_eviction_policy_unknown() -> None:
+    with pytest.raises(ValueError, match="Unknown eviction policy 'fifo'"):
+        _ = make_eviction_policy('fifo', 10)  # type: ignore[arg-type]
+
+
+def test_frequency_sketch_width_scales_with_capacity() -> None:
+    assert len(_FrequencySketch(capacity=10)._table[0]) == 64
+    assert len(_FrequencySketch(capacity=100)._table[0]) == 512
@@ -8,6 +8,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from py_cachify._backend._helpers import (
+    KeyTemplate,
     _acall_original,
     _call_original,
     a_reset,
@@ -260,3 +261,157 @@ def test_get_full_key_pool_with_args_kwargs(args_kwargs_signature: inspect.Signa
     bound_args = sig.bind('a', 'b', key='value')
     result = get_full_key_from_signature(bound_args, 'key-{0}-{key}', operation_postfix='pool')
     assert result == 'key-a-value-pool'
+
+
+def _plain(a: int, b: int = 2, *, c: str = 'c') -> None:
+    pass
+
+
+def _positional_only(a: int, b: int = 2, /) -> None:
+    pass
+
+
+def _no_args() -> None:
+    pass
+
+
+def _named_args(args: tuple[str, ...], b: int) -> None:
+    pass
+
+
+def _named_kwargs(a: int, kwargs: dict[str, int]) -> None:
+    pass
+
+
+class _WithAttr:
+    t = 'attr'
+
+    def method(self, items: list[int]) -> None:
+        pass
+
+
+@pytest.mark.parametrize(
+    'func,key,args,kwargs',
+    [
+        (_plain, 'k-{a}-{b}-{c}', (1,), {}),
+        (_plain, 'k-{a}-{b}-{c}', (1, 3), {'c': 'x'}),
+        (_plain, 'k-{b}-{a}', (), {'a': 1, 'b': 5}),
+        (_plain, 'k-{a:>4}-{c!r}-{{literal}}-{a}', (7,), {}),
+        (_plain, 'no-placeholders', (1,), {}),
+        (_positional_only, 'p-{a}-{b}', (1,), {}),
+        (_positional_only, 'p-{a}-{b}', (1, 9), {}),
+        (_no_args, 'constant', (), {}),
+        (_WithAttr.method, 'm-{self.t}-{items[1]}', (_WithAttr(), [1, 2]), {}),
+        (method_with_args_kwargs_args, 'v-{}-{}-{arg3}', ('x', 'y'), {'arg3': 'z'}),
+        (method_with_args_kwargs_args, 'v-{0}-{a}', ('x',), {'a': 'z'}),
+        # plain parameters named like the variadic ones keep the signature-based expansion
+        (_named_args, 'n-{}-{b}', (('x',), 2), {}),
+        (_named_kwargs, 'n-{a}-{c}', (1,), {'kwargs': {'c': 3}}),
+    ],
+)
+def test_key_template_matches_signature_based_keys(func: Any, key: str, args: Any, kwargs: Any) -> None:
+    signature = inspect.signature(func)
+    expected = get_full_key_from_signature(signature.bind(*args, **kwargs), key, operation_postfix='cached')
+
+    assert KeyTemplate(key, signature, 'cached')(*args, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    'func,key,args,kwargs',
+    [
+        (_plain, 'k-{a}-{b}', (1,), {}),
+        (_positional_only, 'p-{a}-{b}', (1, 9), {}),
+        (_no_args, 'constant', (), {}),
+        (_WithAttr.method, 'm-{self.t}-{items[0]}', (_WithAttr(), [1]), {}),
+    ],
+)
+def test_key_template_fast_path_does_not_bind(
+    func: Any, key: str, args: Any, kwargs: Any, mocker: MockerFixture
+) -> None:
+    signature = inspect.signature(func)
+    template = KeyTemplate(key, signature, 'lock')
+    bind = mocker.patch.object(inspect.Signature, 'bind')
+
+    assert template(*args, **kwargs).endswith('-lock')
+    bind.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    'func,key,args,kwargs',
+    [
+        (_plain, 'k-{a}-{missing}', (1,), {}),
+        (_plain, 'k-{a[5]}', ([1],), {}),
+        (_plain, 'k-{a[x]}', ({'y': 1},), {}),
+        (_plain, 'k-{}', (1,), {}),
+        (method_with_args_kwargs_args, 'v-{}-{}-{}', ('x', 'y'), {}),
+    ],
+)
+def test_key_template_raises_value_error_like_signature_based_keys(func: Any, key: str, args: Any, kwargs: Any) -> None:
+    signature = inspect.signature(func)
+    bound_args = signature.bind(*args, **kwargs)
+    bound_args.apply_defaults()
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(f'Arguments in a key({key}) do not match function signature params({bound_args})'),
+    ):
+        _ = KeyTemplate(key, signature, 'cached')(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    'func,args,kwargs',
+    [
+        (_plain, (), {}),
+        (_plain, (1, 2, 3), {}),
+        (_positional_only, (), {'a': 1}),
+    ],
+)
+def test_key_template_falls_back_to_bind_for_invalid_calls(func: Any, args: Any, kwargs: Any) -> None:
+    template = KeyTemplate('k-{a}', inspect.signature(func), 'cached')
+
+    with pytest.raises(TypeError):
+        _ = template(*args, **kwargs)
+
+
+@pytest.mark.parametrize('key', ['k-{a}', 'constant'])
+@pytest.mark.parametrize(
+    'args,kwargs',
+    [
+        ((1,), {'unknown': 1}),
+        ((1,), {'a': 1}),
+        ((), {'b': 1}),
+        ((1, 2, 3, 4), {}),
+    ],
+    ids=['unknown-keyword', 'duplicate-argument', 'missing-argument', 'too-many-positional'],
+)
+def test_key_template_rejects_calls_not_matching_the_signature(key: str, args: Any, kwargs: Any) -> None:
+    template = KeyTemplate(key, inspect.signature(_plain), 'cached')
+
+    with pytest.raises(TypeError):
+        _ = template(*args, **kwargs)
+
+
+def test_key_template_checks_keyword_only_and_positional_only_parameters() -> None:
+    def func(a: int, /, *, b: int) -> None:
+        pass
+
+    template = KeyTemplate('constant', inspect.signature(func), 'cached')
+
+    assert template(1, b=2) == 'constant-cached'
+    for args, kwargs in (((1,), {}), ((), {'a': 1, 'b': 2})):
+        with pytest.raises(TypeError):
+            _ = template(*args, **kwargs)
+
+
+def test_key_template_keeps_format_errors_of_malformed_templates() -> None:
+    template = KeyTemplate('k-{a', inspect.signature(_plain), 'cached')
+
+    with pytest.raises(ValueError, match="expected '}' before end of string"):
+        _ = template(1)
+
+
+def test_key_template_falls_back_for_nested_format_specs() -> None:
+    template = KeyTemplate('k-{c:>{a}}', inspect.signature(_plain), 'cached')
+
+    assert template._template is None
+    assert template(5, c='x') == 'k-    x-cached'
@@ -0,0 +1,246 @@
+import json
+import queue
+import time
+from typing import Any
+
+import pytest
+
+from py_cachify import (
+    AsyncTieredClient,
+    InvalidationBus,
+    LocalTransport,
+    MemoryCache,
+    QueueTransport,
+    RedisPubSubTransport,
+    TieredClient,
+    init_cachify,
+)
+from py_cachify._backend._clients import AsyncWrapper
+
+
+class _RecordingTransport(LocalTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[list[str]] = []
+
+    def publish(self, message: bytes) -> None:
+        self.sent.append(json.loads(message)['keys'])
+        super().publish(message)
+
+
+def _node(remote: MemoryCache, transport: LocalTransport, flush_interval: float = 0) -> TieredClient:
+    return TieredClient(remote, bus=InvalidationBus(transport, flush_interval=flush_interval))
+
+
+def test_bus_validates_arguments() -> None:
+    with pytest.raises(ValueError, match='flush_interval'):
+        _ = InvalidationBus(LocalTransport(), flush_interval=-1)
+    with pytest.raises(ValueError, match='max_batch'):
+        _ = InvalidationBus(LocalTransport(), max_batch=0)
+
+
+def test_writes_evict_other_nodes_l1() -> None:
+    remote, transport = MemoryCache(), _RecordingTransport()
+    first, second = _node(remote, transport), _node(remote, transport)
+    first.set('v-cached', b'1')
+    assert second.get('v-cached') == b'1'
+
+    first.set('v-cached', b'2')
+
+    assert second.local.get('v-cached') is None
+    assert first.local.get('v-cached') == b'2'
+    assert second.get('v-cached') == b'2'
+
+    _ = first.pipeline().set('v-cached', b'3').set('w-cached', b'4').execute()
+    assert second.get('v-cached') == b'3'
+
+    first.delete('v-cached', 'job-lock')
+    assert second.local.get('v-cached') is None
+    assert first.set('job-lock', b'1', nx=True) is True
+    assert transport.sent == [['v-cached'], ['v-cached'], ['v-cached'], ['w-cached'], ['v-cached']]
+
+
+def test_reset_evicts_l1_of_every_node() -> None:
+    remote, transport = MemoryCache(), LocalTransport()
+    nodes = [init_cachify(sync_client=_node(remote, transport), is_global=False) for _ in range(3)]
+    calls: list[int] = []
+
+    def make(instance: Any) -> Any:
+        @instance.cached(key='square-{x}')
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        return square
+
+    functions = [make(instance) for instance in nodes]
+    assert [func(2) for func in functions] == [4, 4, 4]
+
+    functions[0].reset(2)
+
+    assert [func(2) for func in functions] == [4, 4, 4]
+    assert calls == [2, 2]
+
+
+async def test_async_tier_publishes_and_is_evicted() -> None:
+    remote, transport = MemoryCache(), LocalTransport()
+    sync_node = _node(remote, transport)
+    async_node = AsyncTieredClient(AsyncWrapper(remote), bus=InvalidationBus(transport, flush_interval=0))
+
+    await async_node.set('v-cached', b'1')
+    assert sync_node.get('v-cached') == b'1'
+    sync_node.set('v-cached', b'2')
+    assert await async_node.get('v-cached') == b'2'
+
+    await async_node.delete('v-cached')
+    assert sync_node.local.get('v-cached') is None
+
+    _ = await async_node.pipeline().set('w-cached', b'3').execute()
+    assert sync_node.get('w-cached') == b'3'
+
+
+async def test_cachify_client_publishes_writes_and_deletes() -> None:
+    remote, transport = MemoryCache(), _RecordingTransport()
+    node = _node(remote, transport)
+    writer = init_cachify(
+        sync_client=remote, invalidation_bus=InvalidationBus(transport, flush_interval=0), is_global=False
+    )
+
+    @writer.cached(key='square-{x}')
+    def square(x: int) -> int:
+        return x * x
+
+    assert square(2) == 4
+    assert node.get('PYC-square-2-cached') is not None
+    square.reset(2)
+    assert node.local.get('PYC-square-2-cached') is None
+
+    writer.set_many({'a-cached': 1, 'b-cached': 2})
+    writer.delete_many(['a-cached'])
+    await writer.a_set_many({'b-cached': 3})
+    await writer.a_delete_many(['b-cached'])
+    await writer._client.a_set('c-cached', 1)  # pyright: ignore[reportPrivateUsage]
+    await writer._client.a_delete('c-cached')  # pyright: ignore[reportPrivateUsage]
+    # locks and other internal keys are not published
+    with writer.lock(key='job'):
+        pass
+
+    assert transport.sent == [
+        ['PYC-square-2-cached'],
+        ['PYC-square-2-cached'],
+        ['PYC-a-cached', 'PYC-b-cached'],
+        ['PYC-a-cached'],
+        ['PYC-b-cached'],
+        ['PYC-b-cached'],
+        ['PYC-c-cached'],
+        ['PYC-c-cached'],
+    ]
+
+
+def test_bus_coalesces_keys_within_flush_interval() -> None:
+    transport = _RecordingTransport()
+    bus = InvalidationBus(transport, flush_interval=0.05, max_batch=100)
+
+    bus.publish(['a', 'b'])
+    bus.publish(['a', 'c'])
+    bus.publish([])
+    assert transport.sent == []
+
+    time.sleep(0.2)
+    assert transport.sent == [['a', 'b', 'c']]
+
+
+def test_bus_flushes_full_batches_right_away() -> None:
+    transport = _RecordingTransport()
+    bus = InvalidationBus(transport, flush_interval=60, max_batch=3)
+
+    bus.publish(['a'])
+    bus.publish(['b', 'c'])
+    bus.publish([])
+    bus.flush()
+
+    assert transport.sent == [['a', 'b', 'c']]
+    assert bus._timer is None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_bus_close_flushes_and_unsubscribes() -> None:
+    transport = _RecordingTransport()
+    bus, other = InvalidationBus(transport, flush_interval=60), InvalidationBus(transport, flush_interval=0)
+    received: list[list[str]] = []
+    bus.subscribe(received.append)
+    bus.subscribe(received.append)
+    other.publish(['a'])
+
+    bus.publish(['b'])
+    bus.close()
+    bus.close()
+    other.publish(['c'])
+
+    assert received == [['a'], ['a']]
+    assert transport.sent == [['a'], ['b'], ['c']]
+
+
+def test_bus_logs_transport_errors(mocker: Any) -> None:
+    transport = LocalTransport()
+    _ = mocker.patch.object(transport, 'publish', side_effect=ConnectionError('down'))
+    warning = mocker.patch('py_cachify._backend._invalidation.logger.warning')
+
+    InvalidationBus(transport, flush_interval=0).publish(['a'])
+
+    warning.assert_called_once_with('Broadcasting invalidation of 1 keys failed: down')
+
+
+def test_bus_ignores_malformed_messages() -> None:
+    transport = LocalTransport()
+    received: list[list[str]] = []
+    InvalidationBus(transport).subscribe(received.append)
+
+    transport.publish(b'not json')
+    transport.publish(b'{"keys": []}')
+    transport.publish(json.dumps({'src': 'other', 'keys': ['a']}).encode())
+
+    assert received == [['a']]
+
+
+def test_queue_transport() -> None:
+    inboxes: list[queue.Queue[bytes]] = [queue.Queue(), queue.Queue()]
+    remote = MemoryCache()
+    first, second = (
+        TieredClient(
+            remote,
+            bus=InvalidationBus(QueueTransport(inbox, inboxes, poll_interval=0.01), flush_interval=0),
+        )
+        for inbox in inboxes
+    )
+    first.set('v-cached', b'1')
+    assert second.get('v-cached') == b'1'
+
+    first.delete('v-cached')
+    deadline = time.monotonic() + 2
+    while second.local.get('v-cached') is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert second.local.get('v-cached') is None
+    assert first.bus is not None and second.bus is not None
+    first.bus.close()
+    second.bus.close()
+
+
+def test_redis_pubsub_transport(mocker: Any) -> None:
+    client = mocker.MagicMock()
+    transport = RedisPubSubTransport(client, channel='inv', poll_interval=0.5)
+    received: list[bytes] = []
+
+    _ = transport.publish(b'msg')
+    unsubscribe = transport.subscribe(received.append)
+    handler = client.pubsub.return_value.subscribe.call_args.kwargs['inv']
+    handler({'type': 'message', 'data': b'msg'})
+    unsubscribe()
+
+    client.publish.assert_called_once_with('inv', b'msg')
+    client.pubsub.assert_called_once_with(ignore_subscribe_messages=True)
+    client.pubsub.return_value.run_in_thread.assert_called_once_with(sleep_time=0.5, daemon=True)
+    thread = client.pubsub.return_value.run_in_thread.return_value
+    thread.stop.assert_called_once_with()
+    thread.join.assert_called_once_with()
+    assert received == [b'msg']
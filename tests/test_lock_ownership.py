@@ -0,0 +1,413 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from py_cachify import AsyncTieredClient, Cachify, CachifyLockError, MemoryCache, TieredClient, init_cachify, lock
+from py_cachify._backend._clients import AsyncWrapper
+from py_cachify._backend._lib import CachifyClient
+from py_cachify._backend._lock_watchdog import LockWatchdog
+
+
+@pytest.fixture
+def sync_client(request: pytest.FixtureRequest, fake_client: Any, scripting_client: Any) -> Any:
+    clients = {
+        'memory': MemoryCache(),
+        'fallback': fake_client,
+        'script': scripting_client,
+        'tiered': TieredClient(fake_client),
+    }
+    return clients[request.param]
+
+
+@pytest.fixture
+def async_client(request: pytest.FixtureRequest, fake_client: Any, scripting_client: Any) -> Any:
+    clients = {
+        'memory': AsyncWrapper(MemoryCache()),
+        'fallback': fake_client.as_async(),
+        'script': scripting_client.as_async(),
+        'tiered': AsyncTieredClient(fake_client.as_async()),
+        'threaded': None,  # a ThreadedAsyncClient over the sync client
+    }
+    return clients[request.param]
+
+
+def _client(sync_client: Any, async_client: Any = None) -> CachifyClient:
+    return init_cachify(sync_client=sync_client, async_client=async_client, is_global=False)._client
+
+
+@pytest.mark.parametrize('sync_client', ['memory', 'fallback', 'script', 'tiered'], indirect=True)
+def test_release_and_extend_only_apply_to_the_owner(sync_client: Any) -> None:
+    client = _client(sync_client)
+
+    assert client.try_acquire_lock('job', ttl=1, token='owner')
+    assert client.get('job') == 'owner'
+    assert not client.try_acquire_lock('job', ttl=1, token='other')
+
+    assert not client.extend_lock('job', token='other', ttl=60)
+    assert client.extend_lock('job', token='owner', ttl=60)
+    assert not client.release_lock('job', token='other')
+    assert client.get('job') == 'owner'
+
+    assert client.release_lock('job', token='owner')
+    assert client.get('job') is None
+    assert not client.extend_lock('job', token='owner', ttl=60)
+
+
+@pytest.mark.parametrize('async_client', ['memory', 'fallback', 'script', 'tiered', 'threaded'], indirect=True)
+async def test_async_release_and_extend_only_apply_to_the_owner(async_client: Any, fake_client: Any) -> None:
+    client = _client(fake_client, async_client)
+
+    assert await client.a_try_acquire_lock('job', ttl=1, token='owner')
+    assert await client.a_get('job') == 'owner'
+
+    assert not await client.a_extend_lock('job', token='other', ttl=60)
+    assert await client.a_extend_lock('job', token='owner', ttl=60)
+    assert not await client.a_release_lock('job', token='other')
+
+    assert await client.a_release_lock('job', token='owner')
+    assert await client.a_get('job') is None
+
+
+@pytest.mark.parametrize('is_async', [False, True])
+async def test_non_atomic_fallback_warns_once_and_never_rewrites_the_value(
+    mocker: MockerFixture, is_async: bool, fake_client: Any
+) -> None:
+    warning = mocker.patch('py_cachify._backend._lock_ops.logger.warning')
+    client = _client(fake_client, fake_client.as_async())
+    set_calls = mocker.spy(fake_client.cache, 'set')
+
+    for _ in range(2):
+        if is_async:
+            assert await client.a_try_acquire_lock('job', ttl=1, token='owner')
+            assert await client.a_extend_lock('job', token='owner', ttl=60)
+            assert await client.a_release_lock('job', token='owner')
+        else:
+            assert client.try_acquire_lock('job', ttl=1, token='owner')
+            assert client.extend_lock('job', token='owner', ttl=60)
+            assert client.release_lock('job', token='owner')
+
+    # only the two acquisitions wrote the key
+    assert set_calls.call_count == 2
+    warning.assert_called_once()
+    assert 'FakeClient has no compare_and_delete' in warning.call_args.args[0]
+
+
+async def test_fallback_without_expire_never_extends(mocker: MockerFixture, fake_client: Any) -> None:
+    _ = mocker.patch('py_cachify._backend._lock_ops.logger.warning')
+    async_client = fake_client.as_async()
+    _ = mocker.patch.object(fake_client, 'expire', None)
+    _ = mocker.patch.object(async_client, 'expire', None)
+    client = _client(fake_client, async_client)
+
+    assert client.try_acquire_lock('job', ttl=1, token='owner')
+    assert not client.extend_lock('job', token='owner', ttl=60)
+    assert client.release_lock('job', token='owner')
+    assert await client.a_try_acquire_lock('job', ttl=1, token='owner')
+    assert not await client.a_extend_lock('job', token='owner', ttl=60)
+
+
+def test_scripts_are_registered_once_per_client(scripting_client: Any, fake_client: Any) -> None:
+    sync_client = scripting_client
+    client = _client(sync_client, fake_client.as_async())
+
+    for _ in range(3):
+        assert client.try_acquire_lock('job', ttl=None, token='owner')
+        assert client.release_lock('job', token='owner')
+
+    assert len(sync_client.scripts) == 2
+
+
+def test_memory_cache_compare_and_set_semantics() -> None:
+    cache = MemoryCache(max_entries=2, stripes=1)
+    assert cache.set('lock', b'token', ex=1, nx=True)
+
+    assert cache.compare_and_expire('lock', b'token', 60)
+    _, exp_at = cache._shards[0]._cache['lock']
+    assert exp_at is not None and exp_at > time.time() + 50
+    assert not cache.compare_and_expire('missing', b'token', 60)
+
+    # keys set with nx stay pinned, extending them doesn't make them evictable
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('lock') == b'token'
+
+    cache.set('expired', b'token', ex=1)
+    cache._shards[0]._cache['expired'] = b'token', time.time() - 1
+    assert not cache.compare_and_delete('expired', b'token')
+    assert cache.compare_and_delete('lock', b'token')
+    assert cache.get('lock') is None
+
+
+def test_expired_holder_does_not_release_the_next_holder(mocker: MockerFixture) -> None:
+    instance = init_cachify(is_global=False)
+    warning = mocker.patch('py_cachify._backend._lock.logger.warning')
+
+    first = instance.lock(key='job')
+    first.__enter__()
+    instance._client.delete('job')  # as if the lock had expired
+    with instance.lock(key='job') as second:
+        first.release()
+
+        assert second.is_locked()
+    assert not second.is_locked()
+
+    warning.assert_called_once_with('job expired before it was released and is not held by this lock anymore')
+
+
+async def test_async_expired_holder_does_not_release_the_next_holder(mocker: MockerFixture) -> None:
+    instance = init_cachify(is_global=False)
+    warning = mocker.patch('py_cachify._backend._lock.logger.warning')
+
+    first = await instance.lock(key='job').__aenter__()
+    await instance._client.a_delete('job')
+    async with instance.lock(key='job') as second:
+        await first.arelease()
+
+        assert await second.is_alocked()
+
+    warning.assert_called_once()
+
+
+def test_decorated_lock_release_stays_unconditional(init_cachify_fixture: None) -> None:
+    @lock(key='job-{x}')
+    def job(x: int) -> None:
+        pass
+
+    with lock(key='job-1-lock'):
+        job.release(1)
+        assert not job.is_locked(1)
+
+
+def _fast_watchdog(mocker: MockerFixture) -> None:
+    # ttl / 100: a 1 second lock is extended every 10ms
+    _ = mocker.patch('py_cachify._backend._lock_watchdog._RENEWALS_PER_TTL', 100)
+
+
+def test_watchdog_keeps_a_short_lock_alive() -> None:
+    instance = init_cachify(is_global=False)
+
+    with instance.lock(key='job', exp=1, watchdog=True) as held:
+        watchdog = held._acquisition.watchdog  # type: ignore[union-attr]
+        time.sleep(1.3)
+        assert held.is_locked()
+
+    assert not held.is_locked()
+    assert isinstance(watchdog, LockWatchdog)
+    assert not watchdog._thread.is_alive()
+    assert held._acquisition is None
+
+
+def test_watchdog_is_not_started_without_expiration() -> None:
+    instance = init_cachify(is_global=False)
+
+    with instance.lock(key='job', exp=None, watchdog=True) as held:
+        assert held._acquisition is not None and held._acquisition.watchdog is None
+
+
+async def test_async_watchdog_extends_until_released(mocker: MockerFixture) -> None:
+    _fast_watchdog(mocker)
+    instance = init_cachify(is_global=False)
+    extend = mocker.spy(instance._client, 'a_extend_lock')
+
+    async with instance.lock(key='job', exp=1, watchdog=True) as held:
+        await asyncio.sleep(0.05)
+        task = held._acquisition.watchdog._task  # type: ignore[union-attr]
+        assert extend.call_count >= 2
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    calls = extend.call_count
+    await asyncio.sleep(0.05)
+    assert extend.call_count == calls
+
+    assert extend.call_args.kwargs == {'key': 'job', 'token': mocker.ANY, 'ttl': 1}
+    assert not await held.is_alocked()
+
+
+@pytest.mark.parametrize('is_async', [False, True])
+async def test_watchdog_stops_once_the_lock_is_lost(mocker: MockerFixture, is_async: bool) -> None:
+    _fast_watchdog(mocker)
+    warning = mocker.patch('py_cachify._backend._lock_watchdog.logger.warning')
+    instance = init_cachify(is_global=False)
+
+    held = instance.lock(key='job', exp=1, watchdog=True)
+    if is_async:
+        extend = mocker.patch.object(instance._client, 'a_extend_lock', side_effect=[ConnectionError('down'), False])
+        _ = await held.__aenter__()
+        await asyncio.sleep(0.1)
+    else:
+        extend = mocker.patch.object(instance._client, 'extend_lock', side_effect=[ConnectionError('down'), False])
+        _ = held.__enter__()
+        time.sleep(0.1)
+
+    assert extend.call_count == 2
+    assert [call.args[0] for call in warning.call_args_list] == [
+        'Extending job failed: down',
+        'job is no longer held by this owner, stopped extending it',
+    ]
+    if is_async:
+        await held.arelease()
+    else:
+        held.release()
+
+
+def test_lock_reused_across_threads_releases_its_own_acquisition() -> None:
+    instance = init_cachify(is_global=False)
+    shared = instance.lock(key='job', nowait=False, timeout=3)
+    order: list[str] = []
+
+    def work(name: str) -> None:
+        with shared:
+            order.append(name)
+            time.sleep(0.02)
+
+    workers = [threading.Thread(target=work, args=(str(idx),)) for idx in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert sorted(order) == ['0', '1', '2']
+    assert not shared.is_locked()
+
+
+def test_shared_lock_keeps_acquisitions_of_threads_apart(mocker: MockerFixture) -> None:
+    warning = mocker.patch('py_cachify._backend._lock.logger.warning')
+    instance = init_cachify(is_global=False)
+    shared = instance.lock(key='job')
+    steps = {name: threading.Event() for name in ('first-held', 'second-held', 'first-done', 'third-held')}
+
+    def first() -> None:
+        with shared:
+            steps['first-held'].set()
+            _ = steps['second-held'].wait(2)
+        steps['first-done'].set()
+
+    def second() -> None:
+        with shared:
+            steps['second-held'].set()
+            _ = steps['third-held'].wait(2)
+
+    workers = [threading.Thread(target=first), threading.Thread(target=second)]
+    workers[0].start()
+    _ = steps['first-held'].wait(2)
+    instance._client.delete('job')  # the first acquisition expires, the second one takes over
+    workers[1].start()
+    _ = steps['first-done'].wait(2)
+
+    # the late exit of the first thread left the second one's lock alone
+    assert shared.is_locked()
+    instance._client.delete('job')  # the second acquisition expires as well and a third holder takes over
+    assert instance._client.try_acquire_lock('job', ttl=None, token='third')
+    steps['third-held'].set()
+    workers[1].join()
+    workers[0].join()
+
+    assert instance._client.get('job') == 'third'
+    assert warning.call_count == 2
+    assert shared.fencing_token is None
+
+
+def test_cachify_lock_passes_the_watchdog_flag() -> None:
+    instance: Cachify = init_cachify(is_global=False)
+
+    assert instance.lock(key='job', watchdog=True)._watchdog
+
+
+async def test_decorated_lock_passes_the_watchdog_flag(init_cachify_fixture: None, mocker: MockerFixture) -> None:
+    started = mocker.spy(LockWatchdog, '__init__')
+
+    @lock(key='sync-job', exp=5, watchdog=True)
+    def sync_job() -> int:
+        return 1
+
+    @lock(key='async-job', exp=5, watchdog=True)
+    async def async_job() -> int:
+        return 2
+
+    assert sync_job() == 1
+    assert await async_job() == 2
+    assert started.call_count == 1
+
+
+@pytest.mark.parametrize('sync_client', ['memory', 'fallback', 'tiered'], indirect=True)
+def test_fencing_tokens_increase_with_every_acquisition(sync_client: Any) -> None:
+    instance = init_cachify(sync_client=sync_client, prefix='PYC-', is_global=False)
+    fenced = instance.lock(key='job', fencing=True)
+
+    tokens = []
+    for _ in range(3):
+        with fenced as held:
+            tokens.append(held.fencing_token)
+        assert fenced.fencing_token is None
+
+    assert tokens == [1, 2, 3]
+    assert int(sync_client.get('PYC-job-fence')) == 3
+    with instance.lock(key='job') as unfenced:
+        assert unfenced.fencing_token is None
+
+
+@pytest.mark.parametrize('async_client', ['memory', 'fallback', 'tiered', 'threaded'], indirect=True)
+async def test_async_fencing_tokens_increase_with_every_acquisition(async_client: Any, fake_client: Any) -> None:
+    instance = init_cachify(sync_client=fake_client, async_client=async_client, is_global=False)
+
+    tokens = []
+    for _ in range(3):
+        async with instance.lock(key='job', fencing=True) as held:
+            tokens.append(held.fencing_token)
+
+    assert tokens == [1, 2, 3]
+    assert held.fencing_token is None
+
+
+@pytest.mark.parametrize('is_async', [False, True])
+async def test_lock_expired_before_fencing_is_not_acquired(is_async: bool) -> None:
+    instance = init_cachify(is_global=False)
+    client, cache = instance._client, instance._client._sync_client
+    lost: list[str] = []
+
+    def incr(name: str) -> int:
+        # the first acquisition expires right before its ownership is checked
+        if not lost:
+            lost.append(name)
+            client.delete('job')
+        return MemoryCache.incr(cache, name)  # type: ignore[arg-type]
+
+    async def a_incr(name: str) -> int:
+        return incr(name)
+
+    client._sync_incr, client._async_incr = incr, a_incr
+    held = instance.lock(key='job', nowait=False, timeout=1, fencing=True)
+    _ = (await held.__aenter__()) if is_async else held.__enter__()
+
+    # the first token was lost along with the lock, only the second acquisition holds one
+    assert held.fencing_token == 2
+    held.release()
+
+    lost.clear()
+    with pytest.raises(CachifyLockError):
+        with instance.lock(key='job', fencing=True):
+            pass
+
+
+def test_memory_cache_incr_keeps_counters_pinned() -> None:
+    cache = MemoryCache(max_entries=2, stripes=1)
+
+    assert [cache.incr('counter') for _ in range(3)] == [1, 2, 3]
+    cache.set('a-cached', 1)
+    cache.set('b-cached', 2)
+    cache.set('c-cached', 3)
+
+    assert cache.get('counter') == 3
+    assert cache.get('a-cached') is None
+
+
+def test_cachify_lock_passes_the_fencing_flag() -> None:
+    instance: Cachify = init_cachify(is_global=False)
+
+    assert instance.lock(key='job', fencing=True)._fencing
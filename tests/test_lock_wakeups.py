@@ -0,0 +1,211 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import threading
+import time
+from typing import Any
+
+from py_cachify import Cachify, LocalTransport, LockWakeups, MemoryCache, init_cachify, lock
+from py_cachify._backend._clients import AsyncWrapper
+
+
+def _instance(**kwargs: Any) -> Cachify:
+    # a poll interval this long would dominate the handoff latency without the wake-up channel
+    return init_cachify(lock_poll_interval=5, is_global=False, **kwargs)
+
+
+def _hold_in_thread(instance: Cachify, key: str, hold: float) -> threading.Thread:
+    acquired = threading.Event()
+
+    def hold_lock() -> None:
+        with instance.lock(key=key):
+            _ = acquired.set()
+            time.sleep(hold)
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    _ = acquired.wait()
+    return thread
+
+
+def test_sync_waiter_is_woken_by_release() -> None:
+    instance = _instance()
+    holder = _hold_in_thread(instance, 'job', 0.1)
+
+    started = time.monotonic()
+    with instance.lock(key='job', nowait=False, timeout=3):
+        elapsed = time.monotonic() - started
+    holder.join()
+
+    assert elapsed < 1
+    assert instance._client.lock_wakeups._watched == {}
+
+
+async def test_async_waiter_is_woken_by_release_from_another_thread() -> None:
+    instance = _instance()
+    holder = _hold_in_thread(instance, 'job', 0.1)
+
+    started = time.monotonic()
+    async with instance.lock(key='job', nowait=False, timeout=3):
+        elapsed = time.monotonic() - started
+    holder.join()
+
+    assert elapsed < 1
+    assert instance._client.lock_wakeups._async_waiters == {}
+
+
+async def test_async_waiters_are_woken_by_async_release() -> None:
+    instance = _instance()
+    order: list[str] = []
+
+    async def worker(name: str, hold: float) -> None:
+        async with instance.lock(key='job', nowait=False, timeout=3):
+            order.append(name)
+            await asyncio.sleep(hold)
+
+    started = time.monotonic()
+    await asyncio.gather(worker('first', 0.05), worker('second', 0), worker('third', 0))
+
+    assert time.monotonic() - started < 1
+    assert order[0] == 'first'
+    assert sorted(order) == ['first', 'second', 'third']
+
+
+def test_decorated_lock_release_wakes_waiters(init_cachify_fixture: None) -> None:
+    instance = init_cachify(lock_poll_interval=5)
+
+    @lock(key='job-{x}', nowait=False, timeout=3)
+    def job(x: int) -> None:
+        pass
+
+    with instance.lock(key='job-1-lock'):
+        waiter = threading.Thread(target=job, args=(1,))
+        started = time.monotonic()
+        waiter.start()
+        time.sleep(0.05)
+        job.release(1)
+        waiter.join()
+
+    assert time.monotonic() - started < 1
+
+
+async def test_async_decorated_lock_release_wakes_waiters(init_cachify_fixture: None) -> None:
+    instance = init_cachify(lock_poll_interval=5)
+
+    @lock(key='job-{x}', nowait=False, timeout=3)
+    async def job(x: int) -> None:
+        pass
+
+    await instance._client.a_try_acquire_lock('job-1-lock', ttl=None)
+    started = time.monotonic()
+    waiter = asyncio.ensure_future(job(1))
+    await asyncio.sleep(0.05)
+    await job.release(1)
+    await waiter
+
+    assert time.monotonic() - started < 1
+
+
+async def test_wakeups_reach_other_processes_through_the_transport() -> None:
+    transport, backend = LocalTransport(), MemoryCache()
+    first_wakeups, second_wakeups = LockWakeups(transport), LockWakeups(transport)
+    first = _instance(sync_client=backend, lock_wakeups=first_wakeups)
+    second = _instance(sync_client=backend, async_client=AsyncWrapper(backend), lock_wakeups=second_wakeups)
+    assert first._client.lock_wakeups is first_wakeups
+
+    holder = _hold_in_thread(first, 'job', 0.1)
+    started = time.monotonic()
+    with second.lock(key='job', nowait=False, timeout=3):
+        assert time.monotonic() - started < 1
+    holder.join()
+
+    async with first.lock(key='job'):
+        waiter = asyncio.ensure_future(second.lock(key='job', nowait=False, timeout=3).__aenter__())
+        await asyncio.sleep(0.05)
+    started = time.monotonic()
+    _ = await waiter
+    assert time.monotonic() - started < 1
+
+    first_wakeups.close()
+    first_wakeups.close()
+    second_wakeups.close()
+
+
+def test_failed_broadcast_is_logged(mocker: Any) -> None:
+    transport = LocalTransport()
+    _ = mocker.patch.object(transport, 'publish', side_effect=ConnectionError('down'))
+    warning = mocker.patch('py_cachify._backend._lock_wakeups.logger.warning')
+    wakeups = LockWakeups(transport)
+
+    with wakeups.watch('job') as watch:
+        wakeups.notify('job')
+        assert watch.wait(0)
+
+    warning.assert_called_once_with('Broadcasting release of job failed: down')
+
+
+def test_watch_only_reports_later_releases_of_its_name() -> None:
+    wakeups = LockWakeups()
+    wakeups.notify('job')
+
+    with wakeups.watch('job') as watch, wakeups.watch('job') as other:
+        assert not watch.wait(0.01)
+        wakeups.notify('other-job')
+        assert not watch.wait(0.01)
+        wakeups.notify('job')
+        assert watch.wait(0)
+        assert not watch.wait(0)
+        assert other.wait(0)
+
+    assert wakeups._watched == {}
+
+
+async def test_async_watch_timeouts_and_pending_releases() -> None:
+    wakeups = LockWakeups()
+
+    with wakeups.watch('job') as watch, wakeups.watch('job') as other:
+        assert await asyncio.gather(watch.a_wait(0.01), other.a_wait(0.02)) == [False, False]
+        assert wakeups._async_waiters == {}
+
+        wakeups.notify('job')
+        assert await watch.a_wait(1)
+        assert await other.a_wait(1)
+
+
+def test_release_wakes_a_single_sync_waiter() -> None:
+    wakeups = LockWakeups()
+    woken: list[bool] = []
+
+    with wakeups.watch('job') as first, wakeups.watch('job') as second:
+        waiters = [
+            threading.Thread(target=lambda watch=watch: woken.append(watch.wait(3))) for watch in (first, second)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        wakeups.notify('job')
+        time.sleep(0.05)
+        assert woken == [True]
+
+        wakeups.notify('job')
+        for waiter in waiters:
+            waiter.join()
+
+    assert woken == [True, True]
+    assert time.monotonic() - started < 1
+
+
+async def test_release_wakes_a_single_async_waiter() -> None:
+    wakeups = LockWakeups()
+
+    with wakeups.watch('job') as first, wakeups.watch('job') as second:
+        waiters = [asyncio.ensure_future(watch.a_wait(3)) for watch in (first, second)]
+        await asyncio.sleep(0.01)
+
+        wakeups.notify('job')
+        await asyncio.sleep(0.01)
+        assert [waiter.done() for waiter in waiters] == [True, False]
+
+        wakeups.notify('job')
+        assert await asyncio.gather(*waiters) == [True, True]
@@ -10,6 +10,7 @@ import pytest
 
 from py_cachify import CachifyLockError, init_cachify, lock
 from py_cachify._backend._lib import CachifyClient
+from py_cachify._backend._lock_wakeups import LockWatch
 from py_cachify._backend._types._common import UNSET
 
 
@@ -204,7 +205,7 @@ def test_lock_poll_interval_is_stored_in_cachify_client():
 
 
 def test_lock_poll_interval_is_used_in_sync_lock(mocker: Any):
-    sleep_mock = mocker.patch('time.sleep')
+    sleep_mock = mocker.spy(LockWatch, 'wait')
     _ = init_cachify(lock_poll_interval=0.05, is_global=True)
 
     @lock(key='poll-test', nowait=False, timeout=2.0)
@@ -220,16 +221,13 @@ def test_lock_poll_interval_is_used_in_sync_lock(mocker: Any):
     thread2.join()
     thread1.join()
 
-    poll_intervals = [call.args[0] for call in sleep_mock.call_args_list if call.args[0] == 0.05]
+    poll_intervals = [call.args[-1] for call in sleep_mock.call_args_list if call.args[-1] == 0.05]
     assert len(poll_intervals) > 0
 
 
 @pytest.mark.asyncio
 async def test_lock_poll_interval_is_used_in_async_lock(mocker: Any):
-    async def mock_sleep(interval: float) -> None:
-        await asleep(0.01)
-
-    sleep_mock = mocker.patch('py_cachify._backend._lock.asleep', side_effect=mock_sleep)
+    sleep_mock = mocker.spy(LockWatch, 'a_wait')
     _ = init_cachify(lock_poll_interval=0.05, is_global=True)
 
     @lock(key='poll-test-async', nowait=False, timeout=2.0)
@@ -243,5 +241,5 @@ async def test_lock_poll_interval_is_used_in_async_lock(mocker: Any):
     await task2
     await task1
 
-    poll_intervals = [call.args[0] for call in sleep_mock.call_args_list if call.args[0] == 0.05]
+    poll_intervals = [call.args[-1] for call in sleep_mock.call_args_list if call.args[-1] == 0.05]
     assert len(poll_intervals) > 0
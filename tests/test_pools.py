@@ -10,7 +10,7 @@ from typing import Any
 import pytest
 from pytest_mock import MockerFixture
 
-from py_cachify import CachifyPoolFullError, init_cachify, pool, pooled
+from py_cachify import CachifyPoolFullError, MemoryCache, init_cachify, pool, pooled
 from py_cachify._backend._lib import CachifyClient, get_cachify_client
 from py_cachify._backend._pool import _PoolAsync, _PoolBase, _pooled_impl, _PoolSync
 from py_cachify._backend._pool_state import PoolState
@@ -1343,3 +1343,50 @@ async def test_pooled_standalone_async_returns_none_no_onfull(init_cachify_fixtu
         assert result is None
     finally:
         await task1
+
+
+def test_pool_state_survives_a_bounded_memory_cache() -> None:
+    """Test that cached values filling a bounded MemoryCache never evict the pool state."""
+    instance = init_cachify(sync_client=MemoryCache(max_entries=3), is_global=False)
+    slots = instance.pool(key='p', max_size=1)
+
+    @instance.cached(key='square-{x}')
+    def square(x: int) -> int:
+        return x * x
+
+    with slots:
+        assert [square(x) for x in range(5)] == [0, 1, 4, 9, 16]
+
+        assert slots.size() == 1
+        with pytest.raises(CachifyPoolFullError):
+            with slots:
+                pass
+
+
+@pytest.mark.asyncio
+async def test_pool_state_keys_are_reclaimed() -> None:
+    """Test that per-argument pool states are deleted once empty and expire with their last slot."""
+    cache = MemoryCache()
+    instance = init_cachify(sync_client=cache, prefix='PYC-', is_global=False)
+
+    @instance.pooled(key='p-{x}', max_size=1, slot_exp=1)
+    def work(x: int) -> int:
+        return x
+
+    assert [work(x) for x in range(200)] == list(range(200))
+    assert sum(len(shard) for shard in cache._shards) == 0
+
+    held, a_held = (
+        instance.pool(key='held', max_size=2, slot_exp=1),
+        instance.pool(key='a-held', max_size=2, slot_exp=1),
+    )
+    held.__enter__()
+    _ = await a_held.__aenter__()
+    forever = instance.pool(key='forever', max_size=1, slot_exp=None)
+    forever.__enter__()
+    assert cache.get('PYC-held-state') is not None
+
+    await asyncio.sleep(1.1)
+    assert cache.sweep_expired() == 2
+    assert sum(len(shard) for shard in cache._shards) == 1
+    assert forever.size() == 1
@@ -0,0 +1,112 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from py_cachify import CachifyLockError, init_cachify, lock, once
+from py_cachify._backend._lock import _reentrant_holds
+
+
+def test_nested_acquisitions_only_hold_the_lock_once(mocker: MockerFixture) -> None:
+    instance = init_cachify(is_global=False)
+    acquire = mocker.spy(instance._client, 'try_acquire_lock')
+    release = mocker.spy(instance._client, 'release_lock')
+    outer = instance.lock(key='job', reentrant=True)
+
+    with outer:
+        with outer, instance.lock(key='job', reentrant=True):
+            assert outer.is_locked()
+        assert outer.is_locked()
+        assert release.call_count == 0
+
+    assert not outer.is_locked()
+    assert acquire.call_count == 1
+    assert release.call_count == 1
+    assert _reentrant_holds.get() == {}
+
+
+async def test_async_nested_acquisitions_only_hold_the_lock_once(mocker: MockerFixture) -> None:
+    instance = init_cachify(is_global=False)
+    acquire = mocker.spy(instance._client, 'a_try_acquire_lock')
+
+    async with instance.lock(key='job', reentrant=True) as outer:
+        async with instance.lock(key='job', reentrant=True):
+            pass
+        assert await outer.is_alocked()
+
+    assert not await outer.is_alocked()
+    assert acquire.call_count == 1
+
+
+def test_decorated_function_calling_itself_with_the_same_key(init_cachify_fixture: None) -> None:
+    @lock(key='countdown-{name}', reentrant=True)
+    def countdown(name: str, left: int) -> int:
+        return left if left == 0 else countdown(name, left - 1)
+
+    @lock(key='countdown-{name}')
+    def plain_countdown(name: str, left: int) -> int:
+        return left if left == 0 else plain_countdown(name, left - 1)
+
+    assert countdown('a', 3) == 0
+    assert not countdown.is_locked('a', 3)
+    with pytest.raises(CachifyLockError):
+        _ = plain_countdown('b', 3)
+
+
+async def test_once_runs_nested_calls_of_the_same_task(init_cachify_fixture: None) -> None:
+    instance = init_cachify(is_global=False)
+
+    @instance.once(key='sync-once', reentrant=True)
+    def sync_nested(depth: int) -> str:
+        return sync_nested(depth - 1) if depth else 'ran'
+
+    @once(key='async-once', return_on_locked='locked', reentrant=True)
+    async def async_nested(depth: int) -> str:
+        return await async_nested(depth - 1) if depth else 'ran'
+
+    @once(key='plain-once', return_on_locked='locked')
+    async def plain_nested(depth: int) -> str:
+        return await plain_nested(depth - 1) if depth else 'ran'
+
+    assert sync_nested(2) == 'ran'
+    assert await async_nested(2) == 'ran'
+    assert await plain_nested(2) == 'locked'
+
+
+async def test_other_tasks_and_threads_do_not_reenter() -> None:
+    instance = init_cachify(is_global=False)
+    reentrant = instance.lock(key='job', reentrant=True)
+
+    def in_thread() -> None:
+        with pytest.raises(CachifyLockError):
+            with instance.lock(key='job', reentrant=True):
+                pass
+
+    async with reentrant:
+        # a task created here inherits the holds of this context, but it is not their owner
+        with pytest.raises(CachifyLockError):
+            await asyncio.create_task(instance.lock(key='job', reentrant=True).__aenter__())
+
+        worker = threading.Thread(target=in_thread)
+        worker.start()
+        worker.join()
+
+        # and a release from another task releases the lock in the cache
+        await asyncio.create_task(reentrant.arelease())
+        assert not await reentrant.is_alocked()
+
+
+def test_holds_are_separate_per_client() -> None:
+    first, second = init_cachify(is_global=False), init_cachify(is_global=False)
+
+    with first.lock(key='job', reentrant=True):
+        with second.lock(key='job', reentrant=True) as other:
+            assert other._acquisition is not None
+
+
+def test_cachify_lock_passes_the_reentrant_flag() -> None:
+    instance = init_cachify(is_global=False)
+
+    assert instance.lock(key='job', reentrant=True)._reentrant
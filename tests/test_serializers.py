@@ -0,0 +1,228 @@
+# pyright: reportPrivateUsage=false
+import math
+import pickle
+from typing import Any, Optional, SupportsIndex
+
+import pytest
+from pytest_mock import MockerFixture
+
+import py_cachify._backend._serializers
+from py_cachify import (
+    JSONSerializer,
+    MemoryCache,
+    OutOfBandPickleSerializer,
+    PickleSerializer,
+    RawSerializer,
+    ZlibCompressor,
+)
+from py_cachify._backend._cache_entry import CacheEntry, FramedEntrySerializer
+from py_cachify._backend._clients import AsyncWrapper
+from py_cachify._backend._lib import CachifyClient
+from py_cachify._backend._serializers import OutOfBandPayload
+
+
+def test_pickle_serializer_uses_highest_protocol_by_default() -> None:
+    serializer = PickleSerializer()
+    data = serializer.dumps({'a': 1})
+
+    assert serializer.protocol == pickle.HIGHEST_PROTOCOL
+    assert data[1] == pickle.HIGHEST_PROTOCOL
+    assert serializer.loads(data) == {'a': 1}
+
+
+def test_pickle_serializer_custom_protocol() -> None:
+    serializer = PickleSerializer(protocol=2)
+
+    assert serializer.dumps(1)[1] == 2
+
+
+@pytest.mark.parametrize('value', [b'bytes', bytearray(b'bytes'), memoryview(b'bytes')])
+def test_raw_serializer_passes_bytes_through(value: object) -> None:
+    serializer = RawSerializer()
+    data = serializer.dumps(value)
+
+    assert data == b'bytes'
+    assert type(data) is bytes
+    assert serializer.loads(data) == b'bytes'
+
+
+def test_raw_serializer_rejects_non_bytes() -> None:
+    with pytest.raises(TypeError, match='RawSerializer can only store bytes-like values, got str'):
+        _ = RawSerializer().dumps('text')
+
+
+def test_json_serializer_roundtrip() -> None:
+    serializer = JSONSerializer()
+    data = serializer.dumps({'a': [1, 2], 'b': None})
+
+    assert data == b'{"a":[1,2],"b":null}'
+    assert serializer.loads(data) == {'a': [1, 2], 'b': None}
+
+
+def test_json_serializer_falls_back_to_stdlib(mocker: MockerFixture) -> None:
+    mocker.patch.object(py_cachify._backend._serializers, '_orjson', None)
+    serializer = JSONSerializer()
+    data = serializer.dumps({'a': [1, 2]})
+
+    assert data == b'{"a":[1,2]}'
+    assert serializer.loads(data) == {'a': [1, 2]}
+
+
+def test_framed_entry_serializer_plain_value() -> None:
+    serializer = FramedEntrySerializer(JSONSerializer())
+    data = serializer.dumps([1, 2])
+
+    assert data == b'\x00[1,2]'
+    assert serializer.loads(data) == [1, 2]
+
+
+def test_framed_entry_serializer_entry() -> None:
+    serializer = FramedEntrySerializer(RawSerializer())
+    entry = CacheEntry(value=b'payload', stored_at=100.5, delta=0.25, expires_at=160.5)
+
+    assert serializer.loads(serializer.dumps(entry)) == entry
+
+
+def test_framed_entry_serializer_entry_without_expiration_and_none_value() -> None:
+    serializer = FramedEntrySerializer(RawSerializer())
+    entry = CacheEntry(value=None, stored_at=100.5)
+
+    restored = serializer.loads(serializer.dumps(entry))
+
+    assert restored == entry
+    assert restored.expires_at is None
+    assert not math.isnan(restored.delta)
+
+
+def test_framed_entry_serializer_reads_untagged_payloads() -> None:
+    assert FramedEntrySerializer(JSONSerializer()).loads(b'[1,2]') == [1, 2]
+    # starts with a tag byte but isn't a valid frame
+    assert FramedEntrySerializer(RawSerializer()).loads(b'\x02') == b'\x02'
+
+
+def test_framed_entry_serializer_without_frame_writes() -> None:
+    serializer = FramedEntrySerializer(JSONSerializer(), frame_writes=False)
+    entry = CacheEntry(value=[1], stored_at=100.5)
+
+    assert serializer.dumps([1, 2]) == b'[1,2]'
+    assert serializer.loads(b'[1,2]') == [1, 2]
+    assert serializer.loads(b'\x00[1,2]') == [1, 2]
+    assert serializer.loads(FramedEntrySerializer(JSONSerializer()).dumps(entry)) == entry
+    with pytest.raises(ValueError):
+        _ = serializer.loads(b'not json')
+
+
+class ZeroCopyBlob:
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        return ZeroCopyBlob, (pickle.PickleBuffer(self.data),)
+
+
+class DictClient:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    def get(self, name: str) -> Any:
+        return self.data.get(name)
+
+    def set(self, name: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Any:
+        self.data[name] = value
+
+    def delete(self, *names: str) -> Any:
+        for name in names:
+            _ = self.data.pop(name, None)
+
+
+def test_out_of_band_serializer_keeps_large_buffers_aside() -> None:
+    serializer = OutOfBandPickleSerializer(min_buffer_size=1024)
+    source = bytearray(b'x' * 4096)
+
+    payload = serializer.dumps_parts(ZeroCopyBlob(source))
+
+    assert len(payload.head) < 1024
+    assert len(payload.buffers) == 1
+    assert payload.buffers[0].readonly
+    assert payload.nbytes == len(payload.head) + 4096
+
+    restored = serializer.loads(payload)
+    # the restored value is a view of the original memory, nothing was copied
+    source[0] = ord('y')
+    assert bytes(restored.data[:1]) == b'y'
+
+
+def test_out_of_band_serializer_keeps_small_buffers_in_band() -> None:
+    serializer = OutOfBandPickleSerializer(min_buffer_size=1024)
+    data = serializer.dumps(ZeroCopyBlob(bytearray(b'small')))
+
+    assert data[:2] == b'\x80\x05'
+    assert bytes(serializer.loads(data).data) == b'small'
+    assert serializer.protocol == 5
+
+
+def test_out_of_band_serializer_framed_payload_roundtrip() -> None:
+    serializer = OutOfBandPickleSerializer(min_buffer_size=16)
+    value = {'a': bytearray(b'a' * 100), 'b': ZeroCopyBlob(bytearray(b'b' * 50)), 'c': 1}
+
+    data = serializer.dumps(value)
+    assert data.startswith(b'OOB5')
+
+    restored = serializer.loads(data)
+    assert restored['a'] == bytearray(b'a' * 100)
+    assert bytes(restored['b'].data) == b'b' * 50
+    assert restored['c'] == 1
+    # buffers are zero-copy slices of the received payload
+    assert restored['b'].data.obj is data
+
+
+def test_cachify_client_stores_out_of_band_buffers_by_reference_in_memory() -> None:
+    memory_cache = MemoryCache()
+    client = CachifyClient(
+        sync_client=memory_cache, async_client=AsyncWrapper(memory_cache), default_expiration=30, prefix=''
+    )
+    serializer = OutOfBandPickleSerializer(min_buffer_size=1024)
+    source = bytearray(b'x' * 4096)
+
+    client.set('blob', ZeroCopyBlob(source), serializer=serializer)
+
+    stored = memory_cache.get('blob')
+    assert isinstance(stored, OutOfBandPayload)
+    assert bytes(client.get('blob', serializer=serializer).data) == bytes(source)
+
+    # the entry aliases the source memory, writes to it after caching show up in the cached value
+    source[0] = ord('y')
+    assert bytes(client.get('blob', serializer=serializer).data[:1]) == b'y'
+
+
+@pytest.mark.asyncio
+async def test_cachify_client_frames_out_of_band_buffers_for_remote_backends() -> None:
+    remote = DictClient()
+    memory_cache = MemoryCache()
+    client = CachifyClient(
+        sync_client=remote,
+        async_client=AsyncWrapper(memory_cache),
+        default_expiration=30,
+        prefix='',
+        compressor=ZlibCompressor(),
+        compress_threshold=10**9,
+    )
+    serializer = OutOfBandPickleSerializer(min_buffer_size=1024)
+
+    client.set('blob', ZeroCopyBlob(bytearray(b'x' * 4096)), serializer=serializer)
+    assert isinstance(remote.data['blob'], bytes)
+    assert remote.data['blob'].startswith(b'OOB5')
+    assert bytes(client.get('blob', serializer=serializer).data) == b'x' * 4096
+
+    await client.a_set('blob', ZeroCopyBlob(bytearray(b'y' * 4096)), serializer=serializer)
+    assert isinstance(memory_cache.get('blob'), OutOfBandPayload)
+    assert bytes((await client.a_get('blob', serializer=serializer)).data) == b'y' * 4096
+
+
+def test_memory_cache_accounts_out_of_band_payload_size() -> None:
+    cache = MemoryCache(max_bytes=10_000, stripes=1)
+    payload = OutOfBandPickleSerializer(min_buffer_size=1024).dumps_parts(ZeroCopyBlob(bytearray(4096)))
+
+    cache.set('blob', payload)
+
+    assert cache.total_bytes == payload.nbytes
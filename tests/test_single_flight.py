@@ -0,0 +1,127 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py_cachify._backend._single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_runs_once_for_concurrent_callers() -> None:
+    flight = SingleFlight()
+    calls: list[int] = []
+    started = threading.Event()
+
+    def work() -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(flight.do, 'k', work)
+        _ = started.wait(1)
+        rest = [executor.submit(flight.do, 'k', work) for _ in range(3)]
+
+    assert [f.result() for f in [first, *rest]] == [42] * 4
+    assert sum(calls) == 1
+    assert flight._calls == {}
+
+
+def test_single_flight_propagates_errors_to_followers() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def work() -> int:
+        started.set()
+        time.sleep(0.2)
+        raise ValueError('boom')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(flight.do, 'k', work)
+        _ = started.wait(1)
+        second = executor.submit(flight.do, 'k', work)
+
+    for future in (first, second):
+        with pytest.raises(ValueError, match='boom'):
+            _ = future.result()
+    assert flight._calls == {}
+
+
+def test_single_flight_nested_call_from_leader_does_not_deadlock() -> None:
+    flight = SingleFlight()
+
+    def outer() -> int:
+        return flight.do('k', lambda: 1) + 1
+
+    assert flight.do('k', outer) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_runs_once_per_key() -> None:
+    flight = AsyncSingleFlight()
+    calls: list[str] = []
+
+    def make(key: str):
+        async def work() -> str:
+            calls.append(key)
+            await asyncio.sleep(0.05)
+            return key
+
+        return work
+
+    results = await asyncio.gather(*(flight.do(k, make(k)) for k in ['a', 'a', 'b', 'a']))
+
+    assert results == ['a', 'a', 'b', 'a']
+    assert sorted(calls) == ['a', 'b']
+    assert flight._calls == {}
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_nested_call_from_leader_does_not_deadlock() -> None:
+    flight = AsyncSingleFlight()
+
+    async def inner() -> int:
+        return 1
+
+    async def outer() -> int:
+        return await flight.do('k', inner) + 1
+
+    assert await flight.do('k', outer) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_follower_takes_over_after_leader_cancellation() -> None:
+    flight = AsyncSingleFlight()
+    calls: list[int] = []
+
+    async def work() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return len(calls)
+
+    leader = asyncio.create_task(flight.do('k', work))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(flight.do('k', work))
+    await asyncio.sleep(0.01)
+    _ = leader.cancel()
+
+    assert await follower == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert flight._calls == {}
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_propagates_errors_to_followers() -> None:
+    flight = AsyncSingleFlight()
+
+    async def work() -> int:
+        await asyncio.sleep(0.05)
+        raise ValueError('boom')
+
+    results = await asyncio.gather(flight.do('k', work), flight.do('k', work), return_exceptions=True)
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
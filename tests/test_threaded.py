@@ -0,0 +1,156 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from py_cachify import MemoryCache, ThreadedAsyncClient, init_cachify
+from py_cachify._backend._clients import AsyncWrapper
+
+
+def test_threaded_client_validates_max_workers(fake_client: Any) -> None:
+    with pytest.raises(ValueError, match='max_workers'):
+        _ = ThreadedAsyncClient(fake_client, max_workers=0)
+
+
+async def test_threaded_client_forwards_calls(fake_client: Any) -> None:
+    backend = fake_client
+    client = ThreadedAsyncClient(backend)
+
+    assert await client.set('a', 1, ex=10) is None
+    assert await client.set('a', 2, nx=True) is False
+    assert await client.get('a') == 1
+    await client.delete('a')
+    assert await client.get('a') is None
+    client.close()
+
+
+async def test_threaded_client_does_not_block_the_event_loop(fake_client: Any) -> None:
+    fake_client.delay = 0.2
+    client = ThreadedAsyncClient(fake_client)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.ensure_future(ticker())
+    _ = await asyncio.gather(client.get('a'), client.get('b'))
+    _ = ticking.cancel()
+
+    assert ticks >= 10
+
+
+async def test_threaded_client_coalesces_concurrent_gets(fake_client: Any) -> None:
+    backend = fake_client
+    backend.delay = 0.05
+    backend.cache.set('a', 1)
+    client = ThreadedAsyncClient(backend)
+
+    assert await asyncio.gather(*(client.get('a') for _ in range(5)), client.get('b')) == [1, 1, 1, 1, 1, None]
+    assert await client.get('a') == 1
+
+    assert sorted(backend.calls) == ['get a', 'get a', 'get b']
+    assert client.stats().coalesced_gets == 4
+    assert client._gets == {}
+
+
+async def test_threaded_client_gets_after_a_write_do_not_join_older_reads(fake_client: Any) -> None:
+    backend = fake_client
+    client = ThreadedAsyncClient(backend, max_workers=1)
+    backend.release.clear()
+
+    stale = asyncio.ensure_future(client.get('a'))
+    await asyncio.sleep(0.01)
+    write = asyncio.ensure_future(client.set('a', 1))
+    await asyncio.sleep(0.01)
+    backend.release.set()
+    assert await asyncio.gather(stale, write) == [None, None]
+
+    assert await client.get('a') == 1
+    assert backend.calls == ['get a', 'set a', 'get a']
+
+
+async def test_threaded_client_cancelled_get_does_not_cancel_the_shared_call(fake_client: Any) -> None:
+    backend = fake_client
+    backend.delay = 0.05
+    backend.cache.set('a', 1)
+    client = ThreadedAsyncClient(backend)
+
+    first = asyncio.ensure_future(client.get('a'))
+    second = asyncio.ensure_future(client.get('a'))
+    await asyncio.sleep(0.01)
+    _ = first.cancel()
+
+    assert await second == 1
+    assert first.cancelled()
+
+
+async def test_threaded_client_batches_use_sync_batch_methods(pipelined_client: Any) -> None:
+    backend = pipelined_client
+    client = ThreadedAsyncClient(backend)
+
+    assert await client.pipeline(transaction=False).set('a', 1, ex=10).set('b', 2).execute() == [None, None]
+    assert await client.mget(iter(['a', 'b', 'c'])) == [1, 2, None]
+    assert backend.calls == ['pipeline a b', 'mget a b c']
+    assert backend.transactions == [False]
+
+
+async def test_threaded_client_batches_fall_back_to_single_calls(fake_client: Any) -> None:
+    backend = fake_client
+    client = ThreadedAsyncClient(backend)
+
+    assert await client.pipeline().set('a', 1).execute() == [None]
+    assert await client.mget(['a', 'b']) == [1, None]
+    assert client.stats().submitted == 2
+    assert backend.calls == ['set a', 'get a', 'get b']
+
+
+async def test_threaded_client_stats_show_backpressure(fake_client: Any) -> None:
+    fake_client.delay = 0.05
+    client = ThreadedAsyncClient(fake_client, max_workers=1)
+
+    _ = await asyncio.gather(*(client.get(f'k{idx}') for idx in range(4)))
+    stats = client.stats()
+
+    assert (stats.submitted, stats.completed, stats.in_flight, stats.peak_in_flight) == (4, 4, 0, 4)
+    assert stats.queue_wait >= 0.05 + 0.1 + 0.15 - 0.05
+
+
+async def test_threaded_client_leaves_external_executor_running(fake_client: Any) -> None:
+    executor = ThreadPoolExecutor(max_workers=1)
+    client = ThreadedAsyncClient(fake_client, executor=executor)
+    owned = ThreadedAsyncClient(MemoryCache())
+
+    client.close()
+    owned.close()
+
+    assert await client.get('a') is None
+    with pytest.raises(RuntimeError):
+        _ = await owned.get('a')
+    assert owned.stats().in_flight == 0
+    executor.shutdown()
+
+
+async def test_init_cachify_derives_the_async_client(fake_client: Any) -> None:
+    memory = MemoryCache()
+    backend = fake_client
+
+    in_memory = init_cachify(sync_client=memory, is_global=False)
+    threaded = init_cachify(sync_client=backend, is_global=False)
+
+    assert isinstance(in_memory._client._async_client, AsyncWrapper)
+    assert in_memory._client._async_client._cache is memory
+    assert isinstance(threaded._client._async_client, ThreadedAsyncClient)
+
+    @threaded.cached(key='square-{x}')
+    async def square(x: int) -> int:
+        return x * x
+
+    async with threaded.lock(key='job'):
+        assert await square(3) == 9
+    assert threaded._client.get('square-3-cached') == 9
+    assert 'set PYC-job' in backend.calls
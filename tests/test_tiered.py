@@ -0,0 +1,196 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from py_cachify import AsyncTieredClient, MemoryCache, TieredClient, cached, cached_batch, init_cachify, lock
+
+
+def test_tiered_client_validates_local_ttl(fake_client: Any) -> None:
+    with pytest.raises(ValueError, match='local_ttl'):
+        _ = TieredClient(fake_client, local_ttl=0)
+
+
+def test_tiered_client_reads_through_l1(fake_client: Any) -> None:
+    remote = fake_client
+    client = TieredClient(remote, local_ttl=5)
+    _ = remote.cache.set('v-cached', b'1')
+
+    assert client.get('v-cached') == b'1'
+    assert client.get('v-cached') == b'1'
+    assert client.get('missing-cached') is None
+    assert remote.calls == ['get v-cached', 'get missing-cached']
+    assert client.local.get('v-cached') == b'1'
+    assert client.local._shards[0]._max_entries == 10_000
+
+
+def test_tiered_client_writes_and_deletes_both_tiers(fake_client: Any) -> None:
+    remote, local = fake_client, MemoryCache()
+    client = TieredClient(remote, local=local, local_ttl=5)
+
+    client.set('v-cached', b'1', ex=2)
+    client.set('w-cached', b'2')
+    assert local.get('v-cached') == b'1'
+    assert remote.cache.get('v-cached') == b'1'
+    assert client.get('w-cached') == b'2'
+
+    client.delete('v-cached', 'w-cached')
+    assert local.get('v-cached') is None
+    assert remote.cache.get('w-cached') is None
+
+
+def test_tiered_client_l1_ttl_is_capped(mocker: Any, fake_client: Any) -> None:
+    local = MemoryCache()
+    local_set = mocker.spy(local, 'set')
+    client = TieredClient(fake_client, local=local, local_ttl=5)
+
+    client.set('a-cached', b'1', ex=2)
+    client.set('b-cached', b'1', ex=60)
+    client.set('c-cached', b'1')
+
+    assert [call.kwargs['ex'] for call in local_set.call_args_list] == [2, 5, 5]
+
+
+def test_tiered_client_serves_stale_l1_until_local_ttl(mocker: Any, fake_client: Any) -> None:
+    remote = fake_client
+    client = TieredClient(remote, local_ttl=1)
+    client.set('v-cached', b'old')
+    _ = remote.cache.set('v-cached', b'new')  # another process updates L2
+
+    assert client.get('v-cached') == b'old'
+    time.sleep(1.1)
+    assert client.get('v-cached') == b'new'
+
+
+def test_tiered_client_keeps_locks_and_other_keys_remote(fake_client: Any) -> None:
+    remote = fake_client
+    client = TieredClient(remote)
+
+    assert client.set('job-lock', b'1', ex=10, nx=True) is True
+    assert client.get('job-lock') == b'1'
+    assert client.get('job-lock') == b'1'
+    assert client.set('pool-state', b'1') is None
+    assert client.local.get('job-lock') is None
+    assert client.local.get('pool-state') is None
+    assert remote.calls == ['set job-lock', 'get job-lock', 'get job-lock', 'set pool-state']
+
+
+def test_tiered_client_nx_write_drops_local_copy(fake_client: Any) -> None:
+    client = TieredClient(fake_client, local_keys=lambda name: True)
+    client.set('k', b'1')
+
+    assert client.set('k', b'2', nx=True) is False
+    assert client.local.get('k') is None
+    assert client.get('k') == b'1'
+
+
+def test_tiered_client_mget_and_pipeline(pipelined_client: Any) -> None:
+    remote = pipelined_client
+    client = TieredClient(remote)
+    pipe = client.pipeline(transaction=False)
+    _ = pipe.set('a-cached', b'1', ex=10).set('b-cached', b'2')
+
+    assert pipe.execute() == [None, None]
+    _ = remote.cache.set('c-cached', b'3')
+    assert client.mget(['a-cached', 'c-cached', 'd-cached']) == [b'1', b'3', None]
+    assert client.mget(['a-cached', 'b-cached', 'c-cached']) == [b'1', b'2', b'3']
+    assert remote.calls == ['pipeline a-cached b-cached', 'mget c-cached d-cached']
+
+
+def test_tiered_client_batches_fall_back_without_remote_support(fake_client: Any) -> None:
+    remote = fake_client
+    client = TieredClient(remote)
+
+    assert client.pipeline().set('a-cached', b'1').execute() == [None]
+    assert client.mget(['a-cached', 'b-cached']) == [b'1', None]
+    assert remote.calls == ['set a-cached', 'get b-cached']
+
+
+async def test_async_tiered_client(fake_client: Any) -> None:
+    remote = fake_client
+    local = MemoryCache()
+    client = AsyncTieredClient(remote.as_async(), local=local, local_ttl=5)
+    _ = remote.cache.set('v-cached', b'1')
+
+    assert await client.get('v-cached') == b'1'
+    assert await client.get('v-cached') == b'1'
+    await client.set('w-cached', b'2', ex=1)
+    assert await client.set('job-lock', b'1', nx=True) is True
+    assert local.get('w-cached') == b'2'
+    assert await client.mget(['v-cached', 'w-cached', 'x-cached']) == [b'1', b'2', None]
+    assert await client.pipeline().set('p-cached', b'3').execute() == [None]
+
+    await client.delete('v-cached')
+    assert local.get('v-cached') is None
+    assert remote.calls == [
+        'get v-cached',
+        'set w-cached',
+        'set job-lock',
+        'get x-cached',
+        'set p-cached',
+        'delete v-cached',
+    ]
+
+
+async def test_async_tiered_client_mget_and_pipeline(pipelined_client: Any) -> None:
+    remote = pipelined_client
+    client = AsyncTieredClient(remote.as_async())
+
+    assert await client.pipeline(transaction=False).set('a-cached', b'1').execute() == [None]
+    assert await client.mget(['a-cached']) == [b'1']
+    assert await client.mget(['a-cached', 'b-cached']) == [b'1', None]
+    assert remote.calls == ['pipeline a-cached', 'mget b-cached']
+
+
+def test_tiered_clients_with_cachify(pipelined_client: Any) -> None:
+    remote = pipelined_client
+    local = MemoryCache(max_entries=100)
+    instance = init_cachify(
+        sync_client=TieredClient(remote, local=local),
+        async_client=AsyncTieredClient(remote.as_async(), local=local),
+        is_global=False,
+    )
+    calls: list[int] = []
+
+    @instance.cached(key='square-{x}')
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    @instance.cached(key='square-{x}')
+    async def a_square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    remote.calls.clear()
+    assert square(3) == 9
+    assert asyncio.run(a_square(3)) == 9
+    assert remote.calls == []
+
+    square.reset(3)
+    assert local.get('PYC-square-3-cached') is None
+    assert remote.cache.get('PYC-square-3-cached') is None
+    assert asyncio.run(a_square(3)) == 9
+    assert calls == [3, 3]
+
+
+def test_tiered_clients_with_global_decorators_keep_locks_remote(pipelined_client: Any) -> None:
+    remote = pipelined_client
+    init_cachify(sync_client=TieredClient(remote), async_client=AsyncTieredClient(remote.as_async()))
+
+    @cached(key='item-{ids}')
+    def item(ids: int) -> int:
+        return ids
+
+    load = cached_batch(key='item-{ids}')(lambda ids: {id_: id_ for id_ in ids})
+
+    assert item(1) == 1
+    assert load([1, 2]) == {1: 1, 2: 2}
+    with lock(key='tiered-lock') as lk:
+        assert lk.is_locked()
+        assert remote.cache.get('PYC-tiered-lock') is not None
+    assert not lock(key='tiered-lock').is_locked()
+    assert remote.calls[-1] == 'get PYC-tiered-lock'
@@ -0,0 +1,255 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from py_cachify import (
+    AdaptiveWait,
+    CachifyLockError,
+    DecorrelatedJitterWait,
+    ExponentialJitterWait,
+    FixedWait,
+    init_cachify,
+    lock,
+    pool,
+    pooled,
+)
+
+
+class _RecordingWait(FixedWait):
+    def __init__(self) -> None:
+        super().__init__(0.01)
+        self.waiting: list[str] = []
+        self.holds: list[tuple[str, float]] = []
+
+    def delays(self, name: str) -> Iterator[float]:
+        self.waiting.append(name)
+        return super().delays(name)
+
+    def record_hold(self, name: str, seconds: float) -> None:
+        self.holds.append((name, seconds))
+
+
+@pytest.fixture
+def upper_bound(mocker: MockerFixture) -> None:
+    _ = mocker.patch('py_cachify._backend._wait.random.uniform', side_effect=lambda _, b: b)
+
+
+def _take(delays: Iterator[float], count: int) -> list[float]:
+    return [round(delay, 6) for delay in itertools.islice(delays, count)]
+
+
+def test_fixed_wait_repeats_the_interval() -> None:
+    assert _take(FixedWait(0.2).delays('job'), 3) == [0.2, 0.2, 0.2]
+
+
+def test_exponential_jitter_wait_doubles_the_ceiling_up_to_the_cap(upper_bound: None) -> None:
+    assert _take(ExponentialJitterWait(base=0.1, cap=0.5).delays('job'), 5) == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+def test_exponential_jitter_wait_is_randomized() -> None:
+    delays = _take(ExponentialJitterWait(base=0.1, cap=0.1).delays('job'), 50)
+
+    assert all(0 <= delay <= 0.1 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_decorrelated_jitter_wait_grows_from_the_previous_wait(upper_bound: None) -> None:
+    assert _take(DecorrelatedJitterWait(base=0.1, cap=2).delays('job'), 5) == [0.3, 0.9, 2, 2, 2]
+
+
+def test_decorrelated_jitter_wait_stays_in_bounds() -> None:
+    delays = _take(DecorrelatedJitterWait(base=0.01, cap=0.5).delays('job'), 50)
+
+    assert all(0.01 <= delay <= 0.5 for delay in delays)
+
+
+def test_jitter_waits_ignore_hold_times(upper_bound: None) -> None:
+    for strategy in (ExponentialJitterWait(base=0.1), DecorrelatedJitterWait(base=0.1)):
+        expected = _take(strategy.delays('job'), 3)
+        strategy.record_hold('job', 10)
+
+        assert _take(strategy.delays('job'), 3) == expected
+
+
+def test_adaptive_wait_backs_off_until_a_hold_time_is_known(upper_bound: None) -> None:
+    strategy = AdaptiveWait(min_interval=0.01, max_interval=0.05)
+    delays = strategy.delays('job')
+
+    assert _take(delays, 4) == [0.01, 0.02, 0.04, 0.05]
+
+    strategy.record_hold('job', 0.06)
+    assert _take(delays, 1) == [0.03]
+    assert _take(strategy.delays('other'), 1) == [0.01]
+
+
+def test_adaptive_wait_averages_and_clamps_hold_times(upper_bound: None) -> None:
+    strategy = AdaptiveWait(min_interval=0.01, max_interval=1, fraction=0.5, smoothing=0.5)
+
+    strategy.record_hold('job', 0.2)
+    strategy.record_hold('job', 0.6)
+    assert strategy.average_hold('job') == pytest.approx(0.4)
+    assert _take(strategy.delays('job'), 1) == [0.2]
+
+    strategy.record_hold('fast', 0)
+    strategy.record_hold('slow', 10)
+    assert _take(strategy.delays('fast'), 1) == [0.01]
+    assert _take(strategy.delays('slow'), 1) == [1]
+
+
+def test_adaptive_wait_scales_with_the_waiters_of_the_name(upper_bound: None) -> None:
+    strategy = AdaptiveWait(fraction=0.5)
+    strategy.record_hold('job', 0.04)
+    first, second = strategy.delays('job'), strategy.delays('job')
+
+    assert _take(first, 1) == [0.02]
+    assert _take(second, 1) == [0.04]
+    assert strategy.waiters('job') == 2
+
+    first.close()
+    assert _take(second, 1) == [0.02]
+    second.close()
+    assert strategy.waiters('job') == 0
+    assert strategy._waiters == {}
+
+
+def test_adaptive_wait_forgets_the_oldest_names() -> None:
+    strategy = AdaptiveWait(max_keys=2)
+
+    for name in ('first', 'second', 'first', 'third'):
+        strategy.record_hold(name, 0.1)
+
+    assert strategy.average_hold('second') is None
+    assert list(strategy._holds) == ['first', 'third']
+
+
+@pytest.mark.parametrize(
+    'factory,match',
+    [
+        (lambda: FixedWait(-1), 'interval'),
+        (lambda: ExponentialJitterWait(base=0), 'base'),
+        (lambda: ExponentialJitterWait(base=1, cap=0.5), 'cap'),
+        (lambda: DecorrelatedJitterWait(base=0), 'base'),
+        (lambda: AdaptiveWait(min_interval=0), 'min_interval'),
+        (lambda: AdaptiveWait(min_interval=1, max_interval=0.5), 'max_interval'),
+        (lambda: AdaptiveWait(fraction=0), 'fraction'),
+        (lambda: AdaptiveWait(smoothing=2), 'smoothing'),
+        (lambda: AdaptiveWait(max_keys=0), 'max_keys'),
+    ],
+)
+def test_wait_strategies_validate_arguments(factory: Any, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        factory()
+
+
+def test_lock_wait_strategy_defaults_to_the_poll_interval() -> None:
+    strategy = init_cachify(lock_poll_interval=0.3, is_global=False)._client.lock_wait_strategy
+
+    assert isinstance(strategy, FixedWait)
+    assert strategy.interval == 0.3
+
+
+def test_waiting_lock_uses_the_client_wait_strategy_and_records_holds() -> None:
+    strategy = _RecordingWait()
+    instance = init_cachify(lock_wait_strategy=strategy, is_global=False)
+    acquired = threading.Event()
+
+    def hold() -> None:
+        with instance.lock(key='job'):
+            _ = acquired.set()
+            time.sleep(0.1)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    _ = acquired.wait()
+    with instance.lock(key='job', nowait=False, timeout=3):
+        pass
+    holder.join()
+
+    assert 'job' in strategy.waiting
+    assert [name for name, _ in strategy.holds] == ['job', 'job']
+    assert strategy.holds[0][1] >= 0.1
+
+
+async def test_lock_wait_strategy_overrides_the_client_one() -> None:
+    default, override = _RecordingWait(), _RecordingWait()
+    instance = init_cachify(lock_wait_strategy=default, is_global=False)
+
+    async with instance.lock(key='job'):
+        waiter = asyncio.ensure_future(
+            instance.lock(key='job', nowait=False, timeout=3, wait_strategy=override).__aenter__()
+        )
+        await asyncio.sleep(0.05)
+    _ = await waiter
+
+    assert override.waiting == ['job']
+    assert default.waiting == []
+    assert [name for name, _ in default.holds] == ['job']
+
+
+async def test_timed_out_waiters_stop_counting_right_away() -> None:
+    strategy = AdaptiveWait(min_interval=0.01, max_interval=0.01)
+    instance = init_cachify(lock_wait_strategy=strategy, is_global=False)
+
+    async with instance.lock(key='job'):
+        # the tracebacks kept by pytest.raises hold the acquire frames (and their delays) alive
+        with pytest.raises(CachifyLockError):
+            with instance.lock(key='job', nowait=False, timeout=0.05):
+                pass
+        with pytest.raises(CachifyLockError):
+            await instance.lock(key='job', nowait=False, timeout=0.05).__aenter__()
+
+        assert strategy.waiters('job') == 0
+
+
+def test_release_without_acquire_records_no_hold() -> None:
+    strategy = _RecordingWait()
+    instance = init_cachify(lock_wait_strategy=strategy, is_global=False)
+
+    instance.lock(key='job').release()
+
+    assert strategy.holds == []
+
+
+async def test_decorated_locks_pass_the_wait_strategy(init_cachify_fixture: None) -> None:
+    strategy = _RecordingWait()
+
+    @lock(key='sync-{x}', wait_strategy=strategy)
+    def sync_job(x: int) -> int:
+        return x
+
+    @lock(key='async-{x}', wait_strategy=strategy)
+    async def async_job(x: int) -> int:
+        return x
+
+    assert sync_job(1) == 1
+    assert await async_job(2) == 2
+    assert [name for name, _ in strategy.holds] == ['sync-1-lock', 'async-2-lock']
+
+
+async def test_pool_meta_lock_uses_the_wait_strategy(init_cachify_fixture: None) -> None:
+    strategy = _RecordingWait()
+    instance = init_cachify(is_global=False)
+
+    @pooled(key='pool-{x}', max_size=1, lock_wait_strategy=strategy)
+    def sync_task(x: int) -> int:
+        return x
+
+    @instance.pooled(key='apool', max_size=1, lock_wait_strategy=strategy)
+    async def async_task() -> int:
+        return 1
+
+    assert sync_task(1) == 1
+    assert await async_task() == 1
+    with pool(key='direct', max_size=1, lock_wait_strategy=strategy):
+        pass
+    bound = instance.pool(key='bound', max_size=1, lock_wait_strategy=strategy)
+    assert await bound.pooled()(async_task)() == 1
+
+    assert {name for name, _ in strategy.holds} == {'pool-1-pool-lock', 'apool-pool-lock', 'direct-lock', 'bound-lock'}